@@ -18,6 +18,9 @@ setuptools.setup(
     install_requires=[
         "pynput",
     ],
+    extras_require={
+        "numpy": ["numpy"],
+    },
     package_dir={"": "src"},
     packages=setuptools.find_packages(where="src"),
     url="https://github.com/pilatmartin/ib110hw",
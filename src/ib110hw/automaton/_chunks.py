@@ -0,0 +1,144 @@
+from codecs import getincrementaldecoder, lookup
+from mmap import ACCESS_READ, mmap
+from multiprocessing import Pool
+from os import cpu_count, path as os_path
+from typing import Dict, List, Optional, Tuple
+
+# number of bytes decoded at once by a worker
+BLOCK_SIZE = 1 << 20
+
+Rows = List[Dict[str, int]]
+Groups = Dict[int, List[int]]
+
+# configuration of the current worker process, set by '_init_worker'
+_rows: Optional[Rows] = None
+_path: Optional[str] = None
+_encoding: Optional[str] = None
+
+
+def _init_worker(rows: Rows, path: str, encoding: str) -> None:
+    global _rows, _path, _encoding
+    _rows = rows
+    _path = path
+    _encoding = encoding
+
+
+def _run(groups: Groups, text: str) -> Groups:
+    """
+    Reads the text from every current state, 'groups' maps current states to the states
+    in which the runs started. Runs are merged after pieces of doubling length,
+    so runs which meet early are followed only once for the rest of the text.
+    """
+    rows = _rows
+    sink = len(rows) - 1
+    start = 0
+    length = 64
+
+    while start < len(text):
+        piece = text[start : start + length]
+        merged: Groups = {}
+
+        for state, origins in groups.items():
+            for char in piece:
+                state = rows[state].get(char, sink)
+
+                if state == sink:
+                    break
+
+            existing = merged.get(state)
+
+            if existing is None:
+                merged[state] = origins
+            elif len(existing) >= len(origins):
+                existing.extend(origins)
+            else:
+                origins.extend(existing)
+                merged[state] = origins
+
+        groups = merged
+        start += length
+        length *= 2
+
+    return groups
+
+
+def _map_chunk(task: Tuple[int, int, Optional[List[int]]]) -> Dict[int, int]:
+    """
+    Returns the mapping of states to the states reached after reading the bytes [start, end)
+    of the file. The runs start in 'origins', or in every state if it is None.
+    """
+    start, end, origins = task
+    origins = origins if origins is not None else list(range(len(_rows)))
+    groups: Groups = {origin: [origin] for origin in origins}
+    decoder = getincrementaldecoder(_encoding)()
+
+    with open(_path, "rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+        view = memoryview(data)
+
+        try:
+            for block_start in range(start, end, BLOCK_SIZE):
+                block_end = min(block_start + BLOCK_SIZE, end)
+                text = decoder.decode(view[block_start:block_end], final=block_end == end)
+                groups = _run(groups, text)
+        finally:
+            view.release()
+
+    return {origin: state for state, group in groups.items() for origin in group}
+
+
+def _get_chunk_bounds(path: str, count: int, encoding: str) -> List[Tuple[int, int]]:
+    """
+    Splits the file into at most 'count' parts, the parts start at character boundaries.
+    Only UTF-8 files are split, files in other encodings are read as a whole.
+    """
+    size = os_path.getsize(path)
+
+    if lookup(encoding).name != "utf-8" or count == 1:
+        return [(0, size)]
+
+    bounds = [0]
+    with open(path, "rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+        for part in range(1, count):
+            position = max(size * part // count, bounds[-1])
+
+            # continuation bytes of UTF-8 look like 0b10xxxxxx
+            while position < size and data[position] & 0xC0 == 0x80:
+                position += 1
+
+            bounds.append(position)
+
+    bounds.append(size)
+
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def run_file(rows: Rows, path: str, workers: Optional[int], encoding: str) -> int:
+    """
+    Returns the state reached from the state 0 after reading the content of the file.
+    'rows' maps characters to the next states, missing characters lead to the last state (sink).
+    The chunks of the file are read in parallel, then their mappings are composed in order.
+    """
+    if os_path.getsize(path) == 0:
+        return 0
+
+    workers = workers or cpu_count() or 1
+    bounds = _get_chunk_bounds(path, workers, encoding)
+    # only the first chunk is known to start in the initial state
+    tasks = [(start, end, [0] if i == 0 else None) for i, (start, end) in enumerate(bounds)]
+
+    if len(tasks) == 1:
+        _init_worker(rows, path, encoding)
+        mappings = list(map(_map_chunk, tasks))
+    else:
+        with Pool(len(tasks), initializer=_init_worker, initargs=(rows, path, encoding)) as pool:
+            mappings = pool.map(_map_chunk, tasks)
+
+    state = 0
+    for mapping in mappings:
+        state = mapping[state]
+
+    return state
+
+
+if __name__ == "__main__":
+    pass
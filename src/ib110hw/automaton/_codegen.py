@@ -0,0 +1,90 @@
+from typing import Dict, List, Set
+
+SOURCE_TEMPLATE = '''\
+# generated by DFA.to_function, {state_count} states, {class_count} classes of symbols
+
+
+class _Classes(dict):
+    # characters outside of the alphabet lead to the dead state
+    def __missing__(self, code):
+        return {unknown!r}
+
+
+_CLASSES = _Classes({classes!r})
+_DELTA = {delta!r}
+_FINALS = {finals!r}
+
+
+def accepts(input_string, _classes=_CLASSES, _delta=_DELTA, _finals=_FINALS, _ord=ord):
+    state = {initial}
+
+    for symbol in input_string.translate(_classes):
+        state = _delta[state + _ord(symbol)]
+
+        if state == {dead}:
+            return False
+
+    return state in _finals
+'''
+
+
+def get_function_source(
+    classes: List[Set[str]], table: List[List[int]], finals: Set[int]
+) -> str:
+    """
+    Returns the source of the function 'accepts' simulating the DFA given by its total
+    transition table over the classes of symbols, the initial state has the index 0.
+
+    Every character is translated to the character with the code of its class, so that
+    the next state is found in a flat tuple at the index 'state + class'. States are
+    stored multiplied by the row width, states from which no final state is reachable
+    are merged into one dead state which stops the simulation.
+    """
+    width = len(classes) + 1
+    unknown = len(classes)
+
+    # states from which a final state is reachable
+    previous: Dict[int, Set[int]] = {}
+    for state, row in enumerate(table):
+        for next_state in row:
+            previous.setdefault(next_state, set()).add(state)
+
+    alive = set(finals)
+    stack = list(alive)
+    while stack:
+        for state in previous.get(stack.pop(), ()):
+            if state not in alive:
+                alive.add(state)
+                stack.append(state)
+
+    dead = len(table) * width
+
+    def get_offset(state: int) -> int:
+        return state * width if state in alive else dead
+
+    delta = []
+    for state, row in enumerate(table):
+        delta.extend(get_offset(next_state) for next_state in row)
+        delta.append(dead)
+
+    delta.extend([dead] * width)
+
+    return SOURCE_TEMPLATE.format(
+        state_count=len(table),
+        class_count=len(classes),
+        unknown=chr(unknown),
+        classes={
+            ord(symbol): chr(code)
+            for code, symbol_class in enumerate(classes)
+            for symbol in symbol_class
+            if len(symbol) == 1
+        },
+        delta=tuple(delta),
+        finals=frozenset(get_offset(state) for state in finals),
+        initial=get_offset(0),
+        dead=dead,
+    )
+
+
+if __name__ == "__main__":
+    pass
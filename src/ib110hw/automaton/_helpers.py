@@ -0,0 +1,121 @@
+import gc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Set, Tuple
+
+Configuration = FrozenSet[Hashable]
+
+
+def get_closure(
+    states: Iterable[Hashable], get_next: Callable[[Hashable], Iterable[Hashable]]
+) -> Set[Hashable]:
+    """
+    Returns the states together with all states reachable from them using 'get_next'.
+    """
+    closure = set(states)
+    stack = list(closure)
+
+    while stack:
+        for next_state in get_next(stack.pop()):
+            if next_state not in closure:
+                closure.add(next_state)
+                stack.append(next_state)
+
+    return closure
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    Pauses the cyclic garbage collector, which would otherwise repeatedly scan
+    all objects while millions of dicts and sets are being created.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def get_edge_lists(
+    sources: Iterable[Any], symbols: Iterable[Any], targets: Iterable[Any]
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Converts parallel sequences (or NumPy arrays) of edges to lists of strings.
+    Arrays are converted at once, NumPy does not have to be installed for other sequences.
+    """
+
+    def to_list(values: Iterable[Any]) -> List[str]:
+        if hasattr(values, "astype"):
+            return values.astype(str).tolist()
+
+        return list(map(str, values))
+
+    lists = to_list(sources), to_list(symbols), to_list(targets)
+
+    if not len(lists[0]) == len(lists[1]) == len(lists[2]):
+        raise ValueError("Sources, symbols and targets need to have the same length.")
+
+    return lists
+
+
+class LazyDFA:
+    """
+    Subset construction computed on demand while reading the input.
+    Only configurations (sets of states) which are actually reached are created and every
+    computed transition is cached, so each (configuration, symbol) pair is computed once.
+
+    If 'restart' is set, the initial states are added to every configuration,
+    i.e. the automaton accepts Σ*·L instead of L (a match can start anywhere).
+    """
+
+    def __init__(
+        self,
+        initial_states: Iterable[Hashable],
+        final_states: Set[Hashable],
+        get_next: Callable[[Hashable, str], Iterable[Hashable]],
+        restart: bool = False,
+    ) -> None:
+        self.final_states = final_states
+        self.get_next = get_next
+        self.start: Configuration = self.get_closure(initial_states)
+        self.restart = restart
+        self._transitions: Dict[Tuple[Configuration, str], Configuration] = {}
+        self._finals: Dict[Configuration, bool] = {}
+
+    def get_closure(self, states: Iterable[Hashable]) -> Configuration:
+        return frozenset(get_closure(states, lambda state: self.get_next(state, "")))
+
+    def next(self, configuration: Configuration, symbol: str) -> Configuration:
+        """Returns the configuration after reading the symbol."""
+        key = (configuration, symbol)
+        result = self._transitions.get(key)
+
+        if result is None:
+            result = self.get_closure(
+                {s for state in configuration for s in self.get_next(state, symbol)}
+            )
+
+            if self.restart:
+                result |= self.start
+
+            self._transitions[key] = result
+
+        return result
+
+    def is_final(self, configuration: Configuration) -> bool:
+        """Checks whether the configuration contains a final state."""
+        result = self._finals.get(configuration)
+
+        if result is None:
+            result = self._finals[configuration] = not configuration.isdisjoint(
+                self.final_states
+            )
+
+        return result
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,130 @@
+from typing import Dict, Iterable, List
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, it is needed only by DFABank
+    numpy = None
+
+from .dfa import DFA
+
+
+class DFABank:
+    """
+    Many DFAs checking the same words at once, e.g. hundreds of submissions in grading.
+
+    The transition tables of all automata are stacked into one NumPy table over a shared
+    encoding of symbols, the states of the i-th automaton follow the states of the previous
+    ones. The current states of all automata form one vector, which is advanced by a single
+    lookup per symbol. Missing transitions and symbols outside of the alphabet of
+    an automaton lead to a shared rejecting sink state.
+
+    Example:
+        bank = DFABank(submissions)
+        bank.accepts("abba")  # [True, False, ...], one result per automaton
+        bank.accepts_many(["", "ab"])  # [[...], [...]], one list per word
+    """
+
+    def __init__(self, automata: Iterable[DFA]) -> None:
+        """
+        Args:
+            automata (Iterable[DFA]): Automata to be stacked, their order is kept in the results.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError(
+                "DFABank requires NumPy, install it by 'pip install ib110hw[numpy]'."
+            )
+
+        self.automata: List[DFA] = list(automata)
+        symbols = sorted(
+            set().union(*(automaton.get_used_symbols() for automaton in self.automata))
+        )
+        self._code_of: Dict[str, int] = {symbol: code for code, symbol in enumerate(symbols)}
+        # codes after the symbols: unknown symbol (to the sink), end of a shorter word (no move)
+        self._unknown, self._padding = len(symbols), len(symbols) + 1
+
+        tables = []
+        initials = []
+        finals = []
+        offset = 0
+
+        for automaton in self.automata:
+            assert automaton.initial_state in automaton.states, "DFA needs an initial state."
+            table, automaton_finals = automaton._get_reachable_table(symbols)
+
+            tables.append(
+                numpy.array(table, dtype=numpy.int32).reshape(len(table), len(symbols)) + offset
+            )
+            initials.append(offset)
+            finals.extend(offset + state for state in automaton_finals)
+            offset += len(table)
+
+        sink = offset
+        delta = numpy.full((sink + 1, len(symbols) + 2), sink, dtype=numpy.int32)
+
+        if tables:
+            delta[:sink, : len(symbols)] = numpy.concatenate(tables)
+
+        delta[:, self._padding] = numpy.arange(sink + 1)
+
+        self._delta = delta
+        self._initials = numpy.array(initials, dtype=numpy.int32)
+        self._finals = numpy.zeros(sink + 1, dtype=bool)
+        self._finals[finals] = True
+
+    def __len__(self) -> int:
+        return len(self.automata)
+
+    def accepts(self, input_string: str) -> List[bool]:
+        """
+        Checks the string against all automata at once.
+
+        Args:
+            input_string (str): Input string to be tested.
+
+        Returns:
+            List[bool]: True for every automaton accepting the string, in the order of the automata.
+        """
+        current = self._initials
+
+        for symbol in input_string:
+            current = self._delta[current, self._code_of.get(symbol, self._unknown)]
+
+        return self._finals[current].tolist()
+
+    def accepts_many(self, input_strings: Iterable[str]) -> List[List[bool]]:
+        """
+        Checks all strings against all automata at once, the strings are read in parallel
+        symbol by symbol (shorter strings are padded by a symbol which keeps the states).
+
+        Args:
+            input_strings (Iterable[str]): Input strings to be tested.
+
+        Returns:
+            List[List[bool]]: Results of 'accepts' for every string (in the order of the strings).
+        """
+        input_strings = list(input_strings)
+
+        if not input_strings:
+            return []
+
+        codes = numpy.full(
+            (len(input_strings), max(map(len, input_strings))), self._padding, dtype=numpy.int32
+        )
+        for row, input_string in enumerate(input_strings):
+            codes[row, : len(input_string)] = [
+                self._code_of.get(symbol, self._unknown) for symbol in input_string
+            ]
+
+        current = numpy.tile(self._initials, (len(input_strings), 1))
+
+        for column in codes.T:
+            current = self._delta[current, column[:, None]]
+
+        return self._finals[current].tolist()
+
+
+if __name__ == "__main__":
+    pass
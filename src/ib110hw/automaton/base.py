@@ -1,11 +1,40 @@
-from typing import Set
+from abc import ABCMeta, abstractmethod
+from io import StringIO
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+)
 
+from ._helpers import Configuration, LazyDFA
+from .budget import get_size
 
-class BaseFiniteAutomaton:
+# assigning any of these attributes drops the cached results (see 'invalidate')
+TRACKED_ATTRIBUTES = {"states", "alphabet", "initial_state", "final_states", "transitions"}
+
+
+class BaseFiniteAutomaton(metaclass=ABCMeta):
     """
     Represents an abstract Finite Automaton class. This class cannot be instantiated.
     """
 
+    # the default representation shows at most this many rows/columns of the transition table
+    REPR_MAX_ROWS = 50
+    REPR_MAX_COLUMNS = 20
+
+    # title shown in the top-left corner of the transition table
+    _table_title = ""
+
     def __new__(cls, *args, **kwargs):
         if cls is BaseFiniteAutomaton:
             raise TypeError("Only NFA and DFA can be instantiated!")
@@ -19,16 +48,68 @@ class BaseFiniteAutomaton:
         initial_state: str = None,
         final_states: Set[str] = None,
     ) -> None:
+        # results of derived operations, dropped whenever the automaton changes
+        self._cache: Dict[str, Tuple[Any, Optional[int]]] = {}
+        self._version = 0
+
         self.states = states if states is not None else set()
         self.alphabet = alphabet if alphabet is not None else set()
         self.initial_state = initial_state
         self.final_states = final_states if final_states is not None else set()
 
+    @classmethod
+    def _from_edge_lists(
+        cls,
+        sources: List[str],
+        symbols: List[str],
+        targets: List[str],
+        transitions: Dict[str, Any],
+        initial_state: Optional[str],
+        final_states: Optional[Set[str]],
+        states: Optional[Set[str]],
+        alphabet: Optional[Set[str]],
+    ) -> "BaseFiniteAutomaton":
+        """Checks the edges against 'states' and 'alphabet' at once and creates the automaton."""
+        used_states = set(sources).union(targets)
+        used_symbols = set(symbols)
+        final_states = set(final_states) if final_states is not None else set()
+
+        if states is None:
+            states = used_states | final_states
+            if initial_state is not None:
+                states.add(initial_state)
+        elif not used_states <= states:
+            raise ValueError(f"Unknown states: {sorted(used_states - states)}.")
+
+        if alphabet is None:
+            alphabet = used_symbols
+        elif not used_symbols <= alphabet:
+            raise ValueError(f"Unknown symbols: {sorted(used_symbols - alphabet)}.")
+
+        return cls(
+            states=set(states),
+            alphabet=set(alphabet),
+            initial_state=initial_state,
+            final_states=final_states,
+            transitions=transitions,
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        if name in TRACKED_ATTRIBUTES:
+            self.invalidate()
+
     def __repr__(self) -> str:
-        alphabet_str = f"alphabet: {','.join(sorted(self.alphabet))}"
-        states_str = f"states: {','.join(sorted(self.states))}"
+        def join(symbols: List[str], limit: int) -> str:
+            rest = f",... ({len(symbols) - limit} more)" if len(symbols) > limit else ""
+            return ",".join(symbols[:limit]) + rest
+
+        sorted_finals = sorted(self.final_states)
+        alphabet_str = f"alphabet: {join(self._get_sorted_alphabet(), self.REPR_MAX_COLUMNS)}"
+        states_str = f"states: {join(self._get_sorted_states(), self.REPR_MAX_ROWS)}"
         initial_str = f"initial state: {self.initial_state}"
-        final_states_str = f"final states: {','.join(sorted(self.final_states))}"
+        final_states_str = f"final states: {join(sorted_finals, self.REPR_MAX_ROWS)}"
 
         return f"{alphabet_str}\n{states_str}\n{initial_str}\n{final_states_str}\n"
 
@@ -38,6 +119,350 @@ class BaseFiniteAutomaton:
 
         return "<-- " if state in self.final_states else "    "
 
+    def __repr_transitions__(self) -> str:
+        stream = StringIO()
+        self.write_transitions(
+            stream,
+            stop=self.REPR_MAX_ROWS,
+            symbols=self._get_sorted_alphabet()[: self.REPR_MAX_COLUMNS],
+        )
+
+        hidden_rows = len(self.states) - self.REPR_MAX_ROWS
+        hidden_columns = len(self.alphabet) - self.REPR_MAX_COLUMNS
+        if hidden_rows > 0 or hidden_columns > 0:
+            stream.write(
+                f"... ({max(hidden_rows, 0)} more states, {max(hidden_columns, 0)} more symbols,"
+                " use 'write_transitions' to show them)\n"
+            )
+
+        return stream.getvalue()
+
+    def _format_symbol(self, symbol: str) -> str:
+        """Returns the symbol as shown in the header of the transition table."""
+        return symbol
+
+    @abstractmethod
+    def _format_cell(self, state: str, symbol: str) -> str:
+        """Returns the content of the transition table cell."""
+
+    def write_transitions(
+        self,
+        stream: TextIO,
+        start: int = 0,
+        stop: Optional[int] = None,
+        symbols: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Writes the transition table to the stream row by row.
+        Rows are ordered by the state names, only the rows in range [start, stop) are written.
+        The cost depends only on the size of the written part of the table.
+
+        Args:
+            stream (TextIO): Text stream, e.g. sys.stdout or an opened file.
+            start (int, optional): Index of the first written row. Defaults to 0.
+            stop (int, optional): Index after the last written row. Defaults to all rows.
+            symbols (Iterable[str], optional): Columns to be written.
+                Defaults to the whole alphabet.
+        """
+        states = self._get_sorted_states()[start:stop]
+        symbols = self._get_sorted_alphabet() if symbols is None else sorted(symbols)
+        labels = [self._format_symbol(symbol) for symbol in symbols]
+
+        # the first pass only measures the cells, nothing has to be kept in memory
+        cell_width = max(
+            [5]
+            + [len(label) for label in labels]
+            + [len(state or "empty") for state in states]
+            + [len(self._format_cell(s, symbol)) for s in states for symbol in symbols]
+        )
+        # add 4 for spaces on both sides
+        cell_width += 4
+
+        header = f"{self._table_title: ^{cell_width + 5}}" + "".join(
+            f"|{label: ^{cell_width}}" for label in labels
+        )
+        stream.write(f"{header}\n{'-' * len(header)}\n")
+
+        for state in states:
+            row_prefix = self.__repr_row_prefix__(state)
+            cells = "".join(
+                f"|{self._format_cell(state, symbol): ^{cell_width}}" for symbol in symbols
+            )
+            stream.write(f"{row_prefix: ^5}{state or 'empty': <{cell_width}}{cells}\n")
+
+    def invalidate(self) -> None:
+        """
+        Drops the cached results of derived operations (e.g. 'minimize' or 'trim').
+        The methods changing the automaton and assigning its attributes call it automatically,
+        changes made directly to the sets or the transitions need to call it explicitly,
+        e.g. after 'automaton.transitions[state][symbol] = ...'.
+        """
+        self._cache.clear()
+        self._version += 1
+
+    def _get_cached(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the result cached under the name, it is computed again after the automaton
+        changes. A cached automaton changed by the caller is computed again as well.
+        """
+        entry = self._cache.get(name)
+
+        if entry is None or entry[1] != getattr(entry[0], "_version", None):
+            result = compute()
+            entry = self._cache[name] = (result, getattr(result, "_version", None))
+
+        return entry[0]
+
+    def _get_sorted_states(self) -> List[str]:
+        return self._get_cached("sorted_states", lambda: sorted(self.states))
+
+    def _get_sorted_alphabet(self) -> List[str]:
+        return self._get_cached("sorted_alphabet", lambda: sorted(self.alphabet))
+
+    def _iter_transitions(self) -> Iterator[Tuple[str, str, str]]:
+        """Yields every transition as a (state_from, symbol, state_to) triple."""
+        for state in list(self.transitions):
+            yield from self._iter_transitions_from(state)
+
+    @abstractmethod
+    def _iter_transitions_from(self, state: str) -> Iterator[Tuple[str, str, str]]:
+        """Yields transitions starting in the state as (state_from, symbol, state_to) triples."""
+
+    @abstractmethod
+    def _restrict_rules(self, rules: Dict[str, Any], states: Set[str]) -> Dict[str, Any]:
+        """Returns a copy of the rules of one state without transitions leading out of 'states'."""
+
+    def _accepts_sorted(
+        self,
+        input_strings: Iterable[str],
+        start: Any,
+        step: Callable[[Any, str], Any],
+        is_final: Callable[[Any], bool],
+    ) -> List[bool]:
+        """
+        Runs the automaton over the strings in sorted order, so that the configurations
+        reached by the common prefix of neighbouring strings are computed only once.
+        'step' returns the next configuration, an empty one (e.g. None) means rejection.
+
+        Returns:
+            List[bool]: Results in the original order of the strings.
+        """
+        words = list(input_strings)
+        results = [False] * len(words)
+        previous = ""
+        # configurations reached after reading the prefixes of 'previous', shorter if it got stuck
+        stack = [start]
+
+        for index in sorted(range(len(words)), key=words.__getitem__):
+            word = words[index]
+            common = _get_common_prefix_length(word, previous, len(stack) - 1)
+            del stack[common + 1 :]
+
+            while len(stack) <= len(word):
+                configuration = step(stack[-1], word[len(stack) - 1])
+
+                if not configuration:
+                    break
+
+                stack.append(configuration)
+
+            results[index] = len(stack) == len(word) + 1 and is_final(stack[-1])
+            previous = word
+
+        return results
+
+    @abstractmethod
+    def _get_next_states(self, state: str, symbol: str) -> Iterable[str]:
+        """Returns the states reachable from the state by reading the symbol ('' for ε)."""
+
+    def _get_reversed_step(self) -> Callable[[str, str], Iterable[str]]:
+        """Returns a function giving the states from which the state is reached by the symbol."""
+        reverse: Dict[Tuple[str, str], List[str]] = {}
+        for state_from, symbol, state_to in self._iter_transitions():
+            reverse.setdefault((state_to, symbol), []).append(state_from)
+
+        return lambda state, symbol: reverse.get((state, symbol), ())
+
+    def search(self, text: str) -> Optional[Tuple[int, int]]:
+        """
+        Finds the first substring of the text which is accepted by the automaton.
+        See 'finditer' for how the matches are chosen.
+
+        Args:
+            text (str): Text to be searched.
+
+        Returns:
+            Optional[Tuple[int, int]]: (start, end) span of the match, None if there is none.
+        """
+        return next(self.finditer(text), None)
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yields spans of non-overlapping substrings of the text which are accepted by the automaton,
+        the matches are leftmost-longest: a match starts at the leftmost position where any
+        accepted substring starts and it is the longest accepted substring from there.
+        The next match is searched after the end of the previous one (one symbol later
+        for an empty match).
+
+        One backward scan of the text by the reversed automaton finds all positions where
+        a match starts, every match is then extended by a forward scan. The automaton is trimmed
+        first, so the forward scan stops as soon as no longer match is possible, and the
+        configurations from which a scan found no match are remembered, so the later scans stop
+        there as well. Every (configuration, position) pair is thus scanned at most once and
+        the subsets of states are determinized lazily, so the time is linear in the length
+        of the text.
+
+        Args:
+            text (str): Text to be searched.
+
+        Yields:
+            Tuple[int, int]: (start, end) span of a match, i.e. 'text[start:end]' is accepted.
+
+        Example:
+            list(automaton.finditer("xabx")) # [(1, 3)] for an automaton accepting 'ab'
+        """
+        assert self.initial_state in self.states, "Automaton needs a valid initial state."
+
+        # without useless states, the configurations of the scans get empty at dead ends
+        automaton = self.trim()
+        initial_states = {automaton.initial_state}
+        anchored = LazyDFA(initial_states, automaton.final_states, automaton._get_next_states)
+        # accepts the reversed texts which end by a reversed match, i.e. some match starts there
+        backward = LazyDFA(
+            automaton.final_states, initial_states, automaton._get_reversed_step(), True
+        )
+
+        starts = bytearray(len(text) + 1)
+        configuration = backward.start
+        starts[len(text)] = backward.is_final(configuration)
+
+        for index in range(len(text) - 1, -1, -1):
+            configuration = backward.next(configuration, text[index])
+            starts[index] = backward.is_final(configuration)
+
+        # position -> configurations of the forward scan from which no match can be extended
+        failed: Dict[int, Set[Configuration]] = {}
+        position = starts.find(1)
+
+        while position != -1:
+            # forward scan from the leftmost start for the longest match
+            start = end = index = position
+            configuration = anchored.start
+            visited: List[Tuple[Configuration, int]] = []
+
+            while configuration and index < len(text):
+                if configuration in failed.get(index, ()):
+                    break
+
+                visited.append((configuration, index))
+                configuration = anchored.next(configuration, text[index])
+                index += 1
+
+                if anchored.is_final(configuration):
+                    end = index
+                    visited.clear()
+
+            yield start, end
+
+            for failed_configuration, failed_position in visited:
+                failed.setdefault(failed_position, set()).add(failed_configuration)
+
+            position = end if end > start else end + 1
+            position = starts.find(1, position) if position <= len(text) else -1
+
+            # the next scans start at 'position', the configurations before it are not needed
+            for skipped in range(start, position if position != -1 else len(text) + 1):
+                failed.pop(skipped, None)
+
+    def get_memory_usage(self) -> Dict[str, int]:
+        """
+        Returns the approximate memory footprint (B) of the parts of the automaton:
+        'states', 'alphabet', 'final_states', 'transitions', 'cache' (cached results of derived
+        operations, e.g. the minimal DFA) and their 'total'. Objects shared by more parts
+        (e.g. names of states) are counted only in the first of them.
+
+        Returns:
+            Dict[str, int]: Sizes of the parts in bytes.
+        """
+        seen = {id(self)}
+        usage = {
+            name: get_size(getattr(self, name), seen)
+            for name in ("states", "alphabet", "final_states", "transitions")
+        }
+        usage["cache"] = get_size(self._cache, seen)
+        usage["total"] = sum(usage.values())
+
+        return usage
+
+    def get_symbol_classes(self) -> List[Set[str]]:
+        """
+        Splits the alphabet into classes of symbols which behave identically in every state,
+        i.e. lead from each state to the same next states. ε ('') is not included.
+
+        Returns:
+            List[Set[str]]: Disjoint classes of symbols ordered by their smallest symbol.
+        """
+        return self._get_cached("symbol_classes", self._get_symbol_classes)
+
+    def _get_symbol_classes(self) -> List[Set[str]]:
+        signatures: Dict[str, List[Tuple[str, str]]] = {s: [] for s in self.alphabet}
+        for state_from, symbol, state_to in self._iter_transitions():
+            signatures.setdefault(symbol, []).append((state_from, state_to))
+
+        signatures.pop("", None)
+        classes: Dict[FrozenSet[Tuple[str, str]], Set[str]] = {}
+        for symbol, signature in signatures.items():
+            classes.setdefault(frozenset(signature), set()).add(symbol)
+
+        return sorted(classes.values(), key=min)
+
+    def trim(self) -> "BaseFiniteAutomaton":
+        """
+        Creates an equivalent automaton without useless states, i.e. states unreachable
+        from the initial state and states from which no final state can be reached.
+        The initial state is always kept. The result is cached until the automaton changes.
+
+        Returns:
+            BaseFiniteAutomaton: New automaton of the same type (a trimmed DFA may be partial).
+        """
+        return self._get_cached("trim", self._trim)
+
+    def _trim(self) -> "BaseFiniteAutomaton":
+        reverse: Dict[str, List[str]] = {}
+        for state_from, _, state_to in self._iter_transitions():
+            reverse.setdefault(state_to, []).append(state_from)
+
+        def traverse(start: Iterable[str], get_next: Callable[[str], Iterable[str]]):
+            visited = set(start)
+            stack = list(visited)
+
+            while stack:
+                for next_state in get_next(stack.pop()):
+                    if next_state not in visited:
+                        visited.add(next_state)
+                        stack.append(next_state)
+
+            return visited
+
+        reachable = traverse(
+            {self.initial_state} & self.states,
+            lambda s: (t for _, _, t in self._iter_transitions_from(s)),
+        )
+        useful = traverse(self.final_states & reachable, lambda s: reverse.get(s, ()))
+        useful &= reachable
+
+        return type(self)(
+            states=useful | {self.initial_state},
+            alphabet=set(self.alphabet),
+            initial_state=self.initial_state,
+            final_states=self.final_states & useful,
+            transitions={
+                state: self._restrict_rules(self.transitions[state], useful)
+                for state in useful
+                if state in self.transitions
+            },
+        )
+
     def add_state(self, state: str, is_final: bool = False) -> bool:
         if state in self.states:
             return False
@@ -46,6 +471,7 @@ class BaseFiniteAutomaton:
             self.final_states.add(state)
 
         self.states.add(state)
+        self.invalidate()
 
         return True
 
@@ -57,6 +483,7 @@ class BaseFiniteAutomaton:
             self.final_states.remove(state)
 
         self.states.difference_update({state})
+        self.invalidate()
 
         return True
 
@@ -74,5 +501,117 @@ class BaseFiniteAutomaton:
         self.final_states = self.states - self.final_states
 
 
+class FrozenFiniteAutomaton(metaclass=ABCMeta):
+    """
+    Mixin making an automaton immutable and hashable (see 'freeze').
+    States and symbols are stored in frozensets, transitions in read-only mappings.
+    Mutating methods raise TypeError, derived automata and analyses are computed once.
+    Frozen automata are equal if they have the same structure (not only the same language).
+    """
+
+    def _freeze(self) -> None:
+        """Converts the attributes to immutable collections, called at the end of '__init__'."""
+        self.states = frozenset(self.states)
+        self.alphabet = frozenset(self.alphabet)
+        self.final_states = frozenset(self.final_states)
+        self.transitions = MappingProxyType(
+            {state: self._freeze_rules(rules) for state, rules in self.transitions.items()}
+        )
+        self._frozen = True
+
+    def invalidate(self) -> None:
+        """Frozen automata cannot change, so their cached results are kept."""
+
+    @abstractmethod
+    def _freeze_rules(self, rules: Any) -> Any:
+        """Returns read-only rules of one state, frozen rules are shared."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise TypeError(f"{type(self).__name__} cannot be changed.")
+
+        super().__setattr__(name, value)
+
+    def __reduce__(self):
+        transitions = {state: dict(rules) for state, rules in self.transitions.items()}
+        return type(self), (
+            set(self.states),
+            set(self.alphabet),
+            self.initial_state,
+            set(self.final_states),
+            transitions,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self._get_structure() == other._get_structure()
+
+    def __hash__(self) -> int:
+        return hash(self._get_structure())
+
+    def _get_structure(self) -> Hashable:
+        return self._get_cached(
+            "structure",
+            lambda: (
+                self.states,
+                self.alphabet,
+                self.initial_state,
+                self.final_states,
+                frozenset(self._iter_transitions()),
+            ),
+        )
+
+    def _restrict_rules(self, rules: Any, states: Set[str]) -> Any:
+        restricted = super()._restrict_rules(rules, states)
+        return rules if restricted == rules else restricted
+
+    def _raise_immutable(self, *args, **kwargs) -> None:
+        raise TypeError(f"{type(self).__name__} cannot be changed.")
+
+    add_state = remove_state = _raise_immutable
+    add_transition = set_transition = remove_transition = _raise_immutable
+
+    def freeze(self) -> "FrozenFiniteAutomaton":
+        return self
+
+    def is_valid(self) -> bool:
+        return self._get_cached("is_valid", super().is_valid)
+
+    def complement(self) -> "FrozenFiniteAutomaton":
+        """
+        Returns the complement of the automaton, the frozen automaton itself does not change.
+        The rules of the transition function are shared with the original automaton.
+        """
+        return self._get_cached(
+            "complement",
+            lambda: type(self)(
+                states=self.states,
+                alphabet=self.alphabet,
+                initial_state=self.initial_state,
+                final_states=self.states - self.final_states,
+                transitions=self.transitions,
+            ),
+        )
+
+
+def _get_common_prefix_length(first: str, second: str, limit: int) -> int:
+    """Returns the length of the common prefix (at most 'limit'), slices are compared at once."""
+    limit = min(limit, len(first), len(second))
+
+    if first[:limit] == second[:limit]:
+        return limit
+
+    # first[:low] == second[:low] and first[:high] != second[:high]
+    low, high = 0, limit
+    while high - low > 1:
+        middle = (low + high) // 2
+
+        if first[low:middle] == second[low:middle]:
+            low = middle
+        else:
+            high = middle
+
+    return low
+
+
 if __name__ == "__main__":
     pass
@@ -0,0 +1,119 @@
+from collections.abc import Mapping
+from sys import getsizeof
+from time import monotonic
+from types import ModuleType
+from typing import Any, Optional, Set
+
+
+class BudgetExceededError(Exception):
+    """
+    Raised when an operation exceeds a limit of its Budget.
+
+    Attributes:
+        operation (str): Name of the operation, e.g. "determinization".
+        resource (str): The exceeded limit: "states", "memory" or "time".
+        limit (float): Value of the exceeded limit.
+        states (int): Number of states (or pairs of states) created until then.
+        memory (int): Approximate size (B) of the structures built until then.
+    """
+
+    def __init__(
+        self, operation: str, resource: str, limit: float, states: int, memory: int
+    ) -> None:
+        super().__init__(
+            f"The {operation} exceeded its {resource} limit ({limit}) "
+            f"after creating {states} states (about {memory} B)."
+        )
+        self.operation = operation
+        self.resource = resource
+        self.limit = limit
+        self.states = states
+        self.memory = memory
+
+
+class Budget:
+    """
+    Limits of expensive operations (determinization, minimization, the product
+    in 'get_counterexample'), so that an exploding construction stops early instead
+    of exhausting the memory of the machine.
+
+    The memory is the approximate size of the structures built by the operation,
+    the time limit is measured from the creation of the budget (one budget can be shared
+    by a sequence of operations).
+
+    Example:
+        try:
+            dfa = nfa.determinize(budget=Budget(max_states=10_000, max_memory=100 * 2**20))
+        except BudgetExceededError as error:
+            print(error.resource, error.states)
+    """
+
+    def __init__(
+        self,
+        max_states: Optional[int] = None,
+        max_memory: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            max_states (int, optional): Maximal number of created states. Defaults to None.
+            max_memory (int, optional): Maximal size (B) of the built structures. Defaults to None.
+            timeout (float, optional): Time limit (s). Defaults to None.
+        """
+        self.max_states = max_states
+        self.max_memory = max_memory
+        self.timeout = timeout
+        self.deadline = None if timeout is None else monotonic() + timeout
+
+    def check(self, operation: str, states: int, memory: int) -> None:
+        """
+        Checks the progress of the operation.
+
+        Raises:
+            BudgetExceededError: If a limit is exceeded.
+        """
+        if self.max_states is not None and states > self.max_states:
+            raise BudgetExceededError(operation, "states", self.max_states, states, memory)
+
+        if self.max_memory is not None and memory > self.max_memory:
+            raise BudgetExceededError(operation, "memory", self.max_memory, states, memory)
+
+        if self.deadline is not None and monotonic() > self.deadline:
+            raise BudgetExceededError(operation, "time", self.timeout, states, memory)
+
+
+def get_size(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """
+    Returns the approximate size (B) of the object together with the objects it references
+    (items of collections and attributes of instances). Objects whose ids are in 'seen'
+    are skipped, the ids of the counted objects are added to it.
+    """
+    seen = seen if seen is not None else set()
+    stack = [obj]
+    size = 0
+
+    while stack:
+        item = stack.pop()
+
+        if id(item) in seen:
+            continue
+
+        seen.add(id(item))
+        size += getsizeof(item)
+
+        if isinstance(item, (str, bytes, int, float)):
+            continue
+
+        if isinstance(item, Mapping):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__") and not callable(item) and not isinstance(item, ModuleType):
+            stack.append(vars(item))
+
+    return size
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,165 @@
+import pickle
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Union
+
+from .dfa import DFA
+from .nfa import NFA
+
+# returned by 'get' if the key is missing, cached values can be None
+MISSING = object()
+
+
+def make_key(fingerprint: str, operation: str) -> str:
+    """
+    Creates a cache key from an automaton fingerprint and an operation name.
+
+    Args:
+        fingerprint (str): Fingerprint of the automaton (see 'DFA.fingerprint').
+        operation (str): Name of the cached operation, may contain its parameters.
+
+    Returns:
+        str: Cache key.
+    """
+    return f"{fingerprint}:{operation}"
+
+
+class ResultCache(ABC):
+    """
+    Represents an abstract cache of results keyed by automaton fingerprint and operation.
+    Subclasses need to implement 'get' and 'set'. This class cannot be instantiated.
+    """
+
+    @abstractmethod
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        """Returns the value stored under the key, 'default' if it is missing."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Stores the value under the key."""
+
+    def get_or_compute(
+        self,
+        automaton: Union[DFA, NFA],
+        operation: str,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """
+        Returns the cached result of the operation, computes and stores it if it is missing.
+        Language-equivalent automata share the cached results.
+
+        Args:
+            automaton (Union[DFA, NFA]): Automaton the operation is computed for.
+            operation (str): Name of the operation, may contain its parameters.
+            compute (Callable[[], Any]): Computes the result if it is not cached.
+
+        Returns:
+            Any: Result of the operation.
+        """
+        key = make_key(automaton.fingerprint(), operation)
+        result = self.get(key)
+
+        if result is MISSING:
+            result = compute()
+            self.set(key, result)
+
+        return result
+
+
+class MemoryCache(ResultCache):
+    """
+    In-memory cache which discards the least recently used results when full.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 1024) -> None:
+        self.maxsize = maxsize
+        self._results: "OrderedDict[str, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        """
+        Returns the cached value or 'default' if the key is missing.
+        """
+        if key not in self._results:
+            return default
+
+        self._results.move_to_end(key)
+        return self._results[key]
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores the value, the least recently used one is discarded if the cache is full.
+        """
+        self._results[key] = value
+        self._results.move_to_end(key)
+
+        if self.maxsize is not None and len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all cached values."""
+        self._results.clear()
+
+
+class SQLiteCache(ResultCache):
+    """
+    On-disk cache stored in an SQLite database, values are pickled.
+    The cache can be shared by multiple processes, each one opens its own connection.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def __getstate__(self) -> dict:
+        # connections cannot be sent to other processes
+        return {"path": self.path, "_connection": None}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, timeout=30)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB)"
+            )
+
+        return self._connection
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        """
+        Returns the cached value or 'default' if the key is missing.
+        """
+        row = (
+            self._connect()
+            .execute("SELECT value FROM results WHERE key = ?", (key,))
+            .fetchone()
+        )
+
+        return default if row is None else pickle.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores the value, an existing value with the same key is overwritten.
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                (key, pickle.dumps(value)),
+            )
+
+    def clear(self) -> None:
+        """Removes all cached values."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+if __name__ == "__main__":
+    pass
@@ -1,9 +1,32 @@
-from typing import Dict, Optional, Set
-
-from .base import BaseFiniteAutomaton
+from collections import defaultdict, deque
+from hashlib import sha256
+from itertools import count
+from json import dumps
+from sys import getsizeof
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from ._chunks import run_file
+from ._codegen import get_function_source
+from ._helpers import get_edge_lists, paused_gc
+from .base import BaseFiniteAutomaton, FrozenFiniteAutomaton
+from .budget import Budget
 
 DFARules = Dict[str, str]
 DFATransitions = Dict[str, DFARules]
+# (state, position in the word) pairs visited by the edit distance search
+EditNode = Tuple[str, int]
 
 
 class DFA(BaseFiniteAutomaton):
@@ -11,6 +34,8 @@ class DFA(BaseFiniteAutomaton):
     Deterministic Finite Automaton.
     """
 
+    _table_title = "DFA"
+
     def __init__(
         self,
         states: Set[str] = None,
@@ -25,42 +50,75 @@ class DFA(BaseFiniteAutomaton):
         super().__init__(states, alphabet, initial_state, final_states)
         self.transitions = transitions if transitions is not None else {}
 
-    def __repr__(self) -> str:
-        return super().__repr__() + "\n" + self.__repr_transitions__()
-
-    def __repr_transitions__(self) -> str:
-        def get_max_cell_width() -> int:
-            max_cell_width = 5
-
-            for key, val in self.transitions.items():
-                for next_val in val.values():
-                    max_cell_width = max(max_cell_width, len(next_val), len(key))
-
-            # add 4 for spaces on both sides
-            return max_cell_width + 4
-
-        cell_width = get_max_cell_width()
-
-        # create header
-        header = f"{'DFA': ^{cell_width+5}}|"
-        for letter in sorted(self.alphabet):
-            header += f"{letter: ^{cell_width}}|"
-
-        # create table rows
-        rows = ""
-        for state in sorted(self.states):
-            row_prefix = self.__repr_row_prefix__(state)
-            rows += f"{row_prefix: ^5}{state or 'empty': <{cell_width}}"
+    @classmethod
+    def from_edges(
+        cls,
+        sources: Iterable[str],
+        symbols: Iterable[str],
+        targets: Iterable[str],
+        initial_state: Optional[str] = None,
+        final_states: Optional[Set[str]] = None,
+        states: Optional[Set[str]] = None,
+        alphabet: Optional[Set[str]] = None,
+    ) -> "DFA":
+        """
+        Creates a DFA from parallel sequences of edges at once, which is much faster
+        than calling 'add_transition' for every edge. NumPy arrays are accepted as well,
+        their values (e.g. numbered states) are converted to strings.
 
-            for letter in sorted(self.alphabet):
-                transition = self.get_transition(state, letter)
-                rows += f"|{transition or 'empty': ^{cell_width}}"
+        Args:
+            sources (Iterable[str]): States where the transitions start.
+            symbols (Iterable[str]): Transition symbols.
+            targets (Iterable[str]): States where the transitions end.
+            initial_state (str, optional): Initial state. Defaults to None.
+            final_states (Set[str], optional): Final states. Defaults to no states.
+            states (Set[str], optional): All states. Defaults to the states used by the edges.
+            alphabet (Set[str], optional): Alphabet. Defaults to the symbols used by the edges.
+
+        Raises:
+            ValueError: If the sequences have different lengths, an edge uses ε,
+                an unknown state or symbol, or two edges from a state by a symbol differ.
 
-            rows += "\n"
+        Returns:
+            DFA: New DFA.
+        """
+        sources, symbols, targets = get_edge_lists(sources, symbols, targets)
+        grouped: DefaultDict[str, DFARules] = defaultdict(dict)
+
+        with paused_gc():
+            for state_from, symbol, state_to in zip(sources, symbols, targets):
+                grouped[state_from][symbol] = state_to
+
+        if "" in symbols:
+            raise ValueError("DFA cannot contain ε-transitions.")
+
+        # repeated edges are rare, they are looked for only if some edge was overwritten
+        if sum(map(len, grouped.values())) != len(sources):
+            for state_from, symbol, state_to in zip(sources, symbols, targets):
+                if grouped[state_from][symbol] != state_to:
+                    raise ValueError(
+                        f"Conflicting transitions from '{state_from}' by '{symbol}': "
+                        f"'{state_to}' and '{grouped[state_from][symbol]}'."
+                    )
+
+        transitions: DFATransitions = dict(grouped)
+
+        return cls._from_edge_lists(
+            sources,
+            symbols,
+            targets,
+            transitions,
+            initial_state,
+            final_states,
+            states,
+            alphabet,
+        )
 
-        divider = "-" * rows.index("\n")
+    def __repr__(self) -> str:
+        return super().__repr__() + "\n" + self.__repr_transitions__()
 
-        return "\n".join([header[:-1], divider, rows])
+    def _format_cell(self, state: str, symbol: str) -> str:
+        return self.get_transition(state, symbol) or "empty"
 
     def get_transition(self, state_from: str, symbol: str) -> Optional[str]:
         """
@@ -90,6 +148,8 @@ class DFA(BaseFiniteAutomaton):
         else:
             self.transitions[state_from][symbol] = state_to
 
+        self.invalidate()
+
     def add_transition(self, state_from: str, state_to: str, symbol: str) -> bool:
         """
         Adds transition to automaton. And returns bool value based on a change.
@@ -108,6 +168,7 @@ class DFA(BaseFiniteAutomaton):
                 self.transitions[state_from] = {}
 
             self.transitions[state_from][symbol] = state_to
+            self.invalidate()
             return True
 
         return False
@@ -125,10 +186,22 @@ class DFA(BaseFiniteAutomaton):
         """
         if self.get_transition(state_from, symbol):
             del self.transitions[state_from][symbol]
+            self.invalidate()
             return True
 
         return False
 
+    def _iter_transitions_from(self, state: str) -> Iterator[Tuple[str, str, str]]:
+        for symbol, state_to in self.transitions.get(state, {}).items():
+            yield state, symbol, state_to
+
+    def _get_next_states(self, state: str, symbol: str) -> Iterable[str]:
+        state_to = self.transitions.get(state, {}).get(symbol)
+        return (state_to,) if state_to else ()
+
+    def _restrict_rules(self, rules: DFARules, states: Set[str]) -> DFARules:
+        return {symbol: state_to for symbol, state_to in rules.items() if state_to in states}
+
     def get_symbols_between_states(self, state_from: str, state_to: str) -> Set[str]:
         """
         Returns set of symbols between two neighbouring states.
@@ -193,6 +266,9 @@ class DFA(BaseFiniteAutomaton):
         """
         assert self.is_valid(), "DFA needs to be valid."
 
+        return self._is_accepted(input_string)
+
+    def _is_accepted(self, input_string: str) -> bool:
         current_state = self.initial_state
 
         for symbol in input_string:
@@ -202,6 +278,153 @@ class DFA(BaseFiniteAutomaton):
 
         return current_state in self.final_states
 
+    def accepts_many(
+        self, input_strings: Iterable[str], share_prefixes: bool = False
+    ) -> List[bool]:
+        """
+        Checks which of the provided strings are accepted by the automaton.
+        The automaton is validated only once for the whole batch.
+
+        Args:
+            input_strings (Iterable[str]): Input strings to be tested.
+            share_prefixes (bool, optional): Sort the strings first and read every common
+                prefix of neighbouring strings only once, useful for sets of strings sharing
+                long prefixes (e.g. all words up to some length). Defaults to False.
+
+        Returns:
+            List[bool]: True for every accepted string, False for every rejected one
+                (in the order of 'input_strings').
+        """
+        assert self.is_valid(), "DFA needs to be valid."
+
+        if share_prefixes:
+            return self._accepts_sorted(
+                input_strings,
+                self.initial_state,
+                self.get_transition,
+                lambda state: state in self.final_states,
+            )
+
+        return [self._is_accepted(input_string) for input_string in input_strings]
+
+    def accepts_rle(self, runs: Iterable[Tuple[str, int]]) -> bool:
+        """
+        Checks whether the run-length encoded string is accepted without creating it,
+        e.g. [("a", 10**9), ("b", 10**9)] stands for a^(10^9) b^(10^9). A run can repeat
+        a longer string as well, e.g. ("ab", 3) stands for "ababab".
+
+        Each run follows the states reached after the repetitions until a state repeats,
+        the rest of the run is then skipped around the found cycle. So every run takes
+        at most as many repetitions as there are states, whatever its length.
+
+        Args:
+            runs (Iterable[Tuple[str, int]]): (string, number of repetitions) pairs.
+
+        Raises:
+            ValueError: If a number of repetitions is negative.
+
+        Returns:
+            bool: True if the encoded string is accepted, False otherwise.
+        """
+        assert self.is_valid(), "DFA needs to be valid."
+
+        state: Optional[str] = self.initial_state
+
+        for string, repeat in runs:
+            if repeat < 0:
+                raise ValueError(f"Run '{string}' has a negative length {repeat}.")
+
+            state = self._read_repeated(state, string, repeat)
+
+            if state is None:
+                return False
+
+        return state in self.final_states
+
+    def _read_repeated(self, state: str, string: str, repeat: int) -> Optional[str]:
+        """Returns the state after reading the string 'repeat' times, None if the run gets stuck."""
+        # orbit[i] is the state reached after i repetitions, 'visited' holds its index
+        orbit: List[str] = []
+        visited: Dict[str, int] = {}
+
+        while len(orbit) < repeat:
+            if state in visited:
+                start = visited[state]
+                return orbit[start + (repeat - start) % (len(orbit) - start)]
+
+            visited[state] = len(orbit)
+            orbit.append(state)
+
+            for symbol in string:
+                state = self.get_transition(state, symbol)
+
+                if not state:
+                    return None
+
+        return state
+
+    def accepts_file(
+        self, path: str, workers: Optional[int] = None, encoding: str = "utf-8"
+    ) -> bool:
+        """
+        Checks whether the whole content of the file (including line breaks) is accepted.
+        The file is memory-mapped and split into chunks read by parallel worker processes.
+        Each worker computes to which states its chunk leads from every state (runs which
+        meet are merged, so usually only a few runs are followed), the results are then
+        composed in order. Only UTF-8 files are split, other encodings are read by one worker.
+
+        Args:
+            path (str): Path to the file.
+            workers (int, optional): Number of worker processes, 1 reads the file
+                in the current process. Defaults to the number of CPUs.
+            encoding (str, optional): Encoding of the file. Defaults to "utf-8".
+
+        Returns:
+            bool: True if the content is accepted, False otherwise.
+        """
+        assert self.is_valid(), "DFA needs to be valid."
+
+        symbols = sorted(self.alphabet)
+        table, finals = self._get_reachable_table(symbols)
+        # the last row is a sink for characters outside of the alphabet
+        rows = [dict(zip(symbols, row)) for row in table] + [{}]
+
+        return run_file(rows, path, workers, encoding) in finals
+
+    def to_function(self, path: Optional[str] = None) -> Callable[[str], bool]:
+        """
+        Generates a Python function specialized to the automaton, which checks whether
+        a string is accepted faster than 'is_accepted'. Symbols are translated
+        to their classes (see 'get_symbol_classes') at once by 'str.translate'
+        and the states are integers indexing a flat tuple of transitions.
+        The function does not change when the automaton changes later.
+
+        Args:
+            path (str, optional): File where the generated source is written,
+                e.g. to inspect it or to import it later. Defaults to None.
+
+        Returns:
+            Callable[[str], bool]: Function returning True for accepted strings.
+
+        Example:
+            accepts = automaton.to_function()
+            accepts("1001")
+        """
+        assert self.is_valid(), "DFA needs to be valid."
+
+        classes = self.get_symbol_classes()
+        table, finals = self._get_reachable_table([min(c) for c in classes])
+        source = get_function_source(classes, table, finals)
+
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(source)
+
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, path or "<DFA.to_function>", "exec"), namespace)
+
+        return namespace["accepts"]
+
     def is_valid(self) -> bool:
         """
         Checks whether the DFA is valid:
@@ -235,6 +458,547 @@ class DFA(BaseFiniteAutomaton):
             or any(self.alphabet.difference(rule.keys()) for rule in t_values)  # rule 7
         )
 
+    def get_used_symbols(self) -> Set[str]:
+        """
+        Returns the alphabet together with the symbols used in the transition function.
+
+        Returns:
+            Set[str]: Set of symbols.
+        """
+        return self.alphabet.union(*(rules.keys() for rules in self.transitions.values()))
+
+    def freeze(self) -> "FrozenDFA":
+        """
+        Returns an immutable and hashable snapshot of the automaton. Results of derived
+        operations (validity, minimization, complement, trimming, fingerprint, ...)
+        are computed only once for the snapshot. Later changes of the automaton do not affect it.
+
+        Returns:
+            FrozenDFA: Frozen copy of the automaton.
+        """
+        return FrozenDFA(
+            self.states, self.alphabet, self.initial_state, self.final_states, self.transitions
+        )
+
+    def minimize(self, budget: Optional[Budget] = None) -> "DFA":
+        """
+        Creates the minimal DFA accepting the same language (Hopcroft's algorithm).
+        Unreachable states are dropped and missing transitions lead to a rejecting sink state.
+        States of the result are named 'q0', 'q1', ... in the breadth-first order
+        over the sorted alphabet, so language-equivalent automata produce the same DFA.
+
+        Args:
+            budget (Budget, optional): Limits of the minimization (states of the transition
+                table, its memory and time). Defaults to no limits.
+
+        Raises:
+            BudgetExceededError: If the minimization exceeds the budget.
+
+        Returns:
+            DFA: New minimal DFA, cached until the automaton changes.
+        """
+        return self._get_cached("minimize", lambda: self._minimize(budget))
+
+    def _minimize(self, budget: Optional[Budget] = None) -> "DFA":
+        assert self.initial_state in self.states, "DFA needs an initial state."
+
+        symbols = sorted(self.get_used_symbols())
+        table, finals = self._get_reachable_table(symbols)
+        blocks = _hopcroft(table, finals, len(symbols), budget)
+
+        block_of = [0] * len(table)
+        for block_id, block in enumerate(blocks):
+            for state in block:
+                block_of[state] = block_id
+
+        # renumber blocks in BFS order starting with the initial state (index 0)
+        names = {block_of[0]: "q0"}
+        queue = deque([block_of[0]])
+        transitions: DFATransitions = {}
+
+        while queue:
+            block_id = queue.popleft()
+            representative = next(iter(blocks[block_id]))
+            rules = transitions[names[block_id]] = {}
+
+            for symbol_index, symbol in enumerate(symbols):
+                next_block = block_of[table[representative][symbol_index]]
+
+                if next_block not in names:
+                    names[next_block] = f"q{len(names)}"
+                    queue.append(next_block)
+
+                rules[symbol] = names[next_block]
+
+        return DFA(
+            states=set(names.values()),
+            alphabet=set(symbols),
+            initial_state="q0",
+            final_states={
+                names[block_id]
+                for block_id, block in enumerate(blocks)
+                if next(iter(block)) in finals
+            },
+            transitions=transitions,
+        )
+
+    def _get_reachable_table(self, symbols: List[str]) -> Tuple[List[List[int]], Set[int]]:
+        """
+        Numbers the states reachable from the initial state (the initial state gets 0)
+        and returns the total transition table together with indices of the final states.
+        A sink state is appended if some transition is missing.
+        """
+        index = {self.initial_state: 0}
+        order = [self.initial_state]
+        table: List[List[int]] = []
+        needs_sink = False
+
+        for state in order:
+            rules = self.transitions.get(state, {})
+            row = []
+
+            for symbol in symbols:
+                next_state = rules.get(symbol)
+
+                if next_state is None:
+                    needs_sink = True
+                    row.append(-1)
+                    continue
+
+                if next_state not in index:
+                    index[next_state] = len(order)
+                    order.append(next_state)
+
+                row.append(index[next_state])
+
+            table.append(row)
+
+        if needs_sink:
+            sink = len(table)
+            table = [[sink if t == -1 else t for t in row] for row in table]
+            table.append([sink] * len(symbols))
+
+        finals = {i for i, state in enumerate(order) if state in self.final_states}
+
+        return table, finals
+
+    def get_counterexample(self, other: "DFA", budget: Optional[Budget] = None) -> Optional[str]:
+        """
+        Finds the shortest (and lexicographically smallest) word accepted by exactly
+        one of the automata. Missing transitions are treated as rejecting.
+
+        Args:
+            other (DFA): Automaton to be compared with.
+            budget (Budget, optional): Limits of the search in the product automaton
+                (visited pairs of states, their memory and time). Defaults to no limits.
+
+        Raises:
+            BudgetExceededError: If the search exceeds the budget.
+
+        Returns:
+            Optional[str]: Distinguishing word if the languages differ, None otherwise.
+        """
+        return self._get_counterexample(other, budget)
+
+    def _get_counterexample(
+        self, other: "DFA", budget: Optional[Budget] = None
+    ) -> Optional[str]:
+        symbols = sorted(self.get_used_symbols() | other.get_used_symbols())
+        start = (self.initial_state, other.initial_state)
+        parents = {start: None}
+        queue = deque([start])
+        # approximate size of the visited pairs and their parents
+        memory = getsizeof(parents)
+
+        while queue:
+            if budget is not None:
+                budget.check("equivalence check", len(parents), memory)
+
+            pair = queue.popleft()
+            state, other_state = pair
+
+            if (state in self.final_states) != (other_state in other.final_states):
+                word = []
+
+                while parents[pair]:
+                    pair, symbol = parents[pair]
+                    word.append(symbol)
+
+                return "".join(reversed(word))
+
+            rules = self.transitions.get(state, {})
+            other_rules = other.transitions.get(other_state, {})
+
+            for symbol in symbols:
+                next_pair = (rules.get(symbol), other_rules.get(symbol))
+
+                # both automata reject everything from here on
+                if next_pair == (None, None) or next_pair in parents:
+                    continue
+
+                parents[next_pair] = (pair, symbol)
+                queue.append(next_pair)
+                memory += getsizeof(next_pair) + getsizeof(parents[next_pair])
+
+        return None
+
+    def is_equivalent(self, other: "DFA", budget: Optional[Budget] = None) -> bool:
+        """
+        Checks whether both automata accept the same language.
+
+        Args:
+            other (DFA): Automaton to be compared with.
+            budget (Budget, optional): Limits of the check, see 'get_counterexample'.
+                Defaults to no limits.
+
+        Raises:
+            BudgetExceededError: If the check exceeds the budget.
+
+        Returns:
+            bool: True if the automata are equivalent, False otherwise.
+        """
+        return self.get_counterexample(other, budget) is None
+
+    def accepts_within(self, word: str, k: int) -> bool:
+        """
+        Checks whether the word is within the edit (Levenshtein) distance k of the language,
+        i.e. whether at most k insertions, deletions and substitutions of symbols turn it
+        into an accepted word.
+
+        Args:
+            word (str): Word to be checked.
+            k (int): Maximal number of edits.
+
+        Returns:
+            bool: True if an accepted word is at most k edits away, False otherwise.
+        """
+        return self._search_edits(word, k, find_all=False)[0] is not None
+
+    def nearest_words(self, word: str, k: int) -> List[str]:
+        """
+        Returns all accepted words with the smallest edit (Levenshtein) distance from the word,
+        provided the distance is at most k. The word itself is returned if it is accepted.
+
+        Args:
+            word (str): Word to be corrected.
+            k (int): Maximal number of edits.
+
+        Returns:
+            List[str]: Nearest accepted words ordered by length and alphabetically,
+                empty if there is no accepted word within the distance k.
+        """
+        distance, goals, parents = self._search_edits(word, k, find_all=True)
+
+        if distance is None:
+            return []
+
+        start = (self.initial_state, 0)
+        words = set()
+        # walks the optimal edit paths backwards, written symbols are collected in reverse
+        stack = [(goal, "") for goal in goals]
+
+        while stack:
+            node, suffix = stack.pop()
+
+            if node == start:
+                words.add(suffix)
+
+            for parent, symbol in parents.get(node, ()):
+                stack.append((parent, symbol + suffix))
+
+        return sorted(words, key=lambda found: (len(found), found))
+
+    def _search_edits(
+        self, word: str, k: int, find_all: bool
+    ) -> Tuple[Optional[int], List[EditNode], Dict[EditNode, List[Tuple[EditNode, str]]]]:
+        """
+        Bounded best-first search over (state, position in the word) pairs of the trimmed
+        automaton. Reading the next symbol of the word is free and every edit costs 1,
+        so the pairs are visited in the order of their costs using a deque (0-1 BFS).
+
+        Returns:
+            Tuple: The distance (None if it exceeds k), the reached accepting pairs and
+                the optimal parents of every visited pair with the written symbols.
+                The last two are complete only if 'find_all' is True.
+        """
+        trimmed = self.trim()
+        start = (trimmed.initial_state, 0)
+        costs = {start: 0}
+        parents: Dict[EditNode, List[Tuple[EditNode, str]]] = {}
+        goals: List[EditNode] = []
+        queue = deque([(0, start)])
+        distance = None
+
+        while queue:
+            cost, node = queue.popleft()
+
+            if cost > costs[node] or (distance is not None and cost > distance):
+                continue
+
+            state, position = node
+
+            if position == len(word) and state in trimmed.final_states:
+                if not find_all:
+                    return cost, goals, parents
+
+                distance = cost
+                goals.append(node)
+
+            rules = trimmed.transitions.get(state, {})
+            edits = _iter_edits(rules, state, word, position)
+
+            for next_state, next_position, edit, symbol in edits:
+                next_node = (next_state, next_position)
+                next_cost = cost + edit
+                known = costs.get(next_node)
+
+                if next_cost > k:
+                    continue
+
+                if known is None or next_cost < known:
+                    costs[next_node] = next_cost
+                    parents[next_node] = [(node, symbol)]
+
+                    if edit:
+                        queue.append((next_cost, next_node))
+                    else:
+                        queue.appendleft((next_cost, next_node))
+                elif next_cost == known and find_all:
+                    parents[next_node].append((node, symbol))
+
+        return distance, goals, parents
+
+    def fingerprint(self) -> str:
+        """
+        Returns a stable hash of the canonical minimal DFA (see 'minimize').
+        Automata accepting the same language over the same alphabet share the fingerprint.
+
+        Returns:
+            str: Hexadecimal SHA-256 digest.
+        """
+        return self._get_cached("fingerprint", lambda: self.minimize()._get_canonical_hash())
+
+    def _get_canonical_hash(self) -> str:
+        """
+        Hashes the automaton as it is, it has to be the result of 'minimize'.
+        """
+        symbols = sorted(self.alphabet)
+        rows = [
+            [int(self.transitions[f"q{i}"][symbol][1:]) for symbol in symbols]
+            for i in range(len(self.states))
+        ]
+        finals = sorted(int(state[1:]) for state in self.final_states)
+        payload = dumps([symbols, finals, rows], separators=(",", ":"))
+
+        return sha256(payload.encode("ascii")).hexdigest()
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], is_sorted: bool = True) -> "DFA":
+        """
+        Creates the minimal DFA accepting exactly the given words (Daciuk's incremental algorithm).
+        The automaton is kept minimal while the words are added, equivalent states are merged
+        using a register, so the memory is proportional to the minimal DFA instead of the trie.
+        The result is the same as 'minimize' would produce, including the rejecting sink state.
+
+        Args:
+            words (Iterable[str]): Words to be accepted, e.g. lines of a dictionary file.
+            is_sorted (bool, optional): Whether the words are sorted (duplicates are allowed).
+                Unsorted words are sorted in memory first. Defaults to True.
+
+        Raises:
+            ValueError: If 'is_sorted' is set and the words are not sorted.
+
+        Returns:
+            DFA: New minimal DFA.
+        """
+        if not is_sorted:
+            words = sorted(words)
+
+        # nodes are numbered, merged nodes are removed from 'edges' and 'finals'
+        edges: Dict[int, Dict[str, int]] = {0: {}}
+        node_ids = count(1)
+        finals: Set[int] = set()
+        register: Dict[Tuple[bool, Tuple[Tuple[str, int], ...]], int] = {}
+        # path of the previous word which is not registered yet, (parent, symbol, child)
+        unchecked: List[Tuple[int, str, int]] = []
+        previous = None
+
+        def replace_or_register(length: int) -> None:
+            while len(unchecked) > length:
+                parent, symbol, child = unchecked.pop()
+                key = (child in finals, tuple(sorted(edges[child].items())))
+                registered = register.setdefault(key, child)
+
+                if registered != child:
+                    edges[parent][symbol] = registered
+                    del edges[child]
+                    finals.discard(child)
+
+        for word in words:
+            if previous is not None and word <= previous:
+                if word == previous:
+                    continue
+
+                raise ValueError(f"Words are not sorted: '{word}' follows '{previous}'.")
+
+            common = 0
+            for a, b in zip(word, previous or ""):
+                if a != b:
+                    break
+                common += 1
+
+            replace_or_register(common)
+            node = unchecked[-1][2] if unchecked else 0
+
+            for symbol in word[common:]:
+                child = next(node_ids)
+                edges[child] = {}
+                edges[node][symbol] = child
+                unchecked.append((node, symbol, child))
+                node = child
+
+            finals.add(node)
+            previous = word
+
+        replace_or_register(0)
+
+        # name the states like 'minimize' does, the sink gets its name when it is first needed
+        symbols = sorted({symbol for rules in edges.values() for symbol in rules})
+        names = {0: "q0"}
+        queue = deque([0])
+        transitions: DFATransitions = {}
+
+        while queue:
+            node = queue.popleft()
+            rules = edges.get(node, {})
+            transitions[names[node]] = state_rules = {}
+
+            for symbol in symbols:
+                next_node = rules.get(symbol, -1)
+
+                if next_node not in names:
+                    names[next_node] = f"q{len(names)}"
+                    queue.append(next_node)
+
+                state_rules[symbol] = names[next_node]
+
+        return cls(
+            states=set(names.values()),
+            alphabet=set(symbols),
+            initial_state="q0",
+            final_states={names[node] for node in finals},
+            transitions=transitions,
+        )
+
+
+class FrozenDFA(FrozenFiniteAutomaton, DFA):
+    """
+    Immutable and hashable DFA, created by 'DFA.freeze'.
+    Derived automata (minimal, trimmed, complement) are frozen as well
+    and share the unchanged parts of the transition function.
+    """
+
+    def __init__(
+        self,
+        states: Set[str] = None,
+        alphabet: Set[str] = None,
+        initial_state: str = None,
+        final_states: Set[str] = None,
+        transitions: DFATransitions = None,
+    ) -> None:
+        super().__init__(states, alphabet, initial_state, final_states, transitions)
+        self._freeze()
+
+    def _freeze_rules(self, rules: DFARules) -> DFARules:
+        return rules if isinstance(rules, MappingProxyType) else MappingProxyType(dict(rules))
+
+    def minimize(self, budget: Optional[Budget] = None) -> "FrozenDFA":
+        return self._get_cached("minimize", lambda: self._minimize(budget).freeze())
+
+
+def _iter_edits(
+    rules: DFARules, state: str, word: str, position: int
+) -> Iterator[Tuple[str, int, int, str]]:
+    """
+    Yields the steps from the state at the position of the word as (next state, next position,
+    number of edits, written symbol): reading the next symbol or substituting it, deleting it
+    (nothing is written) and inserting a symbol.
+    """
+    if position < len(word):
+        for symbol, state_to in rules.items():
+            yield state_to, position + 1, int(symbol != word[position]), symbol
+
+        yield state, position + 1, 1, ""
+
+    for symbol, state_to in rules.items():
+        yield state_to, position, 1, symbol
+
+
+def _hopcroft(
+    table: List[List[int]],
+    finals: Set[int],
+    symbol_count: int,
+    budget: Optional[Budget] = None,
+) -> List[Set[int]]:
+    """
+    Partitions states of a total transition table into blocks of equivalent states.
+    """
+    inverse: List[List[List[int]]] = [[[] for _ in table] for _ in range(symbol_count)]
+    for state, row in enumerate(table):
+        for symbol, next_state in enumerate(row):
+            inverse[symbol][next_state].append(state)
+
+    # approximate size of the table and its inverse
+    memory = sum(map(getsizeof, table)) + sum(
+        getsizeof(states) for rows in inverse for states in rows
+    )
+
+    non_finals = set(range(len(table))) - finals
+    blocks = [block for block in (set(finals), non_finals) if block]
+    block_of = [0] * len(table)
+    for block_id, block in enumerate(blocks):
+        for state in block:
+            block_of[state] = block_id
+
+    # it is enough to start with the smaller of the two blocks
+    smaller = min(range(len(blocks)), key=lambda b: len(blocks[b]))
+    waiting = {(smaller, symbol) for symbol in range(symbol_count)} if len(blocks) > 1 else set()
+
+    while waiting:
+        if budget is not None:
+            budget.check("minimization", len(table), memory)
+
+        splitter, symbol = waiting.pop()
+        predecessors: Dict[int, List[int]] = {}
+
+        for state in list(blocks[splitter]):
+            for prev_state in inverse[symbol][state]:
+                predecessors.setdefault(block_of[prev_state], []).append(prev_state)
+
+        for block_id, states in predecessors.items():
+            block = blocks[block_id]
+            if len(states) == len(block):
+                continue
+
+            split = set(states)
+            rest = block - split
+
+            # the smaller part gets a new block id
+            if len(split) > len(rest):
+                split, rest = rest, split
+
+            blocks[block_id] = rest
+            blocks.append(split)
+            new_id = len(blocks) - 1
+
+            for state in split:
+                block_of[state] = new_id
+
+            for c in range(symbol_count):
+                waiting.add((new_id, c))
+
+    return blocks
+
 
 if __name__ == "__main__":
     pass
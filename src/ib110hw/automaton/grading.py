@@ -0,0 +1,141 @@
+from multiprocessing import Pool
+from os import cpu_count
+from typing import Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+from .budget import Budget, BudgetExceededError
+from .cache import MISSING, ResultCache, make_key
+from .dfa import DFA
+from .nfa import NFA
+
+Automaton = Union[DFA, NFA]
+
+
+class GradingResult(NamedTuple):
+    """
+    Result of comparing one submission with the reference automaton.
+
+    'equivalent' is None if the submission could not be graded, 'error' then contains the reason.
+    'counterexample' is the shortest word accepted by exactly one of the automata.
+    """
+
+    index: int
+    equivalent: Optional[bool]
+    counterexample: Optional[str] = None
+    error: Optional[str] = None
+
+
+# configuration of the current worker process, set by '_init_worker'
+_reference: Optional[DFA] = None
+_reference_fingerprint: Optional[str] = None
+_limits: Tuple[Optional[int], Optional[int], Optional[float]] = (None, None, None)
+_cache: Optional[ResultCache] = None
+
+
+def _init_worker(
+    reference: DFA,
+    limits: Tuple[Optional[int], Optional[int], Optional[float]],
+    cache: Optional[ResultCache],
+) -> None:
+    global _reference, _reference_fingerprint, _limits, _cache
+    _reference = reference
+    _reference_fingerprint = reference._get_canonical_hash()
+    _limits = limits
+    _cache = cache
+
+
+def _get_counterexample(submission: DFA, budget: Budget) -> Optional[str]:
+    if _cache is None:
+        return _reference._get_counterexample(submission, budget)
+
+    minimal = submission._minimize(budget)
+    fingerprint = minimal._get_canonical_hash()
+
+    if fingerprint == _reference_fingerprint:
+        return None
+
+    key = make_key(fingerprint, f"counterexample:{_reference_fingerprint}")
+    counterexample = _cache.get(key)
+
+    if counterexample is MISSING:
+        counterexample = _reference._get_counterexample(minimal, budget)
+        _cache.set(key, counterexample)
+
+    return counterexample
+
+
+def _grade(task: Tuple[int, Automaton]) -> GradingResult:
+    index, submission = task
+    # the time limit starts when the submission starts to be graded
+    budget = Budget(*_limits)
+
+    if not isinstance(submission, (DFA, NFA)):
+        return GradingResult(index, None, error="Submission is not a DFA or NFA.")
+
+    if submission.initial_state not in submission.states:
+        return GradingResult(index, None, error="Submission has no valid initial state.")
+
+    try:
+        if isinstance(submission, NFA):
+            submission = submission._determinize(budget)
+
+        counterexample = _get_counterexample(submission, budget)
+    except BudgetExceededError as e:
+        error = "timeout" if e.resource == "time" else f"{e.resource} limit exceeded"
+        return GradingResult(index, None, error=error)
+    except Exception as e:  # a broken submission must not stop the whole cohort
+        return GradingResult(index, None, error=f"{type(e).__name__}: {e}")
+
+    return GradingResult(index, counterexample is None, counterexample)
+
+
+def grade_many(
+    reference: Automaton,
+    submissions: Iterable[Automaton],
+    workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    cache: Optional[ResultCache] = None,
+    max_states: Optional[int] = None,
+    max_memory: Optional[int] = None,
+) -> Iterator[GradingResult]:
+    """
+    Checks every submitted automaton for equivalence with the reference automaton.
+    The reference is minimized once and sent to every worker process only once,
+    results are yielded as soon as they are finished (not in the order of submissions).
+
+    Args:
+        reference (Union[DFA, NFA]): The correct automaton.
+        submissions (Iterable[Union[DFA, NFA]]): Automata to be graded.
+        workers (int, optional): Number of worker processes, 1 grades in the current process.
+            Defaults to the number of CPUs.
+        timeout (float, optional): Time limit (s) for grading one submission. Defaults to None.
+        cache (ResultCache, optional): Cache shared by equivalent submissions, every worker
+            process gets its own copy of a 'MemoryCache', 'SQLiteCache' is shared. Defaults to None.
+        max_states (int, optional): Maximal number of states created by the determinization
+            or the equivalence check of one submission (see 'Budget'). Defaults to None.
+        max_memory (int, optional): Maximal size (B) of the structures built for one
+            submission (see 'Budget'). Defaults to None.
+
+    Yields:
+        GradingResult: Result of one submission, 'index' is its position in 'submissions'.
+    """
+    if isinstance(reference, NFA):
+        reference = reference.determinize()
+
+    reference = reference.minimize()
+    tasks = enumerate(submissions)
+    workers = workers or cpu_count() or 1
+
+    limits = (max_states, max_memory, timeout)
+
+    if workers == 1:
+        _init_worker(reference, limits, cache)
+        yield from map(_grade, tasks)
+        return
+
+    initargs = (reference, limits, cache)
+    with Pool(workers, initializer=_init_worker, initargs=initargs) as pool:
+        yield from pool.imap_unordered(_grade, tasks)
+
+
+if __name__ == "__main__":
+    pass
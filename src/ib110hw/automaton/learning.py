@@ -0,0 +1,289 @@
+from itertools import product
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from .dfa import DFA, DFATransitions
+
+# answers a batch of distinct words, True for the words in the language
+MembershipOracle = Callable[[List[str]], Iterable[bool]]
+# returns a word on which the hypothesis is wrong, None if it is correct
+EquivalenceOracle = Callable[[DFA], Optional[str]]
+
+
+class _TrieNode:
+    """Node of the prefix tree of MembershipCache, 'answer' is None for unknown words."""
+
+    __slots__ = ("answer", "children")
+
+    def __init__(self) -> None:
+        self.answer: Optional[bool] = None
+        self.children: Dict[str, "_TrieNode"] = {}
+
+
+class MembershipCache:
+    """
+    Remembers the answers of a membership oracle. Every word is sent to the oracle
+    at most once and the words missing in the cache are sent together in one batch.
+
+    The answers are stored in a prefix-closed tree: every word is a path from the root
+    and its prefixes are nodes on that path (with or without an answer). Queries of L* share
+    long prefixes (access words extended by suffixes), so every prefix is stored only once.
+
+    Attributes:
+        queries (int): Number of words sent to the oracle.
+        batches (int): Number of calls of the oracle.
+    """
+
+    def __init__(self, oracle: MembershipOracle) -> None:
+        self.oracle = oracle
+        self.queries = 0
+        self.batches = 0
+        self._root = _TrieNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Returns the number of known answers."""
+        return self._size
+
+    def get(self, word: str) -> Optional[bool]:
+        """Returns the known answer for the word, None if the word was not queried yet."""
+        node = self._root
+
+        for symbol in word:
+            node = node.children.get(symbol)
+
+            if node is None:
+                return None
+
+        return node.answer
+
+    def _set(self, word: str, answer: bool) -> None:
+        node = self._root
+
+        for symbol in word:
+            child = node.children.get(symbol)
+
+            if child is None:
+                child = node.children[symbol] = _TrieNode()
+
+            node = child
+
+        if node.answer is None:
+            self._size += 1
+
+        node.answer = bool(answer)
+
+    def query(self, words: Iterable[str]) -> List[bool]:
+        """
+        Returns the answers for the words, unknown words are sent to the oracle at once.
+        """
+        words = list(words)
+        answers = [self.get(word) for word in words]
+        missing = list(
+            dict.fromkeys(word for word, answer in zip(words, answers) if answer is None)
+        )
+
+        if not missing:
+            return answers
+
+        new_answers = dict(zip(missing, self.oracle(missing)))
+        self.queries += len(missing)
+        self.batches += 1
+
+        for word, answer in new_answers.items():
+            self._set(word, answer)
+
+        return [
+            new_answers[word] if answer is None else answer
+            for word, answer in zip(words, answers)
+        ]
+
+
+class ObservationTable:
+    """
+    Observation table of the L* algorithm. Rows are indexed by the access words
+    ('prefixes', prefix-closed) and their one-symbol extensions, columns by the 'suffixes'.
+    The rows are extended incrementally, only new cells are queried.
+    """
+
+    def __init__(self, alphabet: Sequence[str], cache: MembershipCache) -> None:
+        self.alphabet = list(alphabet)
+        self.cache = cache
+        self.prefixes: List[str] = [""]
+        self.suffixes: List[str] = [""]
+        self.rows: Dict[str, List[bool]] = {}
+
+    def _get_row_words(self) -> List[str]:
+        extensions = (prefix + symbol for prefix in self.prefixes for symbol in self.alphabet)
+        return list(dict.fromkeys([*self.prefixes, *extensions]))
+
+    def fill(self) -> None:
+        """Queries all missing cells of the table in one batch."""
+        cells = [
+            (word, suffix)
+            for word in self._get_row_words()
+            for suffix in self.suffixes[len(self.rows.get(word, ())) :]
+        ]
+        answers = self.cache.query(word + suffix for word, suffix in cells)
+
+        for (word, _), answer in zip(cells, answers):
+            self.rows.setdefault(word, []).append(answer)
+
+    def close(self) -> None:
+        """
+        Adds access words until every row of an extension equals the row of an access word.
+        """
+        self.fill()
+        known = {tuple(self.rows[prefix]) for prefix in self.prefixes}
+
+        while True:
+            added = False
+
+            for prefix in list(self.prefixes):
+                for symbol in self.alphabet:
+                    row = tuple(self.rows[prefix + symbol])
+
+                    if row not in known:
+                        known.add(row)
+                        self.prefixes.append(prefix + symbol)
+                        added = True
+
+            if not added:
+                return
+
+            self.fill()
+
+    def add_counterexample(self, counterexample: str) -> None:
+        """
+        Adds all suffixes of the counterexample as columns (Maler and Pnueli),
+        so the table stays consistent and only has to be closed again.
+        """
+        for start in range(len(counterexample)):
+            suffix = counterexample[start:]
+
+            if suffix not in self.suffixes:
+                self.suffixes.append(suffix)
+
+    def get_hypothesis(self) -> DFA:
+        """Creates the DFA whose states are the distinct rows of the access words."""
+        names: Dict[tuple, str] = {}
+        for prefix in self.prefixes:
+            names.setdefault(tuple(self.rows[prefix]), f"q{len(names)}")
+
+        transitions: DFATransitions = {}
+        for prefix in self.prefixes:
+            transitions[names[tuple(self.rows[prefix])]] = {
+                symbol: names[tuple(self.rows[prefix + symbol])] for symbol in self.alphabet
+            }
+
+        return DFA(
+            states=set(names.values()),
+            alphabet=set(self.alphabet),
+            initial_state=names[tuple(self.rows[""])],
+            # the first column belongs to the empty suffix
+            final_states={name for row, name in names.items() if row[0]},
+            transitions=transitions,
+        )
+
+
+def learn_dfa(
+    membership_oracle: MembershipOracle,
+    equivalence_oracle: EquivalenceOracle,
+    alphabet: Iterable[str],
+    cache: Optional[MembershipCache] = None,
+) -> DFA:
+    """
+    Learns the minimal DFA of an unknown regular language using the L* algorithm
+    (counterexamples are processed as proposed by Maler and Pnueli).
+    Membership queries are cached and sent to the oracle in batches, so the oracle can
+    answer them in bulk (e.g. using a process pool).
+
+    Args:
+        membership_oracle (Callable[[List[str]], Iterable[bool]]): Answers a batch of distinct
+            words, True for every word in the language.
+        equivalence_oracle (Callable[[DFA], Optional[str]]): Returns a word on which
+            the hypothesis is wrong, None if the hypothesis is correct.
+        alphabet (Iterable[str]): Symbols of the language.
+        cache (MembershipCache, optional): Cache of the membership queries, e.g. shared
+            with the equivalence oracle. Defaults to a new cache of 'membership_oracle'.
+
+    Returns:
+        DFA: Minimal DFA accepted by the equivalence oracle.
+
+    Example:
+        learned = learn_dfa(
+            get_machine_oracle(student_dtm),
+            get_bounded_equivalence_oracle(get_machine_oracle(student_dtm), "ab", 6),
+            "ab",
+        )
+    """
+    cache = cache if cache is not None else MembershipCache(membership_oracle)
+    table = ObservationTable(sorted(set(alphabet)), cache)
+
+    while True:
+        table.close()
+        hypothesis = table.get_hypothesis()
+        counterexample = equivalence_oracle(hypothesis)
+
+        if counterexample is None:
+            return hypothesis
+
+        table.add_counterexample(counterexample)
+
+
+def get_machine_oracle(machine: Any) -> MembershipOracle:
+    """
+    Creates a membership oracle which simulates the Turing machine (DTM or MTM) on every word,
+    the words are written to its (first) tape. Words are accepted if the machine accepts them,
+    runs exceeding 'max_steps' count as rejecting.
+    """
+
+    def oracle(words: List[str]) -> List[bool]:
+        answers = []
+
+        for word in words:
+            if hasattr(machine, "clear_tapes"):
+                machine.clear_tapes()
+            else:
+                machine.clear_tape()
+
+            machine.write_to_tape(word)
+            answers.append(machine.simulate(to_console=False))
+
+        return answers
+
+    return oracle
+
+
+def get_bounded_equivalence_oracle(
+    membership_oracle: MembershipOracle, alphabet: Iterable[str], max_length: int
+) -> EquivalenceOracle:
+    """
+    Creates an equivalence oracle comparing the hypothesis with the membership oracle
+    on all words up to the maximal length (in the shortlex order). The words are queried
+    in one batch when the oracle is used for the first time.
+    """
+    symbols = sorted(set(alphabet))
+    words = [
+        "".join(letters)
+        for length in range(max_length + 1)
+        for letters in product(symbols, repeat=length)
+    ]
+    expected: List[bool] = []
+
+    def oracle(hypothesis: DFA) -> Optional[str]:
+        if not expected:
+            expected.extend(membership_oracle(words))
+
+        results = hypothesis.accepts_many(words, share_prefixes=True)
+
+        for word, result, answer in zip(words, results, expected):
+            if result != answer:
+                return word
+
+        return None
+
+    return oracle
+
+
+if __name__ == "__main__":
+    pass
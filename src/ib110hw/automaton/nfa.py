@@ -1,6 +1,28 @@
-from typing import Dict, Set
-
-from .base import BaseFiniteAutomaton
+from collections import defaultdict, deque
+from sys import getsizeof
+from types import MappingProxyType
+from typing import (
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, it is used only by the vectorized 'accepts_many'
+    numpy = None
+
+from ._helpers import LazyDFA, get_edge_lists, paused_gc
+from .base import BaseFiniteAutomaton, FrozenFiniteAutomaton
+from .budget import Budget
+from .dfa import DFA, DFATransitions, FrozenDFA
 
 NFARules = Dict[str, Set[str]]
 NFATransitions = Dict[str, NFARules]
@@ -11,6 +33,8 @@ class NFA(BaseFiniteAutomaton):
     Nondeterministic Finite Automaton
     """
 
+    _table_title = "NFA"
+
     def __init__(
         self,
         states: Set[str] = None,
@@ -25,41 +49,71 @@ class NFA(BaseFiniteAutomaton):
         super().__init__(states, alphabet, initial_state, final_states)
         self.transitions = transitions if transitions is not None else {}
 
-    def __repr__(self) -> str:
-        return super().__repr__() + "\n" + self.__repr_transitions__()
-
-    def __repr_transitions__(self) -> str:
-        def get_max_cell_width():
-            max_cell_width = 5
-
-            for key, value in self.transitions.items():
-                for next_value in value.values():
-                    width = len(",".join(sorted(next_value)))
-                    max_cell_width = max(max_cell_width, width, len(key))
-
-            # add 4 for spaces on both sides
-            return max_cell_width + 4
+    @classmethod
+    def from_edges(
+        cls,
+        sources: Iterable[str],
+        symbols: Iterable[str],
+        targets: Iterable[str],
+        initial_state: Optional[str] = None,
+        final_states: Optional[Set[str]] = None,
+        states: Optional[Set[str]] = None,
+        alphabet: Optional[Set[str]] = None,
+    ) -> "NFA":
+        """
+        Creates an NFA from parallel sequences of edges at once, which is much faster
+        than calling 'add_transition' for every edge. NumPy arrays are accepted as well,
+        their values (e.g. numbered states) are converted to strings.
+        ε-transitions use the symbol '', repeated edges are added once.
 
-        cell_width = get_max_cell_width()
-        header = f"{'NFA': ^{cell_width+5}}|"
-        for letter in sorted(self.alphabet):
-            header += f"{letter or 'ε': ^{cell_width}}|"
+        Args:
+            sources (Iterable[str]): States where the transitions start.
+            symbols (Iterable[str]): Transition symbols.
+            targets (Iterable[str]): States where the transitions end.
+            initial_state (str, optional): Initial state. Defaults to None.
+            final_states (Set[str], optional): Final states. Defaults to no states.
+            states (Set[str], optional): All states. Defaults to the states used by the edges.
+            alphabet (Set[str], optional): Alphabet. Defaults to the symbols used by the edges.
+
+        Raises:
+            ValueError: If the sequences have different lengths or an edge uses
+                an unknown state or symbol.
 
-        rows = ""
-        for state in sorted(self.states):
-            row_prefix = self.__repr_row_prefix__(state)
-            rows += f"{row_prefix: ^5}{state or 'empty': <{cell_width}}"
+        Returns:
+            NFA: New NFA.
+        """
+        sources, symbols, targets = get_edge_lists(sources, symbols, targets)
+        grouped: DefaultDict[str, DefaultDict[str, Set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
 
-            for letter in sorted(self.alphabet):
-                transition = self.get_transition(state, letter)
-                transition_str = "{" + ",".join(transition) + "}"
-                rows += f"|{transition_str or 'empty': ^{cell_width}}"
+        with paused_gc():
+            for state_from, symbol, state_to in zip(sources, symbols, targets):
+                grouped[state_from][symbol].add(state_to)
+
+            transitions: NFATransitions = {
+                state: dict(rules) for state, rules in grouped.items()
+            }
+
+        return cls._from_edge_lists(
+            sources,
+            symbols,
+            targets,
+            transitions,
+            initial_state,
+            final_states,
+            states,
+            alphabet,
+        )
 
-            rows += "\n"
+    def __repr__(self) -> str:
+        return super().__repr__() + "\n" + self.__repr_transitions__()
 
-        divider = "-" * rows.index("\n")
+    def _format_symbol(self, symbol: str) -> str:
+        return symbol or "ε"
 
-        return "\n".join([header[:-1], divider, rows])
+    def _format_cell(self, state: str, symbol: str) -> str:
+        return "{" + ",".join(sorted(self.get_transition(state, symbol))) + "}"
 
     def get_transition(self, state_from: str, symbol: str) -> Set[str]:
         """
@@ -92,6 +146,8 @@ class NFA(BaseFiniteAutomaton):
         else:
             self.transitions[state_from][symbol] = states_to
 
+        self.invalidate()
+
     def add_transition(self, state_from: str, state_to: str, symbol: str) -> bool:
         """
         Adds transition to the automaton and returns bool based on a change.
@@ -106,18 +162,21 @@ class NFA(BaseFiniteAutomaton):
         """
         if state_from not in self.transitions.keys():
             self.transitions[state_from] = {symbol: {state_to}}
+            self.invalidate()
             return True
 
         transition = self.get_transition(state_from, symbol)
 
         if not transition:
             self.transitions[state_from][symbol] = {state_to}
+            self.invalidate()
             return True
 
         if state_to in transition:
             return False
 
         self.transitions[state_from][symbol].update({state_to})
+        self.invalidate()
 
         return True
 
@@ -143,8 +202,22 @@ class NFA(BaseFiniteAutomaton):
         if not self.transitions[state_from][symbol]:
             del self.transitions[state_from][symbol]
 
+        self.invalidate()
+
         return True
 
+    def _iter_transitions_from(self, state: str) -> Iterator[Tuple[str, str, str]]:
+        for symbol, states_to in self.transitions.get(state, {}).items():
+            for state_to in states_to:
+                yield state, symbol, state_to
+
+    def _get_next_states(self, state: str, symbol: str) -> Iterable[str]:
+        return self.transitions.get(state, {}).get(symbol, ())
+
+    def _restrict_rules(self, rules: NFARules, states: Set[str]) -> NFARules:
+        restricted = {symbol: states_to & states for symbol, states_to in rules.items()}
+        return {symbol: states_to for symbol, states_to in restricted.items() if states_to}
+
     def get_symbols_between_states(self, state_from: str, state_to: str) -> Set[str]:
         """
         Returns set of symbols between two states.
@@ -198,6 +271,7 @@ class NFA(BaseFiniteAutomaton):
     def is_accepted(self, input_string: str) -> bool:
         """
         Checks whether the provided input string is accepted by the automaton.
+        The set of current states is simulated symbol by symbol, ε-transitions are followed.
 
         Args:
             input_string (str): Input string to be tested.
@@ -207,21 +281,335 @@ class NFA(BaseFiniteAutomaton):
         """
         assert self.is_valid(), "NFA needs to be valid."
 
-        def is_accepted_rec(current_state: str, curr_input: str) -> bool:
-            if not curr_input:
-                return current_state in self.final_states
+        return self._is_accepted(input_string)
+
+    def _is_accepted(self, input_string: str) -> bool:
+        current_states = self.get_epsilon_closure({self.initial_state})
 
-            if not self.get_transition(current_state, curr_input[0]):
+        for symbol in input_string:
+            current_states = self.get_epsilon_closure(
+                {s for state in current_states for s in self.get_transition(state, symbol)}
+            )
+
+            if not current_states:
                 return False
 
-            result = False
+        return not current_states.isdisjoint(self.final_states)
+
+    def accepts_many(
+        self,
+        input_strings: Iterable[str],
+        share_prefixes: bool = False,
+        vectorized: bool = False,
+    ) -> List[bool]:
+        """
+        Checks which of the provided strings are accepted by the automaton.
+        The automaton is validated only once for the whole batch.
+
+        Args:
+            input_strings (Iterable[str]): Input strings to be tested.
+            share_prefixes (bool, optional): Sort the strings first and read every common
+                prefix of neighbouring strings only once, useful for sets of strings sharing
+                long prefixes (e.g. all words up to some length). Defaults to False.
+            vectorized (bool, optional): Simulate all strings at once using NumPy, the sets
+                of current states are rows of a boolean matrix advanced by matrix products.
+                It needs dense |Q|×|Q| matrices for every symbol, so it suits large batches
+                of strings on small automata. Defaults to False.
+
+        Returns:
+            List[bool]: True for every accepted string, False for every rejected one
+                (in the order of 'input_strings').
+        """
+        assert self.is_valid(), "NFA needs to be valid."
+
+        if share_prefixes:
+            subsets = LazyDFA({self.initial_state}, self.final_states, self._get_next_states)
+            return self._accepts_sorted(
+                input_strings, subsets.start, subsets.next, subsets.is_final
+            )
+
+        if vectorized:
+            return self._accepts_many_vectorized(list(input_strings))
+
+        return [self._is_accepted(input_string) for input_string in input_strings]
+
+    def _accepts_many_vectorized(self, input_strings: List[str]) -> List[bool]:
+        if numpy is None:
+            raise ImportError("The vectorized simulation requires NumPy.")
+
+        if not input_strings:
+            return []
+
+        states = sorted(self.states)
+        index = {state: i for i, state in enumerate(states)}
+        symbols = sorted(
+            {symbol for rules in self.transitions.values() for symbol in rules} - {""}
+        )
+        code_of = {symbol: code for code, symbol in enumerate(symbols)}
+        # codes after the symbols: unknown symbol (no next states), end of a shorter string
+        unknown, padding = len(symbols), len(symbols) + 1
+
+        closure = numpy.zeros((len(states), len(states)), dtype=numpy.float32)
+        for state in states:
+            closure[index[state], [index[s] for s in self.get_epsilon_closure({state})]] = 1
+
+        # steps[code][i, j] > 0 iff the state j is reachable from i by the symbol and ε-closure
+        steps = []
+        for symbol in symbols:
+            step = numpy.zeros((len(states), len(states)), dtype=numpy.float32)
+            for state_from, rules in self.transitions.items():
+                targets = [index[s] for s in rules.get(symbol, ())]
+                step[index[state_from], targets] = 1
+            steps.append((step @ closure > 0).astype(numpy.float32))
+
+        codes = numpy.full(
+            (len(input_strings), max(map(len, input_strings))), padding, dtype=numpy.int32
+        )
+        for row, input_string in enumerate(input_strings):
+            codes[row, : len(input_string)] = [code_of.get(s, unknown) for s in input_string]
+
+        current = numpy.repeat(closure[[index[self.initial_state]]] > 0, len(input_strings), 0)
+
+        for column in codes.T:
+            for code, step in enumerate(steps):
+                rows = numpy.flatnonzero(column == code)
+
+                if rows.size:
+                    current[rows] = current[rows].astype(numpy.float32) @ step > 0
+
+            current[column == unknown] = False
+
+        finals = numpy.zeros(len(states), dtype=bool)
+        finals[[index[state] for state in self.final_states]] = True
+
+        return (current & finals).any(axis=1).tolist()
+
+    def get_epsilon_closure(self, states: Iterable[str]) -> Set[str]:
+        """
+        Returns the provided states together with all states reachable from them by ε-transitions.
+
+        Args:
+            states (Iterable[str]): States to be closed.
+
+        Returns:
+            Set[str]: The ε-closure of the provided states.
+        """
+        closure = set(states)
+        stack = list(closure)
+
+        while stack:
+            for next_state in self.get_transition(stack.pop(), ""):
+                if next_state not in closure:
+                    closure.add(next_state)
+                    stack.append(next_state)
+
+        return closure
+
+    def freeze(self) -> "FrozenNFA":
+        """
+        Returns an immutable and hashable snapshot of the automaton. Results of derived
+        operations (validity, determinization, complement, trimming, fingerprint, ...)
+        are computed only once for the snapshot. Later changes of the automaton do not affect it.
+
+        Returns:
+            FrozenNFA: Frozen copy of the automaton.
+        """
+        return FrozenNFA(
+            self.states, self.alphabet, self.initial_state, self.final_states, self.transitions
+        )
+
+    def determinize(self, budget: Optional[Budget] = None) -> DFA:
+        """
+        Creates an equivalent DFA using the subset construction (ε-transitions included).
+        Only subsets reachable from the initial state are created, each of them is named
+        after its states, e.g. '{s1,s2}'. If two subsets get the same name (state names
+        containing commas or braces), the later one is suffixed by '#1', '#2', ...
+        The empty subset '{}' acts as a rejecting sink, so the resulting DFA is always total.
+
+        Args:
+            budget (Budget, optional): Limits of the construction (created subsets, their
+                memory and time). Defaults to no limits.
+
+        Raises:
+            BudgetExceededError: If the construction exceeds the budget.
 
-            for state in self.get_transition(current_state, curr_input[0]):
-                result = result or is_accepted_rec(state, curr_input[1:])
+        Returns:
+            DFA: New DFA accepting the same language, cached until the automaton changes.
+        """
+        return self._get_cached("determinize", lambda: self._determinize(budget))
+
+    def _determinize(self, budget: Optional[Budget] = None) -> DFA:
+        assert self.initial_state in self.states, "NFA needs an initial state."
+
+        used: Set[str] = set()
+
+        def get_name(subset: FrozenSet[str]) -> str:
+            # state names may contain commas or braces, different subsets get a numbered suffix
+            name = base = "{" + ",".join(sorted(subset)) + "}"
+            suffix = 1
 
-            return result
+            while name in used:
+                name = f"{base}#{suffix}"
+                suffix += 1
+
+            used.add(name)
+            return name
+
+        symbols = sorted(
+            self.alphabet.union(*(rules.keys() for rules in self.transitions.values()))
+            - {""}
+        )
+        start = frozenset(self.get_epsilon_closure({self.initial_state}))
+        # every subset is named once, the rules share the names
+        names = {start: get_name(start)}
+        queue = deque([start])
+        transitions: DFATransitions = {}
+        # approximate size of the subsets, their names and rules built so far
+        memory = getsizeof(start) + getsizeof(names[start])
+
+        while queue:
+            subset = queue.popleft()
+            rules = transitions[names[subset]] = {}
+
+            for symbol in symbols:
+                next_subset = frozenset(
+                    self.get_epsilon_closure(
+                        {s for state in subset for s in self.get_transition(state, symbol)}
+                    )
+                )
+
+                if next_subset not in names:
+                    names[next_subset] = get_name(next_subset)
+                    queue.append(next_subset)
+                    memory += getsizeof(next_subset) + getsizeof(names[next_subset])
+
+                rules[symbol] = names[next_subset]
+
+            memory += getsizeof(rules)
+
+            if budget is not None:
+                budget.check("determinization", len(names), memory)
+
+        return DFA(
+            states=set(transitions.keys()),
+            alphabet=set(symbols),
+            initial_state=names[start],
+            final_states={
+                name for subset, name in names.items() if not subset.isdisjoint(self.final_states)
+            },
+            transitions=transitions,
+        )
 
-        return is_accepted_rec(self.initial_state, input_string)
+    def fingerprint(self) -> str:
+        """
+        Returns the fingerprint of the equivalent minimal DFA (see 'DFA.fingerprint').
+
+        Returns:
+            str: Hexadecimal SHA-256 digest.
+        """
+        return self._get_cached("fingerprint", lambda: self.determinize().fingerprint())
+
+    def union(self, *others: "NFA") -> "NFA":
+        """
+        Creates an NFA accepting the words accepted by any of the automata. States of the i-th
+        operand are prefixed by 'i:' (the automaton itself has the index 0), the new initial
+        state 'init' leads to the initial states of the operands by ε-transitions.
+
+        Args:
+            *others (NFA): Other operands.
+
+        Returns:
+            NFA: New NFA, the operands do not change.
+        """
+        automata = (self, *others)
+        states, transitions, initials, finals = _get_namespaced(automata)
+        transitions["init"] = {"": set(initials)}
+
+        return NFA(
+            states=states | {"init"},
+            alphabet=_get_alphabet(automata) | {""},
+            initial_state="init",
+            final_states=set().union(*finals),
+            transitions=transitions,
+        )
+
+    def concatenation(self, *others: "NFA") -> "NFA":
+        """
+        Creates an NFA accepting the concatenations of words accepted by the automata in order.
+        States of the i-th operand are prefixed by 'i:' (the automaton itself has the index 0),
+        final states of every operand lead to the initial state of the next one by ε-transitions.
+
+        Args:
+            *others (NFA): Other operands.
+
+        Returns:
+            NFA: New NFA, the operands do not change.
+        """
+        automata = (self, *others)
+        states, transitions, initials, finals = _get_namespaced(automata)
+
+        for operand_finals, next_initial in zip(finals, initials[1:]):
+            for state in operand_finals:
+                transitions.setdefault(state, {}).setdefault("", set()).add(next_initial)
+
+        return NFA(
+            states=states,
+            alphabet=_get_alphabet(automata) | ({""} if others else set()),
+            initial_state=initials[0],
+            final_states=finals[-1],
+            transitions=transitions,
+        )
+
+    def star(self) -> "NFA":
+        """
+        Creates an NFA accepting the iterations (Kleene star) of the language. States are
+        prefixed by '0:', the new accepting initial state 'init' leads to the original
+        initial state and the final states lead back to it by ε-transitions.
+
+        Returns:
+            NFA: New NFA, the automaton does not change.
+        """
+        states, transitions, (initial,), (finals,) = _get_namespaced((self,))
+        transitions["init"] = {"": {initial}}
+
+        for state in finals:
+            transitions.setdefault(state, {}).setdefault("", set()).add(initial)
+
+        return NFA(
+            states=states | {"init"},
+            alphabet=set(self.alphabet) | {""},
+            initial_state="init",
+            final_states=finals | {"init"},
+            transitions=transitions,
+        )
+
+    def reverse(self) -> "NFA":
+        """
+        Creates an NFA accepting the reversed words of the language. States are prefixed
+        by '0:', transitions are reversed and the new initial state 'init' leads
+        to the original final states by ε-transitions.
+
+        Returns:
+            NFA: New NFA, the automaton does not change.
+        """
+        assert self.initial_state in self.states, "NFA needs an initial state."
+        transitions: DefaultDict[str, DefaultDict[str, Set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+
+        with paused_gc():
+            for state_from, symbol, state_to in self._iter_transitions():
+                transitions["0:" + state_to][symbol].add("0:" + state_from)
+
+            transitions["init"][""] = {"0:" + state for state in self.final_states}
+
+            return NFA(
+                states={"0:" + state for state in self.states} | {"init"},
+                alphabet=set(self.alphabet) | {""},
+                initial_state="init",
+                final_states={"0:" + self.initial_state},
+                transitions={state: dict(rules) for state, rules in transitions.items()},
+            )
 
     def is_valid(self) -> bool:
         """
@@ -249,5 +637,74 @@ class NFA(BaseFiniteAutomaton):
         )
 
 
+class FrozenNFA(FrozenFiniteAutomaton, NFA):
+    """
+    Immutable and hashable NFA, created by 'NFA.freeze'.
+    Derived automata (determinized, trimmed, complement) are frozen as well
+    and share the unchanged parts of the transition function.
+    """
+
+    def __init__(
+        self,
+        states: Set[str] = None,
+        alphabet: Set[str] = None,
+        initial_state: str = None,
+        final_states: Set[str] = None,
+        transitions: NFATransitions = None,
+    ) -> None:
+        super().__init__(states, alphabet, initial_state, final_states, transitions)
+        self._freeze()
+
+    def _freeze_rules(self, rules: NFARules) -> NFARules:
+        if isinstance(rules, MappingProxyType):
+            return rules
+
+        return MappingProxyType({symbol: frozenset(states) for symbol, states in rules.items()})
+
+    def determinize(self, budget: Optional[Budget] = None) -> FrozenDFA:
+        return self._get_cached("determinize", lambda: self._determinize(budget).freeze())
+
+
+def _get_namespaced(
+    automata: Sequence[NFA],
+) -> Tuple[Set[str], NFATransitions, List[str], List[Set[str]]]:
+    """
+    Prefixes the states of the i-th automaton by 'i:' in a single pass over the transitions.
+
+    Returns:
+        Tuple[Set[str], NFATransitions, List[str], List[Set[str]]]: All states, transitions,
+            initial states and final states of every automaton after the renaming.
+    """
+    states: Set[str] = set()
+    transitions: NFATransitions = {}
+    initials: List[str] = []
+    finals: List[Set[str]] = []
+
+    with paused_gc():
+        for index, automaton in enumerate(automata):
+            assert automaton.initial_state in automaton.states, "NFA needs an initial state."
+            prefix = f"{index}:"
+
+            states.update(prefix + state for state in automaton.states)
+            initials.append(prefix + automaton.initial_state)
+            finals.append({prefix + state for state in automaton.final_states})
+            transitions.update(
+                (
+                    prefix + state,
+                    {
+                        symbol: {prefix + state_to for state_to in states_to}
+                        for symbol, states_to in rules.items()
+                    },
+                )
+                for state, rules in automaton.transitions.items()
+            )
+
+    return states, transitions, initials, finals
+
+
+def _get_alphabet(automata: Sequence[NFA]) -> Set[str]:
+    return set().union(*(automaton.alphabet for automaton in automata))
+
+
 if __name__ == "__main__":
     pass
@@ -0,0 +1,229 @@
+from collections import Counter
+from contextlib import contextmanager
+from inspect import signature
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .dfa import DFA
+from .nfa import NFA
+
+Transition = Tuple[str, str]
+
+
+class RunProfile:
+    """
+    Statistics collected from runs of an automaton while it is profiled (see 'profile').
+
+    Attributes:
+        runs (int): Number of processed input strings.
+        accepted (int): Number of accepted input strings.
+        symbols_processed (int): Total number of read symbols.
+        state_visits (Counter): How many times was each state entered (or active for NFA).
+        transition_uses (Counter): How many times was each (state, symbol) transition used.
+            ε-transitions of an NFA are counted with the symbol ''.
+        rejection_positions (Counter): Positions in the input at which the runs
+            got stuck (no next state), runs reading the whole input are not counted.
+    """
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.accepted = 0
+        self.symbols_processed = 0
+        self.state_visits: Counter = Counter()
+        self.transition_uses: Counter = Counter()
+        self.rejection_positions: Counter = Counter()
+
+    def __repr__(self) -> str:
+        return (
+            f"runs: {self.runs}, accepted: {self.accepted}, "
+            f"symbols processed: {self.symbols_processed}\n"
+            f"hottest states: {self.get_hot_states(5)}\n"
+            f"hottest transitions: {self.get_hot_transitions(5)}\n"
+            f"early rejections: {sorted(self.rejection_positions.items())}\n"
+        )
+
+    def get_hot_states(self, count: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Returns the most visited states with their visit counts.
+
+        Args:
+            count (int, optional): Number of returned states. Defaults to all.
+
+        Returns:
+            List[Tuple[str, int]]: States ordered by the number of visits.
+        """
+        return self.state_visits.most_common(count)
+
+    def get_hot_transitions(
+        self, count: Optional[int] = None
+    ) -> List[Tuple[Transition, int]]:
+        """
+        Returns the most used transitions with their use counts.
+
+        Args:
+            count (int, optional): Number of returned transitions. Defaults to all.
+
+        Returns:
+            List[Tuple[Tuple[str, str], int]]: (state, symbol) pairs ordered by the number of uses.
+        """
+        return self.transition_uses.most_common(count)
+
+    def get_dead_states(self, automaton: Union[DFA, NFA]) -> Set[str]:
+        """
+        Returns states of the automaton which were never visited.
+        """
+        return automaton.states - self.state_visits.keys()
+
+    def get_dead_transitions(self, automaton: Union[DFA, NFA]) -> Set[Transition]:
+        """
+        Returns (state, symbol) transitions of the automaton which were never used.
+        """
+        return {
+            (state, symbol)
+            for state, rules in automaton.transitions.items()
+            for symbol in rules
+        } - self.transition_uses.keys()
+
+
+def _profile_dfa(automaton: DFA, run_profile: RunProfile) -> Callable[[str], bool]:
+    visits = run_profile.state_visits
+    uses = run_profile.transition_uses
+
+    def is_accepted(input_string: str) -> bool:
+        run_profile.runs += 1
+        current_state = automaton.initial_state
+        visits[current_state] += 1
+
+        for position, symbol in enumerate(input_string):
+            next_state = automaton.get_transition(current_state, symbol)
+
+            if not next_state:
+                run_profile.symbols_processed += position
+                run_profile.rejection_positions[position] += 1
+                return False
+
+            uses[(current_state, symbol)] += 1
+            visits[next_state] += 1
+            current_state = next_state
+
+        run_profile.symbols_processed += len(input_string)
+        accepted = current_state in automaton.final_states
+        run_profile.accepted += accepted
+
+        return accepted
+
+    return is_accepted
+
+
+def _profile_nfa(automaton: NFA, run_profile: RunProfile) -> Callable[[str], bool]:
+    visits = run_profile.state_visits
+    uses = run_profile.transition_uses
+
+    def get_epsilon_closure(states: Set[str]) -> Set[str]:
+        closure = set(states)
+        stack = list(closure)
+
+        while stack:
+            state = stack.pop()
+            next_states = automaton.get_transition(state, "")
+
+            if next_states:
+                uses[(state, "")] += 1
+
+            for next_state in next_states:
+                if next_state not in closure:
+                    closure.add(next_state)
+                    stack.append(next_state)
+
+        visits.update(closure)
+        return closure
+
+    def is_accepted(input_string: str) -> bool:
+        run_profile.runs += 1
+        current_states = get_epsilon_closure({automaton.initial_state})
+
+        for position, symbol in enumerate(input_string):
+            next_states = set()
+
+            for state in current_states:
+                targets = automaton.get_transition(state, symbol)
+
+                if targets:
+                    uses[(state, symbol)] += 1
+                    next_states.update(targets)
+
+            if not next_states:
+                run_profile.symbols_processed += position
+                run_profile.rejection_positions[position] += 1
+                return False
+
+            current_states = get_epsilon_closure(next_states)
+
+        run_profile.symbols_processed += len(input_string)
+        accepted = not current_states.isdisjoint(automaton.final_states)
+        run_profile.accepted += accepted
+
+        return accepted
+
+    return is_accepted
+
+
+@contextmanager
+def profile(
+    automaton: Union[DFA, NFA], run_profile: Optional[RunProfile] = None
+) -> Iterator[RunProfile]:
+    """
+    Profiles 'is_accepted' and 'accepts_many' of the automaton inside the 'with' block.
+    The profiled runs use separate implementations, so the regular methods have no overhead.
+
+    Args:
+        automaton (Union[DFA, NFA]): Automaton to be profiled, it may be frozen.
+        run_profile (RunProfile, optional): Profile to be extended, e.g. from a previous block.
+            Defaults to a new profile.
+
+    Yields:
+        RunProfile: Statistics, updated after every run.
+
+    Example:
+        with profile(automaton) as stats:
+            automaton.accepts_many(words)
+
+        print(stats.get_dead_states(automaton))
+    """
+    run_profile = run_profile if run_profile is not None else RunProfile()
+    make_run = _profile_nfa if isinstance(automaton, NFA) else _profile_dfa
+    run = make_run(automaton, run_profile)
+    name = type(automaton).__name__
+
+    def is_accepted(input_string: str) -> bool:
+        assert automaton.is_valid(), f"{name} needs to be valid."
+        return run(input_string)
+
+    # options of the method (e.g. 'share_prefixes') are checked, but ignored while profiling,
+    # every string is counted as a separate run
+    def accepts_many(input_strings: Iterable[str], **kwargs) -> List[bool]:
+        signature(type(automaton).accepts_many).bind(automaton, input_strings, **kwargs)
+        assert automaton.is_valid(), f"{name} needs to be valid."
+        return [run(input_string) for input_string in input_strings]
+
+    # instance attributes shadow the methods of the class until the block ends,
+    # shadows of an outer 'profile' block on the same automaton are restored afterwards,
+    # they are set directly, so that frozen automata can be profiled as well
+    shadows = {"is_accepted": is_accepted, "accepts_many": accepts_many}
+    attributes = vars(automaton)
+    outer = {attribute: attributes[attribute] for attribute in shadows if attribute in attributes}
+
+    for attribute, shadow in shadows.items():
+        object.__setattr__(automaton, attribute, shadow)
+
+    try:
+        yield run_profile
+    finally:
+        for attribute in shadows:
+            if attribute in outer:
+                object.__setattr__(automaton, attribute, outer[attribute])
+            else:
+                object.__delattr__(automaton, attribute)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,481 @@
+from bisect import bisect_right
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .base import BaseFiniteAutomaton
+from .dfa import DFA, DFATransitions
+
+MAX_CODE_POINT = 0x10FFFF
+
+CodeRange = Tuple[int, int]
+
+
+class CharClass:
+    """
+    Immutable set of characters represented by sorted disjoint ranges of code points.
+    Used as a transition label of a SymbolicDFA, e.g. CharClass.range("a", "z").
+    """
+
+    __slots__ = ("ranges",)
+
+    def __init__(self, ranges: Iterable[CodeRange] = ()) -> None:
+        merged: List[CodeRange] = []
+
+        for first, last in sorted(ranges):
+            if first > last:
+                continue
+
+            if merged and first <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+            else:
+                merged.append((first, last))
+
+        object.__setattr__(self, "ranges", tuple(merged))
+
+    @classmethod
+    def of(cls, chars: Iterable[str]) -> "CharClass":
+        """Creates a class containing exactly the provided characters."""
+        return cls((ord(c), ord(c)) for c in chars)
+
+    @classmethod
+    def range(cls, first: str, last: str) -> "CharClass":
+        """Creates a class of characters between 'first' and 'last' (both inclusive)."""
+        return cls([(ord(first), ord(last))])
+
+    @classmethod
+    def any(cls) -> "CharClass":
+        """Creates a class containing every character."""
+        return cls([(0, MAX_CODE_POINT)])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CharClass is immutable.")
+
+    def __reduce__(self):
+        return CharClass, (self.ranges,)
+
+    def __contains__(self, char: str) -> bool:
+        code = ord(char)
+        index = bisect_right(self.ranges, (code, MAX_CODE_POINT)) - 1
+        return index >= 0 and self.ranges[index][0] <= code <= self.ranges[index][1]
+
+    def __len__(self) -> int:
+        return sum(last - first + 1 for first, last in self.ranges)
+
+    def __iter__(self) -> Iterator[str]:
+        for first, last in self.ranges:
+            for code in range(first, last + 1):
+                yield chr(code)
+
+    def __bool__(self) -> bool:
+        return bool(self.ranges)
+
+    def __or__(self, other: "CharClass") -> "CharClass":
+        return CharClass(self.ranges + other.ranges)
+
+    def __invert__(self) -> "CharClass":
+        ranges, start = [], 0
+
+        for first, last in self.ranges:
+            ranges.append((start, first - 1))
+            start = last + 1
+
+        ranges.append((start, MAX_CODE_POINT))
+        return CharClass(ranges)
+
+    def __and__(self, other: "CharClass") -> "CharClass":
+        return ~(~self | ~other)
+
+    def __sub__(self, other: "CharClass") -> "CharClass":
+        return self & ~other
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CharClass) and self.ranges == other.ranges
+
+    def __lt__(self, other: "CharClass") -> bool:
+        return self.ranges < other.ranges
+
+    def __hash__(self) -> int:
+        return hash(self.ranges)
+
+    def __repr__(self) -> str:
+        def show(code: int) -> str:
+            char = chr(code)
+
+            if char.isprintable() and char not in "[]-\\":
+                return char
+
+            return f"\\u{code:04x}" if code <= 0xFFFF else f"\\U{code:08x}"
+
+        parts = [
+            show(first) if first == last else f"{show(first)}-{show(last)}"
+            for first, last in self.ranges
+        ]
+        return f"[{''.join(parts)}]"
+
+
+Label = Union[CharClass, str]
+SymbolicRules = Dict[CharClass, str]
+SymbolicTransitions = Dict[str, SymbolicRules]
+
+
+def _to_char_class(label: Label) -> CharClass:
+    return label if isinstance(label, CharClass) else CharClass.of(label)
+
+
+class SymbolicDFA(BaseFiniteAutomaton):
+    """
+    Deterministic Finite Automaton with transitions labelled by character classes.
+    The alphabet is the set of used labels (computed from the transitions if not provided),
+    labels leaving one state have to be disjoint. Characters without a transition are rejected.
+    """
+
+    _table_title = "SymbolicDFA"
+
+    def __init__(
+        self,
+        states: Set[str] = None,
+        alphabet: Set[CharClass] = None,
+        initial_state: str = None,
+        final_states: Set[str] = None,
+        transitions: SymbolicTransitions = None,
+    ) -> None:
+        transitions = transitions if transitions is not None else {}
+
+        if transitions:
+            states = states if states is not None else set(transitions.keys())
+
+        if alphabet is None:
+            alphabet = {label for rules in transitions.values() for label in rules}
+
+        super().__init__(states, alphabet, initial_state, final_states)
+        self.transitions = transitions
+
+    def __repr__(self) -> str:
+        labels = [repr(label) for label in self._get_sorted_alphabet()]
+        states_str = f"states: {','.join(self._get_sorted_states()[: self.REPR_MAX_ROWS])}"
+        final_states_str = f"final states: {','.join(sorted(self.final_states))}"
+
+        return (
+            f"alphabet: {','.join(labels[: self.REPR_MAX_COLUMNS])}\n{states_str}\n"
+            f"initial state: {self.initial_state}\n{final_states_str}\n\n"
+            + self.__repr_transitions__()
+        )
+
+    def _format_symbol(self, symbol: CharClass) -> str:
+        return repr(symbol)
+
+    def _format_cell(self, state: str, symbol: CharClass) -> str:
+        return self.transitions.get(state, {}).get(symbol) or "empty"
+
+    def _iter_transitions_from(self, state: str) -> Iterator[Tuple[str, CharClass, str]]:
+        for label, state_to in self.transitions.get(state, {}).items():
+            yield state, label, state_to
+
+    def _get_next_states(self, state: str, char: str) -> Iterable[str]:
+        state_to = self.get_transition(state, char) if char else None
+        return (state_to,) if state_to else ()
+
+    def _get_reversed_step(self) -> Callable[[str, str], Iterable[str]]:
+        reverse: Dict[str, List[Tuple[CharClass, str]]] = {}
+        for state_from, label, state_to in self._iter_transitions():
+            reverse.setdefault(state_to, []).append((label, state_from))
+
+        def get_previous(state: str, char: str) -> List[str]:
+            if not char:
+                return []
+
+            return [state_from for label, state_from in reverse.get(state, ()) if char in label]
+
+        return get_previous
+
+    def _restrict_rules(self, rules: SymbolicRules, states: Set[str]) -> SymbolicRules:
+        return {label: state_to for label, state_to in rules.items() if state_to in states}
+
+    def _trim(self) -> "SymbolicDFA":
+        trimmed = super()._trim()
+        trimmed.alphabet = {
+            label for rules in trimmed.transitions.values() for label in rules
+        }
+        return trimmed
+
+    def get_transition(self, state_from: str, char: str) -> Optional[str]:
+        """
+        Returns next state from the provided state by the character.
+
+        Args:
+            state_from (str): State name where the transition starts.
+            char (str): Read character.
+
+        Returns:
+            Optional[str]: Next state if such transition exists, None otherwise.
+        """
+        for label, state_to in self.transitions.get(state_from, {}).items():
+            if char in label:
+                return state_to
+
+        return None
+
+    def add_transition(self, state_from: str, state_to: str, label: Label) -> bool:
+        """
+        Adds transition labelled by the character class (a string is converted to the class
+        of its characters). Nothing changes if the label overlaps a label of another transition
+        from 'state_from'.
+
+        Args:
+            state_from (str): State name where the transition starts.
+            state_to (str): State name where the transition ends.
+            label (Union[CharClass, str]): Characters of the transition.
+
+        Returns:
+            bool: True if transition was added, False otherwise.
+        """
+        label = _to_char_class(label)
+        rules = self.transitions.setdefault(state_from, {})
+
+        if not label or any(label & other for other in rules):
+            return False
+
+        rules[label] = state_to
+        self.alphabet.add(label)
+        self.invalidate()
+
+        return True
+
+    def remove_transition(self, state_from: str, label: Label) -> bool:
+        """
+        Removes transition with exactly the provided label.
+
+        Args:
+            state_from (str): State name where the transition starts.
+            label (Union[CharClass, str]): Label of the transition.
+
+        Returns:
+            bool: True if the automaton contained such transition, False otherwise.
+        """
+        label = _to_char_class(label)
+
+        if label not in self.transitions.get(state_from, {}):
+            return False
+
+        del self.transitions[state_from][label]
+
+        if all(label not in rules for rules in self.transitions.values()):
+            self.alphabet.discard(label)
+
+        self.invalidate()
+
+        return True
+
+    def remove_state(self, state: str) -> bool:
+        """
+        Removes the provided state from the automaton (from its states and transitions).
+
+        Args:
+            state (str): State to be removed.
+
+        Returns:
+            bool: True if automaton contained such state, False otherwise.
+        """
+        if not super().remove_state(state):
+            return False
+
+        self.transitions.pop(state, None)
+
+        for rules in self.transitions.values():
+            for label in [k for k, v in rules.items() if v == state]:
+                del rules[label]
+
+        self.alphabet = {label for rules in self.transitions.values() for label in rules}
+
+        return True
+
+    def is_valid(self) -> bool:
+        """
+        Checks whether the symbolic DFA is valid:
+            1. The states set is not empty.
+            2. The initial state is in states.
+            3. Final states are subset of states.
+            4. Labels are not empty and labels leaving one state are disjoint.
+            5. The transition function contains states only from its states set.
+
+        Returns:
+            bool: True if the automaton is valid, False otherwise.
+        """
+
+        def is_deterministic(rules: SymbolicRules) -> bool:
+            ranges = sorted(r for label in rules for r in label.ranges)
+            return all(label for label in rules) and all(
+                prev[1] < curr[0] for prev, curr in zip(ranges, ranges[1:])
+            )
+
+        used_states = set(self.transitions.keys()).union(
+            *(rules.values() for rules in self.transitions.values())
+        )
+
+        return bool(
+            super().is_valid()  # rules 1-3
+            and all(is_deterministic(rules) for rules in self.transitions.values())
+            and used_states.issubset(self.states)  # rule 5
+        )
+
+    def get_symbol_classes(self) -> List[CharClass]:
+        """
+        Splits all characters into classes of characters which behave identically in every state.
+        The automaton internally works with these classes instead of its labels.
+
+        Returns:
+            List[CharClass]: Disjoint classes covering all characters.
+        """
+        return self._compile()[3]
+
+    def _compile(self) -> tuple:
+        return self._get_cached("compiled", self._compile_tables)
+
+    def _compile_tables(self) -> tuple:
+        """
+        Compresses the labels into equivalence classes of characters:
+            1. Boundaries of all label ranges split the code points into elementary intervals.
+            2. Intervals with the same next state in every state form one class.
+
+        Returns the interval starts, class of every interval, transition table
+        (class index -> next state index, -1 if there is no transition), the classes,
+        state names and indices of the final states.
+        """
+        states = self._get_sorted_states()
+        index = {state: i for i, state in enumerate(states)}
+
+        boundaries = {0}
+        for rules in self.transitions.values():
+            for label in rules:
+                for first, last in label.ranges:
+                    boundaries.update((first, last + 1))
+
+        starts = sorted(b for b in boundaries if b <= MAX_CODE_POINT)
+        signatures = [[-1] * len(states) for _ in starts]
+
+        for state, rules in self.transitions.items():
+            for label, state_to in rules.items():
+                for first, last in label.ranges:
+                    interval = bisect_right(starts, first) - 1
+
+                    while interval < len(starts) and starts[interval] <= last:
+                        signatures[interval][index[state]] = index[state_to]
+                        interval += 1
+
+        class_of_signature: Dict[Tuple[int, ...], int] = {}
+        interval_classes = [
+            class_of_signature.setdefault(tuple(signature), len(class_of_signature))
+            for signature in signatures
+        ]
+
+        class_ranges: List[List[CodeRange]] = [[] for _ in class_of_signature]
+        bounds = starts[1:] + [MAX_CODE_POINT + 1]
+        for start, end, class_index in zip(starts, bounds, interval_classes):
+            class_ranges[class_index].append((start, end - 1))
+
+        table = [[-1] * len(class_of_signature) for _ in states]
+        for signature, class_index in class_of_signature.items():
+            for state_index, next_index in enumerate(signature):
+                table[state_index][class_index] = next_index
+
+        finals = [state in self.final_states for state in states]
+        classes = [CharClass(ranges) for ranges in class_ranges]
+
+        return starts, interval_classes, table, classes, index, finals
+
+    def is_accepted(self, input_string: str) -> bool:
+        """
+        Checks whether the provided string is accepted by the automaton.
+
+        Args:
+            input_string (str): Input string to be tested.
+
+        Returns:
+            bool: True if word is accepted, False otherwise.
+        """
+        # the validity and the compiled tables are cached until the automaton changes
+        assert self._get_cached("is_valid", self.is_valid), "SymbolicDFA needs to be valid."
+
+        starts, interval_classes, table, _, index, finals = self._compile()
+        # character -> class lookup shared by all runs until the automaton changes
+        class_of: Dict[str, int] = self._get_cached("class_of", dict)
+        current = index[self.initial_state]
+
+        for char in input_string:
+            char_class = class_of.get(char)
+
+            if char_class is None:
+                char_class = interval_classes[bisect_right(starts, ord(char)) - 1]
+                class_of[char] = char_class
+
+            current = table[current][char_class]
+
+            if current < 0:
+                return False
+
+        return finals[current]
+
+    def to_dfa(self, alphabet: Iterable[str]) -> DFA:
+        """
+        Expands the automaton to a DFA over the provided finite alphabet.
+        Missing transitions lead to a new rejecting state 'sink' (or 'sink_1', ... if taken).
+
+        Args:
+            alphabet (Iterable[str]): Symbols of the new DFA.
+
+        Returns:
+            DFA: New total DFA accepting the same words over the alphabet.
+        """
+        alphabet = set(alphabet)
+        sink = next(
+            name
+            for name in ("sink" if i == 0 else f"sink_{i}" for i in range(len(self.states) + 1))
+            if name not in self.states
+        )
+        transitions: DFATransitions = {
+            state: {symbol: self.get_transition(state, symbol) or sink for symbol in alphabet}
+            for state in self.states
+        }
+
+        if any(sink in rules.values() for rules in transitions.values()):
+            transitions[sink] = {symbol: sink for symbol in alphabet}
+
+        return DFA(
+            states=set(transitions),
+            alphabet=alphabet,
+            initial_state=self.initial_state,
+            final_states=set(self.final_states),
+            transitions=transitions,
+        )
+
+    @classmethod
+    def from_dfa(cls, dfa: DFA) -> "SymbolicDFA":
+        """
+        Creates a symbolic DFA where symbols with the same next state are merged into one label.
+
+        Args:
+            dfa (DFA): Automaton to be converted.
+
+        Returns:
+            SymbolicDFA: New symbolic DFA accepting the same language.
+        """
+        transitions: SymbolicTransitions = {}
+
+        for state, rules in dfa.transitions.items():
+            by_target: Dict[str, List[str]] = {}
+            for symbol, state_to in rules.items():
+                by_target.setdefault(state_to, []).append(symbol)
+
+            transitions[state] = {
+                CharClass.of(symbols): state_to for state_to, symbols in by_target.items()
+            }
+
+        return cls(
+            states=set(dfa.states),
+            initial_state=dfa.initial_state,
+            final_states=set(dfa.final_states),
+            transitions=transitions,
+        )
+
+
+if __name__ == "__main__":
+    pass
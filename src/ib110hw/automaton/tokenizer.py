@@ -0,0 +1,174 @@
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from ._helpers import Configuration, LazyDFA
+from .dfa import DFA
+from .nfa import NFA
+
+Automaton = Union[DFA, NFA]
+
+
+class Token(NamedTuple):
+    """
+    Token found by the Tokenizer, 'value' is the input between the offsets 'start' and 'end'.
+    """
+
+    name: str
+    value: str
+    start: int
+    end: int
+
+
+class Tokenizer:
+    """
+    Splits input into tokens described by automata using the longest match.
+    If more token automata accept the longest match, the one listed first wins.
+
+    All automata are combined into one DFA whose states are sets of (rule index, state)
+    pairs tagged by the winning token name. The DFA is built lazily, only from the states
+    reached by the input. Configurations known to lead to no token from a position are
+    remembered, so the input is tokenized in linear time even when the longest match
+    needs to read ahead and backtrack.
+
+    Example:
+        tokenizer = Tokenizer([("number", number_dfa), ("space", space_nfa)])
+        list(tokenizer.tokenize("12 3"))
+        # [Token("number", "12", 0, 2), Token("space", " ", 2, 3), Token("number", "3", 3, 4)]
+    """
+
+    def __init__(self, rules: Iterable[Tuple[str, Automaton]]) -> None:
+        """
+        Args:
+            rules (Iterable[Tuple[str, Union[DFA, NFA]]]): (token name, automaton) pairs
+                ordered by their priority.
+        """
+        self.rules: List[Tuple[str, Automaton]] = list(rules)
+
+        for name, automaton in self.rules:
+            if automaton.initial_state not in automaton.states:
+                raise ValueError(f"Automaton of the token '{name}' has no valid initial state.")
+
+        # without useless states (e.g. sinks of total DFAs), the configurations get empty
+        # as soon as no token can be matched and the input is not read any further
+        automata = [automaton.trim() for _, automaton in self.rules]
+
+        initial_states = {
+            (index, automaton.initial_state) for index, automaton in enumerate(automata)
+        }
+        final_states = {
+            (index, state)
+            for index, automaton in enumerate(automata)
+            for state in automaton.final_states
+        }
+
+        def get_next(state: Tuple[int, str], symbol: str) -> Iterator[Tuple[int, str]]:
+            index, state_from = state
+            for state_to in automata[index]._get_next_states(state_from, symbol):
+                yield index, state_to
+
+        self._automaton = LazyDFA(initial_states, final_states, get_next)
+        self._names: Dict[Configuration, Optional[str]] = {}
+
+    def _get_token_name(self, configuration: Configuration) -> Optional[str]:
+        """Returns the name of the token with the highest priority accepted in the configuration."""
+        if configuration in self._names:
+            return self._names[configuration]
+
+        indices = [index for index, _ in configuration & self._automaton.final_states]
+        name = self._names[configuration] = self.rules[min(indices)][0] if indices else None
+
+        return name
+
+    def tokenize(self, text: str) -> Iterator[Token]:
+        """
+        Splits the text into tokens.
+
+        Args:
+            text (str): Input to be tokenized.
+
+        Raises:
+            ValueError: If no token matches the input at some position.
+
+        Yields:
+            Token: Found tokens in the order of the input.
+        """
+        return self.tokenize_stream([text])
+
+    def tokenize_stream(self, chunks: Iterable[str]) -> Iterator[Token]:
+        """
+        Splits the input into tokens, the input is read chunk by chunk when needed,
+        e.g. from an opened file. Only the unfinished token is kept in memory.
+
+        Args:
+            chunks (Iterable[str]): Parts of the input.
+
+        Raises:
+            ValueError: If no token matches the input at some position.
+
+        Yields:
+            Token: Found tokens in the order of the input, 'start' and 'end' are offsets
+                in the whole input.
+        """
+        chunks = iter(chunks)
+        buffer = ""
+        begin = 0  # start of the current token in the buffer
+        offset = 0  # start of the current token in the whole input
+        exhausted = False
+        # position -> configurations from which no token can be finished
+        failed: Dict[int, Set[Configuration]] = {}
+
+        while True:
+            configuration = self._automaton.start
+            position = begin
+            token: Optional[Tuple[str, int]] = None
+            visited: List[Tuple[Configuration, int]] = []
+
+            while configuration:
+                if position == len(buffer):
+                    chunk = None if exhausted else next(chunks, None)
+
+                    if chunk is None:
+                        exhausted = True
+                        break
+
+                    # drop the finished tokens from the buffer
+                    buffer = buffer[begin:] + chunk
+                    position -= begin
+                    token = token and (token[0], token[1] - begin)
+                    begin = 0
+                    continue
+
+                absolute = offset + position - begin
+                if configuration in failed.get(absolute, ()):
+                    break
+
+                visited.append((configuration, absolute))
+                configuration = self._automaton.next(configuration, buffer[position])
+                position += 1
+                name = self._get_token_name(configuration)
+
+                if name is not None:
+                    token = (name, position)
+                    visited.clear()
+
+            if token is None:
+                if begin == len(buffer) and exhausted:
+                    return
+
+                raise ValueError(f"No token matches the input at the position {offset}.")
+
+            for failed_configuration, failed_position in visited:
+                failed.setdefault(failed_position, set()).add(failed_configuration)
+
+            name, end = token
+            length = end - begin
+            yield Token(name, buffer[begin:end], offset, offset + length)
+
+            for consumed in range(offset, offset + length):
+                failed.pop(consumed, None)
+
+            begin = end
+            offset += length
+
+
+if __name__ == "__main__":
+    pass
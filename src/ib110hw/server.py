@@ -0,0 +1,341 @@
+import socket
+from argparse import ArgumentParser
+from hashlib import sha256
+from json import dumps, loads
+from socketserver import BaseServer, StreamRequestHandler, ThreadingTCPServer
+from threading import Lock
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    from socketserver import ThreadingUnixStreamServer
+except ImportError:  # Unix sockets are not available on Windows
+    ThreadingUnixStreamServer = None
+
+from .automaton.dfa import DFA
+from .automaton.learning import get_machine_oracle
+from .automaton.nfa import NFA
+from .turing._helpers import read_file
+from .turing.utils import import_dtm, import_mtm
+
+# path of a Unix socket, or a (host, port) pair
+Address = Union[str, Tuple[str, int]]
+Automaton = Union[DFA, NFA]
+
+
+class LoadedMachine(NamedTuple):
+    """
+    Machine kept in the memory of the server. 'accepts' answers a batch of inputs,
+    'lock' serializes the simulations of Turing machines which share their tapes
+    (finite automata are only read, so they have no lock).
+    """
+
+    kind: str
+    machine: Any
+    accepts: Callable[[List[str]], List[bool]]
+    lock: Optional[Lock] = None
+
+
+class MachineRegistry:
+    """
+    Loads machines once and answers the requests of the server. Finite automata are keyed
+    by their fingerprint (equivalent automata share one entry), Turing machines by
+    the hash of their definition file. DFAs are compiled by 'DFA.to_function' when loaded.
+
+    Requests and replies are dictionaries (JSON objects):
+        {"op": "load", "kind": "dfa" | "nfa", "definition": {...}} -> {"ok": true, "id": ...}
+        {"op": "load", "kind": "dtm" | "mtm", "path": ..., "max_steps": ...}
+            -> {"ok": true, "id": ...}
+        {"op": "accepts", "id": ..., "inputs": [...]} -> {"ok": true, "results": [true, ...]}
+        {"op": "simulate", "id": ..., "inputs": [...]}
+            -> {"ok": true, "results": [[true, tape], ...]}
+    Failed requests are answered by {"ok": false, "error": ...}.
+    """
+
+    def __init__(self) -> None:
+        self.machines: Dict[str, LoadedMachine] = {}
+        self._lock = Lock()
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answers one request, errors are reported in the reply."""
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "ValueError: The request has to be a JSON object."}
+
+        try:
+            operation = request.get("op")
+
+            if operation == "load":
+                return {"ok": True, "id": self.load(request)}
+            if operation == "accepts":
+                return {"ok": True, "results": self.accepts(request["id"], _get_inputs(request))}
+            if operation == "simulate":
+                return {"ok": True, "results": self.simulate(request["id"], _get_inputs(request))}
+
+            raise ValueError(f"Unknown operation '{operation}'.")
+        except (AssertionError, KeyError, OSError, TypeError, ValueError) as error:
+            return {"ok": False, "error": f"{type(error).__name__}: {error}"}
+
+    def load(self, request: Dict[str, Any]) -> str:
+        """Loads the machine unless it is already loaded and returns its id."""
+        kind = request.get("kind")
+
+        if kind in ("dfa", "nfa"):
+            automaton = _get_automaton(kind, request["definition"])
+
+            if not automaton.is_valid():
+                raise ValueError(f"The {kind.upper()} is not valid.")
+
+            key = automaton.fingerprint()
+            with self._lock:
+                if key not in self.machines:
+                    self.machines[key] = _get_loaded_automaton(kind, automaton)
+
+            return key
+
+        if kind in ("dtm", "mtm"):
+            path, max_steps = request["path"], request.get("max_steps")
+            definition = "\n".join([kind, str(max_steps), *read_file(path)])
+            key = sha256(definition.encode("utf-8")).hexdigest()
+
+            with self._lock:
+                if key not in self.machines:
+                    machine = import_dtm(path) if kind == "dtm" else import_mtm(path)
+
+                    if machine is None:
+                        raise ValueError(f"The {kind.upper()} in '{path}' is not valid.")
+                    if max_steps is not None:
+                        machine.max_steps = max_steps
+
+                    self.machines[key] = LoadedMachine(
+                        kind, machine, get_machine_oracle(machine), Lock()
+                    )
+
+            return key
+
+        raise ValueError(f"Unknown kind of machine '{kind}'.")
+
+    def _get_machine(self, key: str) -> LoadedMachine:
+        loaded = self.machines.get(key)
+
+        if loaded is None:
+            raise ValueError(f"Unknown machine '{key}', it has to be loaded first.")
+
+        return loaded
+
+    def accepts(self, key: str, inputs: List[str]) -> List[bool]:
+        """Returns whether the machine accepts the inputs."""
+        loaded = self._get_machine(key)
+
+        if loaded.lock is None:
+            return loaded.accepts(inputs)
+
+        with loaded.lock:
+            return loaded.accepts(inputs)
+
+    def simulate(self, key: str, inputs: List[str]) -> List[Tuple[bool, str]]:
+        """
+        Simulates the Turing machine on the inputs, returns the results with the final (first) tape.
+        """
+        loaded = self._get_machine(key)
+
+        if loaded.kind not in ("dtm", "mtm"):
+            raise ValueError("Only Turing machines can be simulated.")
+
+        results = []
+        with loaded.lock:
+            for input_str in inputs:
+                accepted = loaded.accepts([input_str])[0]
+                results.append((accepted, loaded.machine.read_tape()))
+
+        return results
+
+
+class _RequestHandler(StreamRequestHandler):
+    """Reads requests and writes replies as JSON lines until the client disconnects."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            try:
+                reply = self.server.registry.handle(loads(line))
+            except ValueError as error:  # also invalid JSON
+                reply = {"ok": False, "error": f"ValueError: {error}"}
+
+            self.wfile.write(dumps(reply).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _TCPServer(ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+if ThreadingUnixStreamServer is not None:
+
+    class _UnixServer(ThreadingUnixStreamServer):
+        daemon_threads = True
+
+
+def create_server(address: Address, registry: Optional[MachineRegistry] = None) -> BaseServer:
+    """
+    Creates a server answering requests of 'MachineRegistry' sent as JSON lines,
+    every client is served in its own thread. Call 'serve_forever' to start it.
+
+    Args:
+        address (Union[str, Tuple[str, int]]): Path of a Unix socket, or a (host, port) pair.
+        registry (MachineRegistry, optional): Loaded machines. Defaults to an empty registry.
+
+    Returns:
+        BaseServer: Server with the attribute 'registry'.
+    """
+    if isinstance(address, str):
+        if ThreadingUnixStreamServer is None:
+            raise ValueError("Unix sockets are not supported on this platform.")
+
+        server = _UnixServer(address, _RequestHandler)
+    else:
+        server = _TCPServer(address, _RequestHandler)
+
+    server.registry = registry if registry is not None else MachineRegistry()
+
+    return server
+
+
+class Client:
+    """
+    Connection to a running server, so that short-lived processes (e.g. grading jobs)
+    do not need to parse and compile the machines again.
+
+    Example:
+        with Client("/tmp/ib110hw.sock") as client:
+            key = client.load(reference_dfa)
+            client.accepts(key, ["ab", "ba"])  # [True, False]
+    """
+
+    def __init__(self, address: Address) -> None:
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self._socket = socket.socket(family, socket.SOCK_STREAM)
+        self._socket.connect(address)
+        self._file = self._socket.makefile("rwb")
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+        self._socket.close()
+
+    def request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sends the request and returns the reply.
+
+        Raises:
+            ValueError: If the server could not answer the request.
+        """
+        self._file.write(dumps(request).encode("utf-8") + b"\n")
+        self._file.flush()
+        reply = loads(self._file.readline())
+
+        if not reply["ok"]:
+            raise ValueError(reply["error"])
+
+        return reply
+
+    def load(self, automaton: Automaton) -> str:
+        """Loads the DFA or NFA and returns its id."""
+        kind = "dfa" if isinstance(automaton, DFA) else "nfa"
+        reply = self.request(
+            {"op": "load", "kind": kind, "definition": _get_definition(automaton)}
+        )
+        return reply["id"]
+
+    def load_file(self, path: str, kind: str = "dtm", max_steps: Optional[int] = None) -> str:
+        """Loads the DTM or MTM ('kind' is "dtm" or "mtm") from the file and returns its id."""
+        reply = self.request(
+            {"op": "load", "kind": kind, "path": path, "max_steps": max_steps}
+        )
+        return reply["id"]
+
+    def accepts(self, key: str, inputs: List[str]) -> List[bool]:
+        """Returns whether the loaded machine accepts the inputs."""
+        return self.request({"op": "accepts", "id": key, "inputs": inputs})["results"]
+
+    def simulate(self, key: str, inputs: List[str]) -> List[Tuple[bool, str]]:
+        """
+        Returns the results of the loaded Turing machine with the contents of its (first) tape.
+        """
+        results = self.request({"op": "simulate", "id": key, "inputs": inputs})["results"]
+        return [(accepted, tape) for accepted, tape in results]
+
+
+def _get_definition(automaton: Automaton) -> Dict[str, Any]:
+    """Returns the automaton as a JSON object, sets are stored as sorted lists."""
+    if isinstance(automaton, DFA):
+        transitions = {state: dict(rules) for state, rules in automaton.transitions.items()}
+    else:
+        transitions = {
+            state: {symbol: sorted(states_to) for symbol, states_to in rules.items()}
+            for state, rules in automaton.transitions.items()
+        }
+
+    return {
+        "states": sorted(automaton.states),
+        "alphabet": sorted(automaton.alphabet),
+        "initial_state": automaton.initial_state,
+        "final_states": sorted(automaton.final_states),
+        "transitions": transitions,
+    }
+
+
+def _get_automaton(kind: str, definition: Dict[str, Any]) -> Automaton:
+    transitions = definition.get("transitions", {})
+
+    if kind == "nfa":
+        transitions = {
+            state: {symbol: set(states_to) for symbol, states_to in rules.items()}
+            for state, rules in transitions.items()
+        }
+
+    return (DFA if kind == "dfa" else NFA)(
+        states=set(definition["states"]),
+        alphabet=set(definition["alphabet"]),
+        initial_state=definition["initial_state"],
+        final_states=set(definition["final_states"]),
+        transitions=transitions,
+    )
+
+
+def _get_inputs(request: Dict[str, Any]) -> List[str]:
+    inputs = request["inputs"]
+
+    # e.g. a string would be split into its characters, a number would fail in the simulation
+    if not isinstance(inputs, list) or not all(isinstance(item, str) for item in inputs):
+        raise TypeError("The inputs have to be a list of strings.")
+
+    return inputs
+
+
+def _get_loaded_automaton(kind: str, automaton: Automaton) -> LoadedMachine:
+    if kind == "dfa":
+        function = automaton.to_function()
+        return LoadedMachine(kind, automaton, lambda inputs: list(map(function, inputs)))
+
+    return LoadedMachine(kind, automaton, automaton.accepts_many)
+
+
+def _parse_address(address: str) -> Address:
+    host, separator, port = address.rpartition(":")
+    return (host or "localhost", int(port)) if separator else address
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Keeps automata and Turing machines loaded in memory.")
+    parser.add_argument("address", help="path of a Unix socket, or host:port")
+    arguments = parser.parse_args()
+
+    with create_server(_parse_address(arguments.address)) as running_server:
+        running_server.serve_forever()
@@ -21,12 +21,12 @@ def close_file(file: IO) -> None:
 # inspired by https://stackoverflow.com/a/43106497
 def get_step_direction() -> str:
     step_direction = None
-    print("Use arrow keys [L|R] to go back or forward. Press ESC to exit.")
+    print("Use arrow keys [L|R] to go back or forward, [U] to jump back. Press ESC to exit.")
 
     def on_press(key):
         nonlocal step_direction
         try:
-            if key.name in ["left", "right", "esc"]:
+            if key.name in ["left", "right", "up", "esc"]:
                 step_direction = key.name
                 return False
         except AttributeError:
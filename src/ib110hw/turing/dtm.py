@@ -1,8 +1,8 @@
-from copy import deepcopy
 from time import sleep
-from typing import Dict, Optional, Set, Tuple, List, IO
+from typing import Dict, Optional, Set, Tuple, IO
 
 from .base import BaseTuringMachine, MAX_STEPS_ERROR_MSG
+from .history import History
 from .tape import Direction, Tape, START_SYMBOL
 from ._helpers import dtm_config_to_md, clear_console, close_file, get_step_direction
 
@@ -82,6 +82,8 @@ class DTM(BaseTuringMachine):
         path: str = "simulation.md",
         delay: float = 0.5,
         step_by_step: bool = False,
+        jump: int = 100,
+        checkpoint_every: Optional[int] = None,
     ) -> bool:
         """
         Simulates the machine on its current tape configuration.
@@ -92,6 +94,9 @@ class DTM(BaseTuringMachine):
             path (str, optional): Path to the .md file with the step history. Defaults to "simulation.md".
             delay (float, optional): The delay (s) between each step when printing to console. Defaults to 0.5.
             step_by_step (bool, optional): Set to True if you want the simulation wait after each step. Defaults to False.
+            jump (int, optional): Number of steps the up arrow goes back in the step-by-step mode. Defaults to 100.
+            checkpoint_every (int, optional): Number of steps between snapshots of the tapes,
+                which make long jumps back faster. Defaults to None (steps are only undone).
 
         Returns:
             bool: False if the machine rejects the word or exceeds the 'max_steps' value, True otherwise.
@@ -101,11 +106,13 @@ class DTM(BaseTuringMachine):
         rule: Optional[DTMRule] = None
         output_file: Optional[IO] = open(path, "w") if to_file else None
 
-        # key pressed by user when the 'step_by_step' is enabled, can be <left|right|esc>
+        # key pressed by user when the 'step_by_step' is enabled, can be <left|right|up|esc>
         pressed_key: str = "right"
 
-        # remember the previous state and tape configuration to be able to go back and forth
-        prev_states: List[Tuple[str, Tape]] = []
+        # undo log of the steps to be able to go back, it is needed only in the step-by-step mode
+        history: Optional[History] = (
+            History([self.tape], checkpoint_every) if step_by_step else None
+        )
 
         def get_rule_string() -> str:
             """
@@ -135,22 +142,22 @@ class DTM(BaseTuringMachine):
             """
             Goes one step forward in the computation.
             """
-            nonlocal steps, rule, prev_states
+            nonlocal steps, rule
             rule = self.get_transition(state, self.tape.current.value)
-            prev_states.append((state, deepcopy(self.tape)))
             steps += 1
 
-        def go_back() -> None:
+        def go_back(count: int = 1) -> None:
             """
-            Goes one step back in the computation.
+            Goes 'count' steps back in the computation.
             Does nothing if there is no previous step.
             """
-            if not prev_states:
-                return
-
             nonlocal steps, state
-            steps -= 1
-            state, self.tape = prev_states.pop()
+            prev_steps = len(history)
+            prev_state = history.rewind(count)
+
+            if prev_state is not None:
+                steps -= prev_steps - len(history)
+                state = prev_state
 
         while steps <= (self.max_steps + 1):
             write_machine_configuration()
@@ -167,8 +174,8 @@ class DTM(BaseTuringMachine):
                 print("Canceled the computation.")
                 return False
 
-            if pressed_key == "left":
-                go_back()
+            if pressed_key in ("left", "up"):
+                go_back(1 if pressed_key == "left" else jump)
                 continue
 
             go_forward()
@@ -177,9 +184,15 @@ class DTM(BaseTuringMachine):
                 close_file(output_file)
                 return False
 
-            state, write, direction = rule
-            self.tape.write_symbol(write)
-            self.tape.move(direction)
+            next_state, write, direction = rule
+
+            if history is not None:
+                history.step(state, (write,), (direction,))
+            else:
+                self.tape.write_symbol(write)
+                self.tape.move(direction)
+
+            state = next_state
 
         close_file(output_file)
         print(MAX_STEPS_ERROR_MSG.format(self.max_steps))
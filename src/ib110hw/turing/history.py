@@ -0,0 +1,104 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .tape import ArrayTape, Direction, Tape
+
+AnyTape = Union[Tape, ArrayTape]
+# symbol overwritten by the step, direction of the move and whether the move created a cell
+TapeChange = Tuple[str, Direction, bool]
+HistoryEntry = Tuple[str, Tuple[TapeChange, ...]]
+
+
+class History:
+    """
+    Undo log of a simulation of a Turing machine, so that the simulation can go back
+    without copying the tapes in every step. Every step records the previous state and
+    the changes of the tapes, which are undone in the reverse order.
+
+    If 'checkpoint_every' is set, snapshots of the tapes are taken every 'checkpoint_every'
+    steps, so that going back many steps restores the nearest snapshot and undoes only
+    the steps after it.
+    """
+
+    def __init__(self, tapes: Sequence[AnyTape], checkpoint_every: Optional[int] = None) -> None:
+        """
+        Args:
+            tapes (Sequence[Union[Tape, ArrayTape]]): Tapes changed by the simulation.
+            checkpoint_every (int, optional): Number of steps between snapshots of the tapes.
+                Defaults to None (no snapshots).
+        """
+        self.tapes = tapes
+        self.checkpoint_every = checkpoint_every
+        self._log: List[HistoryEntry] = []
+        self._checkpoints: Dict[int, Tuple[str, List[Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._log)
+
+    def step(self, state: str, symbols: Sequence[str], directions: Sequence[Direction]) -> None:
+        """
+        Writes the symbols on the tapes, moves the heads and records the step.
+
+        Args:
+            state (str): State of the machine before the step.
+            symbols (Sequence[str]): Symbols to be written, one for each tape.
+            directions (Sequence[Direction]): Directions of the heads, one for each tape.
+        """
+        if self.checkpoint_every and len(self._log) % self.checkpoint_every == 0:
+            self._checkpoints[len(self._log)] = (
+                state,
+                [tape.get_snapshot() for tape in self.tapes],
+            )
+
+        changes = []
+        for tape, symbol, direction in zip(self.tapes, symbols, directions):
+            old_symbol = tape.current.value
+            tape.write_symbol(symbol)
+            changes.append((old_symbol, direction, tape.move(direction)))
+
+        self._log.append((state, tuple(changes)))
+
+    def rewind(self, count: int = 1) -> Optional[str]:
+        """
+        Undoes the last 'count' steps (or all of them if there are fewer).
+
+        Args:
+            count (int, optional): Number of steps to be undone. Defaults to 1.
+
+        Returns:
+            Optional[str]: State of the machine before the earliest undone step,
+                None if there was no step.
+        """
+        target = max(0, len(self._log) - count)
+
+        if target == len(self._log):
+            return None
+
+        state = None
+
+        if self.checkpoint_every:
+            # the nearest checkpoint which is not before the target
+            checkpoint = -(-target // self.checkpoint_every) * self.checkpoint_every
+
+            if checkpoint < len(self._log) and checkpoint in self._checkpoints:
+                state, snapshots = self._checkpoints[checkpoint]
+
+                for tape, snapshot in zip(self.tapes, snapshots):
+                    tape.restore(snapshot)
+
+                del self._log[checkpoint:]
+
+        while len(self._log) > target:
+            state, changes = self._log.pop()
+
+            for tape, (old_symbol, direction, created) in zip(self.tapes, changes):
+                tape.move_back(direction, created)
+                tape.current.value = old_symbol
+
+        for step in [step for step in self._checkpoints if step > target]:
+            del self._checkpoints[step]
+
+        return state
+
+
+if __name__ == "__main__":
+    pass
@@ -1,8 +1,8 @@
-from copy import deepcopy
 from time import sleep
 from typing import Dict, List, Optional, Set, Tuple, IO
 
 from .base import BaseTuringMachine, MAX_STEPS_ERROR_MSG
+from .history import History
 from .tape import Direction, Tape, START_SYMBOL
 from ._helpers import clear_console, close_file, mtm_config_to_md, get_step_direction
 
@@ -107,6 +107,8 @@ class MTM(BaseTuringMachine):
         path: str = "simulation.md",
         delay: float = 0.5,
         step_by_step: bool = False,
+        jump: int = 100,
+        checkpoint_every: Optional[int] = None,
     ) -> bool:
         """Simulates the machine on its current tape configuration.
 
@@ -116,6 +118,9 @@ class MTM(BaseTuringMachine):
             path (str, optional): Path to the .md file with the step history. Defaults to "simulation.md".
             delay (float, optional): The delay (s) between each step when printing to console. Defaults to 0.5.
             step_by_step (bool, optional): Set to True if you want the simulation wait after each step. Defaults to False.
+            jump (int, optional): Number of steps the up arrow goes back in the step-by-step mode. Defaults to 100.
+            checkpoint_every (int, optional): Number of steps between snapshots of the tapes,
+                which make long jumps back faster. Defaults to None (steps are only undone).
 
         Returns:
             bool: False if the machine rejects the word or exceeds the 'max_steps' value, True otherwise.
@@ -125,9 +130,11 @@ class MTM(BaseTuringMachine):
         rule: Optional[MTMRule] = None
         output_file: Optional[IO] = open(path, "w") if to_file else None
 
-        # key pressed by user when the 'step_by_step' is enabled, can be <left|right|esc>
+        # key pressed by user when the 'step_by_step' is enabled, can be <left|right|up|esc>
         pressed_key: str = "right"
-        prev_states: List[Tuple[str, List[Tape]]] = []
+
+        # undo log of the steps to be able to go back, it is needed only in the step-by-step mode
+        history: Optional[History] = History(self.tapes, checkpoint_every) if step_by_step else None
 
         def get_rule_string() -> str:
             """
@@ -160,16 +167,16 @@ class MTM(BaseTuringMachine):
         def go_forward() -> None:
             nonlocal rule, steps
             rule = self.get_transition(state, self.get_current_symbols())
-            prev_states.append((state, deepcopy(self.tapes)))
             steps += 1
 
-        def go_back() -> None:
-            if not prev_states:
-                return
-
+        def go_back(count: int = 1) -> None:
             nonlocal steps, state
-            steps -= 1
-            state, self.tapes = prev_states.pop()
+            prev_steps = len(history)
+            prev_state = history.rewind(count)
+
+            if prev_state is not None:
+                steps -= prev_steps - len(history)
+                state = prev_state
 
         while steps <= (self.max_steps + 1):
             write_machine_configuration()
@@ -186,8 +193,8 @@ class MTM(BaseTuringMachine):
                 print("Canceled the computation.")
                 return False
 
-            if pressed_key == "left":
-                go_back()
+            if pressed_key in ("left", "up"):
+                go_back(1 if pressed_key == "left" else jump)
                 continue
 
             go_forward()
@@ -196,10 +203,16 @@ class MTM(BaseTuringMachine):
                 close_file(output_file)
                 return False
 
-            state, write, directions = rule
-            for direction, tape, symbol in zip(directions, self.tapes, write):
-                tape.write_symbol(symbol)
-                tape.move(direction)
+            next_state, write, directions = rule
+
+            if history is not None:
+                history.step(state, write, directions)
+            else:
+                for direction, tape, symbol in zip(directions, self.tapes, write):
+                    tape.write_symbol(symbol)
+                    tape.move(direction)
+
+            state = next_state
 
         close_file(output_file)
         print(MAX_STEPS_ERROR_MSG.format(self.max_steps))
@@ -1,5 +1,6 @@
+from array import array
 from enum import Enum
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 START_SYMBOL = ">"
 EMPTY_SYMBOL = ""
@@ -33,58 +34,151 @@ class Cell:
         return self.value or " "
 
 
+def _render_cells(cells: List[str], head: int, cut_left: bool, cut_right: bool) -> str:
+    """
+    Renders the cells with the cursor '^' below the head,
+    cut parts of the tape are marked by '...'.
+    """
+    prefix = "... " if cut_left else ""
+
+    # ['a', 'b'] -> | a | b |
+    str_cells = f"{prefix}| {' | '.join(cells)} |{' ...' if cut_right else ''}\n"
+
+    # adds spaces to put the cursor '^' below the current cell
+    str_cursor = f"{' ' * (len(prefix) + 2 + head * 4)}^\n"
+
+    return str_cells + str_cursor
+
+
 class Tape:
-    """Represents Turing machine memory tape as a linked list."""
+    """
+    Represents Turing machine memory tape as a linked list.
+
+    Attributes:
+        window (int): Maximal number of cells shown on each side of the head
+            by the representation of the tape, the cut parts are replaced by '...'.
+    """
+
+    window: int = 30
 
     def __init__(self, start: Cell = None) -> None:
         self.start = start or Cell()
         self.current = self.start
 
     def __repr__(self) -> str:
-        curr_cell: Cell = self.start
+        # only the cells in the window around the head are visited
+        leftmost: Cell = self.current
+        left_count = 0
 
-        # find the leftmost cell
-        while curr_cell.left:
-            curr_cell = curr_cell.left
+        while leftmost.left and left_count < self.window:
+            leftmost = leftmost.left
+            left_count += 1
 
-        cells: List[Cell] = []
+        cells: List[str] = []
+        curr_cell: Optional[Cell] = leftmost
 
-        while curr_cell:
-            cells.append(curr_cell)
+        while curr_cell and len(cells) <= left_count + self.window:
+            cells.append(repr(curr_cell))
             curr_cell = curr_cell.right
 
-        # ['a', 'b'] -> | a | b |
-        str_cells = f"| {' | '.join([repr(c) for c in cells])} |\n"
-
-        # adds spaces to put the cursor '^' below the current cell
-        str_cursor = f"{' ' * (2 + cells.index(self.current) * 4)}^\n"
+        return _render_cells(cells, left_count, leftmost.left is not None, curr_cell is not None)
 
-        return str_cells + str_cursor
-
-    def move(self, direction: Direction) -> None:
+    def move(self, direction: Direction) -> bool:
         """Moves the tape cursor based on the provided direction.
 
         Args:
             direction (Direction): Specifies the move direction.
+
+        Returns:
+            bool: True if the move created a new cell, False otherwise.
         """
         if direction == Direction.LEFT:
-            self.move_left()
-        elif direction == Direction.RIGHT:
-            self.move_right()
+            return self.move_left()
+        if direction == Direction.RIGHT:
+            return self.move_right()
+
+        return False
 
-    def move_left(self):
+    def move_left(self) -> bool:
         """Moves the tape cursor to the left. (current will be current.left)"""
-        if not self.current.left:
+        created = not self.current.left
+
+        if created:
             self.current.left = Cell(right=self.current)
 
         self.current = self.current.left
+        return created
 
-    def move_right(self):
+    def move_right(self) -> bool:
         """Moves the tape cursor to the right. (current will be current.right)"""
-        if not self.current.right:
+        created = not self.current.right
+
+        if created:
             self.current.right = Cell(left=self.current)
 
         self.current = self.current.right
+        return created
+
+    def move_back(self, direction: Direction, remove_cell: bool = False) -> None:
+        """Undoes a move of the tape cursor in the provided direction.
+
+        Args:
+            direction (Direction): Direction of the undone move.
+            remove_cell (bool, optional): Set to True if the undone move created the cell.
+                Defaults to False.
+        """
+        if direction == Direction.LEFT:
+            self.current = self.current.right
+
+            if remove_cell:
+                self.current.left = None
+        elif direction == Direction.RIGHT:
+            self.current = self.current.left
+
+            if remove_cell:
+                self.current.right = None
+
+    def get_snapshot(self) -> Tuple[List[str], int, int]:
+        """
+        Returns the contents of the tape, which can be restored by 'restore'.
+
+        Returns:
+            Tuple[List[str], int, int]: Symbols from the leftmost cell, indices of the current
+                and start cells.
+        """
+        cell: Optional[Cell] = self.start
+
+        while cell.left:
+            cell = cell.left
+
+        symbols: List[str] = []
+        current = start = 0
+
+        while cell:
+            if cell is self.current:
+                current = len(symbols)
+            if cell is self.start:
+                start = len(symbols)
+
+            symbols.append(cell.value)
+            cell = cell.right
+
+        return symbols, current, start
+
+    def restore(self, snapshot: Tuple[List[str], int, int]) -> None:
+        """
+        Restores the contents of the tape returned by 'get_snapshot'.
+
+        Args:
+            snapshot (Tuple[List[str], int, int]): Snapshot of the tape.
+        """
+        symbols, current, start = snapshot
+        cells = [Cell(symbol) for symbol in symbols]
+
+        for left, right in zip(cells, cells[1:]):
+            left.right, right.left = right, left
+
+        self.current, self.start = cells[current], cells[start]
 
     def write(self, text: str) -> None:
         """Writes the provided text on the tape.
@@ -124,13 +218,210 @@ class Tape:
             str: Content written on the tape.
         """
         current = self.start
-        result = ""
+        result: List[str] = []
 
         while current.right:
-            result += current.value
+            result.append(current.value)
             current = current.right
 
-        return result
+        return "".join(result)
+
+
+class _CurrentCell:
+    """View of the cell under the head of an ArrayTape, it behaves like 'Tape.current'."""
+
+    __slots__ = ("_tape",)
+
+    def __init__(self, tape: "ArrayTape") -> None:
+        self._tape = tape
+
+    @property
+    def value(self) -> str:
+        tape = self._tape
+        return tape._symbols[tape._cells[tape._head]]
+
+    @value.setter
+    def value(self, symbol: str) -> None:
+        tape = self._tape
+        tape._cells[tape._head] = tape._get_code(symbol)
+
+    def __repr__(self):
+        return self.value or " "
+
+
+class ArrayTape:
+    """
+    Represents Turing machine memory tape as an array of symbol codes.
+
+    It can be used instead of 'Tape' (it has the same methods and representation),
+    e.g. DTM(..., tape=ArrayTape()). Every cell takes one byte (four bytes if there are
+    more than 256 different symbols) instead of a Cell object and moves of the head
+    do not allocate anything. The array grows in both directions, cells between '_first'
+    and '_last' are the cells visited so far, '_origin' is the index of the start cell.
+
+    Attributes:
+        window (int): Maximal number of cells shown on each side of the head
+            by the representation of the tape, the cut parts are replaced by '...'.
+    """
+
+    window: int = 30
+
+    def __init__(self) -> None:
+        # code 0 is the empty symbol
+        self._symbols: List[str] = [EMPTY_SYMBOL]
+        self._codes: Dict[str, int] = {EMPTY_SYMBOL: 0}
+        self.current = _CurrentCell(self)
+        self.clear()
+
+    def __repr__(self) -> str:
+        first = max(self._first, self._head - self.window)
+        last = min(self._last, self._head + self.window)
+        symbols = self._symbols
+        cells = [symbols[code] or " " for code in self._cells[first : last + 1]]
+
+        return _render_cells(cells, self._head - first, first > self._first, last < self._last)
+
+    def _get_code(self, symbol: str) -> int:
+        code = self._codes.get(symbol)
+
+        if code is None:
+            code = self._codes[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+
+            if code == 256:
+                self._cells = array("I", self._cells)
+
+        return code
+
+    def move(self, direction: Direction) -> bool:
+        """Moves the tape cursor based on the provided direction.
+
+        Args:
+            direction (Direction): Specifies the move direction.
+
+        Returns:
+            bool: True if the move created a new cell, False otherwise.
+        """
+        if direction is Direction.LEFT:
+            return self.move_left()
+        if direction is Direction.RIGHT:
+            return self.move_right()
+
+        return False
+
+    def move_left(self) -> bool:
+        """Moves the tape cursor to the left."""
+        created = self._head == self._first
+
+        if created:
+            if self._first == 0:
+                # doubles the array to the left, so that growing stays amortized O(1)
+                grow = len(self._cells)
+                self._cells[0:0] = array(self._cells.typecode, [0]) * grow
+                self._first += grow
+                self._last += grow
+                self._origin += grow
+                self._head += grow
+
+            self._first -= 1
+
+        self._head -= 1
+        return created
+
+    def move_right(self) -> bool:
+        """Moves the tape cursor to the right."""
+        created = self._head == self._last
+
+        if created:
+            if self._last == len(self._cells) - 1:
+                self._cells.extend(array(self._cells.typecode, [0]) * len(self._cells))
+
+            self._last += 1
+
+        self._head += 1
+        return created
+
+    def move_back(self, direction: Direction, remove_cell: bool = False) -> None:
+        """Undoes a move of the tape cursor in the provided direction.
+
+        Args:
+            direction (Direction): Direction of the undone move.
+            remove_cell (bool, optional): Set to True if the undone move created the cell.
+                Defaults to False.
+        """
+        if direction is Direction.STAY:
+            return
+
+        if remove_cell:
+            self._cells[self._head] = 0
+
+        if direction is Direction.LEFT:
+            self._head += 1
+            self._first += remove_cell
+        else:
+            self._head -= 1
+            self._last -= remove_cell
+
+    def get_snapshot(self) -> Tuple[array, int, int]:
+        """
+        Returns the contents of the tape, which can be restored by 'restore'.
+
+        Returns:
+            Tuple[array, int, int]: Codes of the cells, indices of the current and start cells.
+        """
+        first = self._first
+        return self._cells[first : self._last + 1], self._head - first, self._origin - first
+
+    def restore(self, snapshot: Tuple[array, int, int]) -> None:
+        """
+        Restores the contents of the tape returned by 'get_snapshot'.
+
+        Args:
+            snapshot (Tuple[array, int, int]): Snapshot of the tape.
+        """
+        cells, head, origin = snapshot
+        # the codes are kept, new symbols could have changed the type of the array since
+        self._cells = array(self._cells.typecode, cells)
+        self._first, self._last = 0, len(cells) - 1
+        self._head, self._origin = head, origin
+
+    def write(self, text: str) -> None:
+        """Writes the provided text on the tape.
+
+        Args:
+            text (str): Text to be written on the tape.
+        """
+        for symbol in text:
+            self.current.value = symbol
+            self.move_right()
+
+        self._head = self._origin
+
+    def write_symbol(self, symbol: str) -> None:
+        """Overwrites the current cell with the provided symbol.
+
+        Args:
+            symbol (str): Symbol to be written on the current cell.
+        """
+        if self._symbols[self._cells[self._head]] == START_SYMBOL:
+            return
+
+        self._cells[self._head] = self._get_code(symbol)
+
+    def clear(self) -> None:
+        """Clears the tape contents and places the cursor on the start."""
+        self._cells = array("B" if len(self._symbols) <= 256 else "I", [0]) * 16
+        self._first = self._last = self._origin = self._head = 0
+
+    def read(self) -> str:
+        """
+        Retrieves the content written on the tape.
+
+        Returns:
+            str: Content written on the tape.
+        """
+        symbols = self._symbols
+        return "".join(symbols[code] for code in self._cells[self._origin : self._last])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,60 @@
+from sys import path
+
+import pytest
+from hypothesis import given, settings
+from hypothesis.strategies import lists, text
+
+path.append("../src/ib110hw")
+
+from automaton.bank import DFABank
+from automaton.dfa import DFA
+
+pytest.importorskip("numpy")
+
+AUTOMATA = [
+    # words over {a, b} containing 'aa'
+    DFA(
+        states={"s0", "s1", "s2"},
+        alphabet={"a", "b"},
+        initial_state="s0",
+        final_states={"s2"},
+        transitions={
+            "s0": {"a": "s1", "b": "s0"},
+            "s1": {"a": "s2", "b": "s0"},
+            "s2": {"a": "s2", "b": "s2"},
+        },
+    ),
+    # words over {a, b} of even length
+    DFA(
+        states={"even", "odd"},
+        alphabet={"a", "b"},
+        initial_state="even",
+        final_states={"even"},
+        transitions={
+            "even": {"a": "odd", "b": "odd"},
+            "odd": {"a": "even", "b": "even"},
+        },
+    ),
+    # words 'c' and 'ac', transitions are partial
+    DFA.from_words(["ac", "c"]),
+    # no final states
+    DFA(states={"s"}, alphabet={"a"}, initial_state="s", transitions={"s": {"a": "s"}}),
+]
+
+
+@settings(deadline=None)
+@given(lists(text("abcd", max_size=8), max_size=10))
+def test_accepts_many(words) -> None:
+    bank = DFABank(AUTOMATA)
+    expected = [[automaton._is_accepted(word) for automaton in AUTOMATA] for word in words]
+
+    assert len(bank) == len(AUTOMATA)
+    assert bank.accepts_many(words) == expected
+    assert [bank.accepts(word) for word in words] == expected
+
+
+def test_empty_bank() -> None:
+    bank = DFABank([])
+
+    assert bank.accepts("ab") == []
+    assert bank.accepts_many(["", "ab"]) == [[], []]
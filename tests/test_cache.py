@@ -0,0 +1,75 @@
+from sys import path
+
+import pytest
+
+path.append("../src/ib110hw")
+
+from automaton.base import BaseFiniteAutomaton
+from automaton.cache import MISSING, MemoryCache, ResultCache, SQLiteCache
+from automaton.dfa import DFA
+from automaton.grading import grade_many
+from test_grading import REFERENCE, CORRECT_NFA, WRONG_DFA
+
+
+def test_memory_cache_lru() -> None:
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", None)
+
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    # 'b' was the least recently used one
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_sqlite_cache(tmp_path) -> None:
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    cache.set("key", {"counterexample": None})
+
+    assert cache.get("key") == {"counterexample": None}
+    assert cache.get("missing", None) is None
+
+    cache.close()
+    assert SQLiteCache(cache.path).get("key") == {"counterexample": None}
+
+
+def test_get_or_compute() -> None:
+    cache = MemoryCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute(REFERENCE, "test", compute) == 1
+    # equivalent automata share the result
+    assert cache.get_or_compute(CORRECT_NFA, "test", compute) == 1
+    assert cache.get_or_compute(WRONG_DFA, "test", compute) == 2
+
+
+def test_grade_many_cached(tmp_path) -> None:
+    submissions = [WRONG_DFA, CORRECT_NFA, WRONG_DFA.minimize(), DFA()]
+
+    for cache in [MemoryCache(), SQLiteCache(str(tmp_path / "cache.db"))]:
+        for workers in [1, 2]:
+            results = sorted(grade_many(REFERENCE, submissions, workers, cache=cache))
+
+            assert [r.equivalent for r in results] == [False, True, False, None]
+            assert results[0].counterexample == results[2].counterexample == "aa"
+
+
+def test_abstract_classes() -> None:
+    class IncompleteCache(ResultCache):
+        def get(self, key, default=MISSING):
+            return default
+
+    class IncompleteAutomaton(BaseFiniteAutomaton):
+        pass
+
+    # missing overrides fail when the object is created, not on the first call
+    for cls in (ResultCache, IncompleteCache, BaseFiniteAutomaton, IncompleteAutomaton):
+        with pytest.raises(TypeError):
+            cls()
@@ -1,12 +1,26 @@
 from sys import path
-from hypothesis import given, assume
-from hypothesis.strategies import integers, sets, characters, composite, DrawFn
+from hypothesis import given, assume, settings
+from hypothesis.strategies import (
+    integers,
+    sets,
+    characters,
+    composite,
+    DrawFn,
+    lists,
+    sampled_from,
+    text,
+    tuples,
+)
+from itertools import product
 from tests.generation import r_dfa
 from random import choice
+from io import StringIO
+import pytest
 
 path.append("../src/ib110hw")
 
-from automaton.dfa import DFA
+from automaton.budget import Budget, BudgetExceededError
+from automaton.dfa import DFA, FrozenDFA
 
 
 @composite
@@ -212,3 +226,448 @@ def test_is_valid() -> None:
     # empty states set
     automaton.states = set()
     assert not automaton.is_valid()
+
+
+@given(r_test_dfa())
+def test_minimize(automaton: DFA) -> None:
+    minimal = automaton.minimize()
+
+    assert minimal.is_valid()
+    assert len(minimal.states) <= len(automaton.states) + 1
+    assert minimal.is_equivalent(automaton)
+    # minimizing a minimal automaton yields the very same automaton
+    again = minimal.minimize()
+    assert again.states == minimal.states
+    assert again.final_states == minimal.final_states
+    assert again.transitions == minimal.transitions
+
+
+def test_get_counterexample() -> None:
+    # accepts words with an even number of 'a'
+    even_a: DFA = DFA(
+        states={"even", "odd"},
+        alphabet={"a", "b"},
+        initial_state="even",
+        final_states={"even"},
+        transitions={
+            "even": {"a": "odd", "b": "even"},
+            "odd": {"a": "even", "b": "odd"},
+        },
+    )
+    # the same language with redundant states
+    even_a_big: DFA = DFA(
+        states={"e1", "e2", "o1", "o2"},
+        alphabet={"a", "b"},
+        initial_state="e1",
+        final_states={"e1", "e2"},
+        transitions={
+            "e1": {"a": "o1", "b": "e2"},
+            "e2": {"a": "o2", "b": "e1"},
+            "o1": {"a": "e2", "b": "o2"},
+            "o2": {"a": "e1", "b": "o1"},
+        },
+    )
+
+    assert even_a.is_equivalent(even_a_big)
+    assert even_a.minimize().transitions == even_a_big.minimize().transitions
+
+    even_a_big.final_states.add("o2")
+    counterexample = even_a.get_counterexample(even_a_big)
+    assert counterexample == "ab"
+    assert even_a.is_accepted(counterexample) != even_a_big.is_accepted(counterexample)
+
+
+@given(r_test_dfa())
+def test_fingerprint(automaton: DFA) -> None:
+    fingerprint = automaton.fingerprint()
+
+    assert fingerprint == automaton.minimize().fingerprint()
+
+    automaton.complement()
+    assert automaton.fingerprint() != fingerprint
+
+
+def test_write_transitions() -> None:
+    automaton: DFA = DFA(
+        states={f"s{i:03}" for i in range(200)},
+        alphabet={"a", "b", "c"},
+        initial_state="s000",
+        final_states={"s001"},
+        transitions={
+            f"s{i:03}": {"a": f"s{(i + 1) % 200:03}", "b": "s000", "c": "s001"}
+            for i in range(200)
+        },
+    )
+    stream = StringIO()
+    automaton.write_transitions(stream, start=1, stop=3, symbols={"a"})
+
+    assert stream.getvalue().splitlines() == [
+        "     DFA      |    a    ",
+        "------------------------",
+        "<--  s001     |  s002   ",
+        "     s002     |  s003   ",
+    ]
+
+    # the default representation is truncated
+    rows = repr(automaton).splitlines()
+    assert len(rows) == 7 + automaton.REPR_MAX_ROWS + 1
+    assert "s199" not in repr(automaton)
+
+    # cached sorting is invalidated by changes
+    automaton.add_state("s", True)
+    assert "<--  s " in repr(automaton)
+
+
+@given(r_test_dfa())
+def test_trim(automaton: DFA) -> None:
+    automaton.add_state("unreachable", True)
+    automaton.add_transition("unreachable", automaton.initial_state, "a")
+    trimmed = automaton.trim()
+
+    assert "unreachable" not in trimmed.states
+    assert trimmed.is_equivalent(automaton)
+    assert trimmed.trim().states == trimmed.states
+    # cached until the automaton changes
+    assert automaton.trim() is trimmed
+    automaton.remove_state("unreachable")
+    assert automaton.trim() is not trimmed
+
+
+def test_finditer() -> None:
+    automaton: DFA = DFA(
+        states={"s", "a", "ab"},
+        alphabet={"a", "b", "x"},
+        initial_state="s",
+        final_states={"ab"},
+        transitions={"s": {"a": "a"}, "a": {"b": "ab"}, "ab": {"a": "a"}},
+    )
+
+    # matches of (ab)+ are the longest ones and do not overlap
+    assert list(automaton.finditer("xabxxababab")) == [(1, 3), (5, 11)]
+    assert list(automaton.finditer("aab?ab")) == [(1, 3), (4, 6)]
+    assert automaton.search("xxa") is None
+    assert automaton.search("ab") == (0, 2)
+
+    # empty matches are reported between the symbols
+    automaton.add_transition("s", "s", "x")
+    automaton.final_states.add("s")
+    assert list(automaton.finditer("xab")) == [(0, 3), (3, 3)]
+
+
+def test_from_words() -> None:
+    words = ["", "tap", "taps", "top", "top", "tops", "zap", "zaps"]
+    automaton = DFA.from_words(words)
+
+    for word in words + ["t", "ta", "tapss", "zop", "s"]:
+        assert automaton.is_accepted(word) == (word in words), word
+
+    # the suffixes 'ap(s)' and 'op(s)' are shared, the sink state is added
+    assert len(automaton.states) == 7
+    assert automaton.transitions == automaton.minimize().transitions
+    assert DFA.from_words(reversed(words), is_sorted=False).transitions == automaton.transitions
+
+    with pytest.raises(ValueError):
+        DFA.from_words(["b", "a"])
+
+
+def test_accepts_file(tmp_path) -> None:
+    # the number of 'a' minus the number of 'č' is divisible by 3
+    automaton: DFA = DFA(
+        states={"0", "1", "2"},
+        alphabet={"a", "b", "č"},
+        initial_state="0",
+        final_states={"0"},
+        transitions={
+            str(i): {"a": str((i + 1) % 3), "b": str(i), "č": str((i + 2) % 3)}
+            for i in range(3)
+        },
+    )
+    file = tmp_path / "input.txt"
+
+    for text in ["", "ab", "aaa", "ačb" * 1000, "čč" * 999 + "a", "ab" * 1000 + "x"]:
+        file.write_text(text, encoding="utf-8")
+
+        for workers in [1, 2, 7]:
+            assert automaton.accepts_file(str(file), workers) == automaton.is_accepted(text)
+
+
+def test_from_edges() -> None:
+    automaton = DFA.from_edges(
+        ["s0", "s0", "s1", "s1", "s0"],
+        ["a", "b", "a", "b", "a"],
+        ["s1", "s0", "s1", "s0", "s1"],
+        initial_state="s0",
+        final_states={"s1"},
+    )
+
+    assert automaton.is_valid()
+    assert automaton.states == {"s0", "s1"}
+    assert automaton.alphabet == {"a", "b"}
+    assert automaton.transitions == {"s0": {"a": "s1", "b": "s0"}, "s1": {"a": "s1", "b": "s0"}}
+
+    # numbered states are converted to strings
+    numbered = DFA.from_edges(range(3), "aaa", [1, 2, 0], initial_state="0", final_states={"0"})
+    assert numbered.is_accepted("aaa") and not numbered.is_accepted("aa")
+
+    # different lengths, conflicting transitions, ε-transition
+    for edges in [
+        (["s"], ["a", "b"], ["s"]),
+        (["s", "s"], ["a", "a"], ["s", "t"]),
+        (["s"], [""], ["s"]),
+    ]:
+        with pytest.raises(ValueError):
+            DFA.from_edges(*edges)
+
+    with pytest.raises(ValueError):
+        DFA.from_edges(["s"], ["a"], ["t"], states={"s"})
+
+
+def test_from_edges_numpy() -> None:
+    numpy = pytest.importorskip("numpy")
+    sources = numpy.arange(1000)
+    automaton = DFA.from_edges(
+        sources, numpy.full(1000, "a"), (sources + 1) % 1000, initial_state="0", final_states={"0"}
+    )
+
+    assert automaton.is_accepted("a" * 2000)
+    assert not automaton.is_accepted("a" * 999)
+
+
+def test_freeze() -> None:
+    automaton: DFA = DFA(
+        states={"s0", "s1", "unreachable"},
+        alphabet={"a"},
+        initial_state="s0",
+        final_states={"s1"},
+        transitions={"s0": {"a": "s1"}, "s1": {"a": "s0"}, "unreachable": {"a": "s0"}},
+    )
+    frozen = automaton.freeze()
+
+    assert isinstance(frozen, FrozenDFA)
+    assert frozen.freeze() is frozen
+    assert frozen.is_accepted("a") and not frozen.is_accepted("aa")
+
+    with pytest.raises(TypeError):
+        frozen.add_transition("s0", "s0", "b")
+    with pytest.raises(TypeError):
+        frozen.initial_state = "s1"
+    with pytest.raises(AttributeError):
+        frozen.final_states.add("s0")
+
+    # derived forms are frozen and computed once
+    assert isinstance(frozen.minimize(), FrozenDFA) and frozen.minimize() is frozen.minimize()
+    assert frozen.trim().states == {"s0", "s1"} and frozen.trim() is frozen.trim()
+    assert frozen.complement().final_states == {"s0", "unreachable"}
+    assert frozen.final_states == {"s1"}
+
+    # snapshots are not affected by changes of the automaton
+    automaton.add_transition("s0", "s0", "b")
+    assert automaton.freeze() is not frozen
+    assert frozen.get_transition("s0", "b") is None
+
+    # equal structure means equal hash
+    copy = DFA(
+        frozen.states, frozen.alphabet, "s0", frozen.final_states, dict(frozen.transitions)
+    ).freeze()
+    assert copy == frozen and hash(copy) == hash(frozen)
+    assert len({copy, frozen, automaton.freeze()}) == 2
+
+
+@given(r_test_dfa())
+def test_accepts_many_share_prefixes(automaton: DFA) -> None:
+    symbols = sorted(automaton.alphabet)
+    words = ["".join(choice(symbols) for _ in range(length)) for length in range(8)] * 3
+    words += [words[-1] + "\n", words[-1][:-2], ""]
+    expected = [automaton.is_accepted(word) for word in words]
+
+    assert automaton.accepts_many(words) == expected
+    assert automaton.accepts_many(words, share_prefixes=True) == expected
+
+
+@given(r_test_dfa())
+def test_to_function(automaton: DFA) -> None:
+    accepts = automaton.to_function()
+    symbols = sorted(automaton.alphabet) + ["\n"]
+
+    for length in range(6):
+        word = "".join(choice(symbols) for _ in range(length))
+        assert accepts(word) == automaton.is_accepted(word), word
+
+
+def test_to_function_source(tmp_path) -> None:
+    automaton: DFA = DFA(
+        states={"even", "odd"},
+        alphabet={"0", "1"},
+        initial_state="even",
+        final_states={"even"},
+        transitions={"even": {"0": "even", "1": "odd"}, "odd": {"0": "odd", "1": "even"}},
+    )
+    path = tmp_path / "parity.py"
+    accepts = automaton.to_function(str(path))
+
+    assert accepts("") and accepts("1001") and not accepts("10") and not accepts("11x")
+
+    # the written source defines the same function
+    namespace = {}
+    exec(path.read_text(encoding="utf-8"), namespace)
+    assert namespace["accepts"]("0110") and not namespace["accepts"]("0111")
+
+
+def _get_edit_distance(first: str, second: str) -> int:
+    row = list(range(len(second) + 1))
+
+    for i, first_symbol in enumerate(first, 1):
+        previous, row[0] = row[0], i
+
+        for j, second_symbol in enumerate(second, 1):
+            previous, row[j] = row[j], min(
+                row[j] + 1, row[j - 1] + 1, previous + (first_symbol != second_symbol)
+            )
+
+    return row[-1]
+
+
+@settings(max_examples=50, deadline=None)
+@given(text("abc", max_size=5), integers(min_value=0, max_value=2))
+def test_nearest_words(word: str, k: int) -> None:
+    # words over {a, b} with an even number of a's ending with 'b'
+    automaton: DFA = DFA(
+        states={"even", "odd", "end"},
+        alphabet={"a", "b"},
+        initial_state="even",
+        final_states={"end"},
+        transitions={
+            "even": {"a": "odd", "b": "end"},
+            "odd": {"a": "even", "b": "odd"},
+            "end": {"a": "odd", "b": "end"},
+        },
+    )
+    candidates = [
+        "".join(letters)
+        for length in range(len(word) + k + 1)
+        for letters in product("ab", repeat=length)
+    ]
+    distances = {
+        candidate: _get_edit_distance(word, candidate)
+        for candidate in candidates
+        if automaton.is_accepted(candidate)
+    }
+    distance = min(distances.values(), default=k + 1)
+    expected = (
+        sorted(found for found, found_distance in distances.items() if found_distance == distance)
+        if distance <= k
+        else []
+    )
+
+    assert automaton.accepts_within(word, k) == (distance <= k)
+    assert sorted(automaton.nearest_words(word, k)) == expected
+
+
+@settings(deadline=None)
+@given(
+    lists(lists(integers(0, 5), min_size=3, max_size=3), min_size=6, max_size=6),
+    sets(integers(0, 5)),
+    lists(tuples(sampled_from(["0", "1", "01", "2"]), integers(0, 12)), max_size=4),
+)
+def test_accepts_rle(table, finals, runs) -> None:
+    automaton: DFA = DFA(
+        states={f"q{i}" for i in range(6)},
+        alphabet={"0", "1", "2"},
+        initial_state="q0",
+        final_states={f"q{i}" for i in finals},
+        transitions={
+            f"q{i}": {symbol: f"q{j}" for symbol, j in zip("012", row)}
+            for i, row in enumerate(table)
+        },
+    )
+    expected = automaton.is_accepted("".join(string * count for string, count in runs))
+
+    assert automaton.accepts_rle(runs) == expected
+
+
+def test_accepts_rle_long_runs() -> None:
+    # number of a's divisible by 3 followed by b's
+    automaton: DFA = DFA(
+        states={"a0", "a1", "a2", "b", "dead"},
+        alphabet={"a", "b"},
+        initial_state="a0",
+        final_states={"a0", "b"},
+        transitions={
+            "a0": {"a": "a1", "b": "b"},
+            "a1": {"a": "a2", "b": "dead"},
+            "a2": {"a": "a0", "b": "dead"},
+            "b": {"a": "dead", "b": "b"},
+            "dead": {"a": "dead", "b": "dead"},
+        },
+    )
+
+    assert automaton.accepts_rle([("a", 3 * 10**9), ("b", 10**9)])
+    assert not automaton.accepts_rle([("a", 10**9), ("b", 10**9)])
+    assert automaton.accepts_rle([("aaa", 10**18), ("b", 0)])
+    assert automaton.accepts_rle([])
+
+    with pytest.raises(ValueError):
+        automaton.accepts_rle([("a", -1)])
+
+
+def test_get_memory_usage() -> None:
+    automaton = DFA.from_words(["ab", "abc", "b"])
+    usage = automaton.get_memory_usage()
+
+    assert set(usage) == {"states", "alphabet", "final_states", "transitions", "cache", "total"}
+    assert usage["total"] == sum(size for part, size in usage.items() if part != "total")
+    assert usage["transitions"] > 0
+
+    minimal = automaton.minimize()
+    assert automaton.get_memory_usage()["cache"] > usage["cache"]
+    assert minimal.get_memory_usage()["total"] > 0
+
+
+def test_budget() -> None:
+    automaton = DFA.from_words(["ab", "abc", "b"])
+    other = DFA.from_words(["ab", "abd", "b"])
+
+    with pytest.raises(BudgetExceededError) as error:
+        automaton.minimize(budget=Budget(timeout=-1))
+
+    assert error.value.operation == "minimization"
+
+    with pytest.raises(BudgetExceededError) as error:
+        automaton.get_counterexample(other, budget=Budget(max_states=2))
+
+    assert error.value.operation == "equivalence check"
+    assert error.value.resource == "states"
+    assert automaton.get_counterexample(other, budget=Budget(max_states=100)) == "abc"
+    assert not automaton.is_equivalent(other, budget=Budget(max_memory=10**6))
+
+
+def test_in_place_changes() -> None:
+    automaton = DFA(
+        states={"a", "b"},
+        alphabet={"x"},
+        initial_state="a",
+        final_states={"b"},
+        transitions={"a": {"x": "b"}, "b": {"x": "a"}},
+    )
+    fingerprint = automaton.fingerprint()
+    frozen = automaton.freeze()
+    assert not automaton.minimize().is_accepted("xx")
+
+    # changes made directly to the transitions need to invalidate the cached results
+    automaton.transitions["b"]["x"] = "b"
+    assert not automaton.minimize().is_accepted("xx")
+    automaton.invalidate()
+
+    assert automaton.is_accepted("xx") and automaton.minimize().is_accepted("xx")
+    assert automaton.trim().is_accepted("xx")
+    assert automaton.fingerprint() != fingerprint
+    assert automaton.freeze() != frozen
+    assert frozen.fingerprint() == fingerprint and not frozen.minimize().is_accepted("xx")
+
+    # methods and assigned attributes invalidate the cached results on their own
+    automaton.set_transition("b", "a", "x")
+    assert automaton.fingerprint() == fingerprint
+    trimmed = automaton.trim()
+    assert automaton.accepts_within("xxx", 0) and automaton.trim() is trimmed
+    automaton.final_states = {"a"}
+    assert automaton.trim() is not trimmed and automaton.minimize().is_accepted("")
@@ -0,0 +1,82 @@
+from sys import path
+
+path.append("../src/ib110hw")
+
+from automaton.dfa import DFA
+from automaton.nfa import NFA
+from automaton.grading import grade_many
+
+# accepts words over {a, b} containing 'aa'
+REFERENCE: DFA = DFA(
+    states={"s0", "s1", "s2"},
+    alphabet={"a", "b"},
+    initial_state="s0",
+    final_states={"s2"},
+    transitions={
+        "s0": {"a": "s1", "b": "s0"},
+        "s1": {"a": "s2", "b": "s0"},
+        "s2": {"a": "s2", "b": "s2"},
+    },
+)
+
+CORRECT_NFA: NFA = NFA(
+    states={"n0", "n1", "n2"},
+    alphabet={"a", "b"},
+    initial_state="n0",
+    final_states={"n2"},
+    transitions={
+        "n0": {"a": {"n0", "n1"}, "b": {"n0"}},
+        "n1": {"a": {"n2"}},
+        "n2": {"a": {"n2"}, "b": {"n2"}},
+    },
+)
+
+# accepts words containing 'ab' instead
+WRONG_DFA: DFA = DFA(
+    states={"s0", "s1", "s2"},
+    alphabet={"a", "b"},
+    initial_state="s0",
+    final_states={"s2"},
+    transitions={
+        "s0": {"a": "s1", "b": "s0"},
+        "s1": {"a": "s1", "b": "s2"},
+        "s2": {"a": "s2", "b": "s2"},
+    },
+)
+
+
+def check_results(workers: int) -> None:
+    submissions = [CORRECT_NFA, WRONG_DFA, DFA(), REFERENCE]
+    results = sorted(grade_many(REFERENCE, submissions, workers=workers, timeout=10))
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert results[0].equivalent and results[0].counterexample is None
+    assert results[1].equivalent is False and results[1].counterexample == "aa"
+    assert results[2].equivalent is None and results[2].error
+    assert results[3].equivalent
+
+
+def test_grade_many_serial() -> None:
+    check_results(workers=1)
+
+
+def test_grade_many_parallel() -> None:
+    check_results(workers=2)
+
+
+def test_grade_many_timeout() -> None:
+    (result,) = grade_many(REFERENCE, [CORRECT_NFA], workers=1, timeout=-1)
+
+    assert result.equivalent is None
+    assert result.error == "timeout"
+
+
+def test_grade_many_budget() -> None:
+    (result,) = grade_many(REFERENCE, [CORRECT_NFA], workers=1, max_states=2)
+
+    assert result.equivalent is None
+    assert result.error == "states limit exceeded"
+
+    (result,) = grade_many(REFERENCE, [CORRECT_NFA], workers=1, max_states=100, max_memory=10**6)
+
+    assert result.equivalent
@@ -0,0 +1,119 @@
+from hypothesis import given
+from hypothesis.strategies import booleans, integers, lists, one_of, sampled_from, tuples
+from itertools import chain, repeat
+from sys import path
+
+path.append("../src/ib110hw")
+import turing.dtm
+from turing.dtm import DTM
+from turing.history import History
+from turing.tape import ArrayTape, Direction, Tape
+
+STEPS = lists(
+    one_of(
+        tuples(sampled_from(["a", "b", "", ">"]), sampled_from(list(Direction))),
+        integers(1, 12),
+    ),
+    max_size=80,
+)
+
+
+def get_even_length_machine() -> DTM:
+    """Accepts words of even length, every symbol is replaced by 'X', then it goes back."""
+    machine = DTM(
+        states={"init", "even", "odd", "back", "accept", "reject"},
+        input_alphabet={"a", "b"},
+        transitions={
+            "init": {">": ("even", ">", Direction.RIGHT)},
+            "even": {
+                "a": ("odd", "X", Direction.RIGHT),
+                "b": ("odd", "X", Direction.RIGHT),
+                "": ("back", "", Direction.LEFT),
+            },
+            "odd": {
+                "a": ("even", "X", Direction.RIGHT),
+                "b": ("even", "X", Direction.RIGHT),
+                "": ("reject", "", Direction.STAY),
+            },
+            "back": {
+                "X": ("back", "X", Direction.LEFT),
+                ">": ("accept", ">", Direction.STAY),
+            },
+        },
+    )
+    machine.max_steps = 1000
+
+    return machine
+
+
+@given(STEPS, booleans(), sampled_from([None, 1, 5]))
+def test_rewind(steps, array_tapes: bool, checkpoint_every) -> None:
+    tapes = [ArrayTape(), ArrayTape()] if array_tapes else [Tape(), Tape()]
+    tapes[0].write(">ab")
+    history = History(tapes, checkpoint_every)
+
+    def get_configuration(state: str):
+        return state, [(repr(tape), tape.read(), tape.current.value) for tape in tapes]
+
+    configurations = []
+
+    for step in steps:
+        state = f"q{len(history)}"
+
+        if isinstance(step, int):
+            target = max(0, len(configurations) - step)
+            expected = configurations[target] if configurations else None
+            prev_state = history.rewind(step)
+
+            assert prev_state == (expected and expected[0])
+            assert len(history) == len(configurations[:target])
+
+            if expected:
+                assert get_configuration(prev_state) == expected
+
+            del configurations[len(history) :]
+        else:
+            symbol, direction = step
+            configurations.append(get_configuration(state))
+            opposite = Direction(-direction.value)
+            history.step(state, (symbol, symbol), (direction, opposite))
+
+
+def test_simulate_step_by_step(monkeypatch) -> None:
+    keys = chain(repeat("right", 30), ["up", "right", "left", "left"], repeat("right"))
+    monkeypatch.setattr(turing.dtm, "get_step_direction", lambda: next(keys))
+    monkeypatch.setattr(turing.dtm, "clear_console", lambda: None)
+
+    machine = get_even_length_machine()
+
+    machine.write_to_tape("ab" * 10)
+    assert machine.simulate(to_console=False, step_by_step=True, jump=10)
+    assert machine.read_tape() == ">" + "X" * 20
+    machine.clear_tape()
+
+    machine.write_to_tape("ab" * 10 + "a")
+    assert not machine.simulate(to_console=False, step_by_step=True, jump=10)
+
+
+def test_simulate_checkpoints(monkeypatch) -> None:
+    histories = []
+
+    class RecordedHistory(History):
+        def __init__(self, tapes, checkpoint_every=None) -> None:
+            super().__init__(tapes, checkpoint_every)
+            histories.append(self)
+
+    monkeypatch.setattr(turing.dtm, "History", RecordedHistory)
+    monkeypatch.setattr(turing.dtm, "get_step_direction", lambda: "right")
+    monkeypatch.setattr(turing.dtm, "clear_console", lambda: None)
+
+    # the tapes are saved only if it is requested, 'jump' does not matter
+    for checkpoint_every in [None, 5]:
+        machine = get_even_length_machine()
+        machine.write_to_tape("abba")
+        assert machine.simulate(
+            to_console=False, step_by_step=True, jump=10, checkpoint_every=checkpoint_every
+        )
+
+    assert [history.checkpoint_every for history in histories] == [None, 5]
+    assert not histories[0]._checkpoints and histories[1]._checkpoints
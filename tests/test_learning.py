@@ -0,0 +1,98 @@
+from sys import path
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+path.append("../src/ib110hw")
+
+from automaton.dfa import DFA
+from automaton.learning import (
+    MembershipCache,
+    get_bounded_equivalence_oracle,
+    get_machine_oracle,
+    learn_dfa,
+)
+from turing.dtm import DTM
+from turing.tape import Direction
+
+# words over {a, b} with the number of a's divisible by three ending with b
+TARGET: DFA = DFA(
+    states={"r0", "r1", "r2", "b0"},
+    alphabet={"a", "b"},
+    initial_state="r0",
+    final_states={"b0"},
+    transitions={
+        "r0": {"a": "r1", "b": "b0"},
+        "r1": {"a": "r2", "b": "r1"},
+        "r2": {"a": "r0", "b": "r2"},
+        "b0": {"a": "r1", "b": "b0"},
+    },
+)
+
+# words over {a, b} ending with a
+ENDS_WITH_A: DTM = DTM(
+    states={"init", "scan", "sawA", "accept", "reject"},
+    input_alphabet={"a", "b"},
+    acc_state="accept",
+    rej_state="reject",
+    initial_state="init",
+    transitions={
+        "init": {">": ("scan", ">", Direction.RIGHT)},
+        "scan": {
+            "a": ("sawA", "a", Direction.RIGHT),
+            "b": ("scan", "b", Direction.RIGHT),
+            "": ("reject", "", Direction.STAY),
+        },
+        "sawA": {
+            "a": ("sawA", "a", Direction.RIGHT),
+            "b": ("scan", "b", Direction.RIGHT),
+            "": ("accept", "", Direction.STAY),
+        },
+    },
+)
+
+
+def test_learn_dfa():
+    batches = []
+
+    def membership_oracle(words):
+        assert len(set(words)) == len(words)
+        batches.append(words)
+        return TARGET.accepts_many(words)
+
+    cache = MembershipCache(membership_oracle)
+    learned = learn_dfa(membership_oracle, TARGET.get_counterexample, "ab", cache)
+
+    assert learned.is_equivalent(TARGET)
+    assert len(learned.states) == len(TARGET.minimize().states)
+    assert cache.batches == len(batches)
+    assert cache.queries == sum(map(len, batches)) == len(cache)
+    assert all(cache.get(word) == TARGET.is_accepted(word) for batch in batches for word in batch)
+    assert cache.get("unknown") is None
+
+
+@settings(max_examples=30, deadline=None)
+@given(st.text("ab", max_size=10))
+def test_learn_dfa_single_word(word):
+    target = DFA.from_words([word])
+    learned = learn_dfa(target.accepts_many, target.get_counterexample, "ab")
+
+    assert learned.is_equivalent(target)
+
+
+def test_learn_dfa_machine():
+    membership_oracle = get_machine_oracle(ENDS_WITH_A)
+    learned = learn_dfa(
+        membership_oracle,
+        get_bounded_equivalence_oracle(membership_oracle, "ab", 5),
+        "ab",
+    )
+
+    assert len(learned.states) == 2
+    assert learned.accepts_many(["", "a", "ba", "ab", "bbbbbbba"]) == [
+        False,
+        True,
+        True,
+        False,
+        True,
+    ]
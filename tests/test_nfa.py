@@ -8,14 +8,18 @@ from hypothesis.strategies import (
     DrawFn,
     lists,
     sampled_from,
+    text,
 )
 from re import match
+import pytest
 from tests.generation import r_nfa
 from random import choice
 
 path.append("../src/ib110hw")
 
-from automaton.nfa import NFA
+from automaton.budget import Budget, BudgetExceededError
+from automaton.nfa import NFA, FrozenNFA
+from automaton.dfa import FrozenDFA
 
 
 @composite
@@ -244,3 +248,359 @@ def test_is_valid() -> None:
     # empty states set
     automaton.states = set()
     assert not automaton.is_valid()
+
+
+def test_determinize() -> None:
+    # words over {a, b} ending with 'ab', or the empty word through the ε-transition
+    automaton: NFA = NFA(
+        states={"s0", "s1", "s2", "s3"},
+        alphabet={"a", "b", ""},
+        initial_state="s3",
+        final_states={"s2"},
+        transitions={
+            "s3": {"": {"s0", "s2"}},
+            "s0": {"a": {"s0", "s1"}, "b": {"s0"}},
+            "s1": {"b": {"s2"}},
+        },
+    )
+    dfa = automaton.determinize()
+
+    assert dfa.is_valid()
+    assert dfa.initial_state == "{s0,s2,s3}"
+
+    for word in ["", "ab", "aab", "bab", "abab", "a", "b", "aba", "abb"]:
+        assert dfa.is_accepted(word) == automaton.is_accepted(word), word
+        assert automaton.is_accepted(word) == (word == "" or word.endswith("ab"))
+
+
+def test_determinize_name_collision() -> None:
+    # the subsets {"a,b"} and {"a", "b"} would both be named "{a,b}"
+    automaton: NFA = NFA(
+        states={"a,b", "a", "b"},
+        alphabet={"0", "1"},
+        initial_state="a,b",
+        final_states={"a,b"},
+        transitions={
+            "a,b": {"0": {"a", "b"}},
+            "a": {"0": {"a,b"}},
+            "b": {"1": {"b"}},
+        },
+    )
+    dfa = automaton.determinize()
+
+    assert dfa.is_valid()
+    assert dfa.states == {"{a,b}", "{a,b}#1", "{b}", "{}"}
+    assert dfa.initial_state == "{a,b}"
+    assert dfa.final_states == {"{a,b}"}
+
+    for word in ["", "0", "00", "000", "01", "011", "001", "0000"]:
+        assert dfa.is_accepted(word) == automaton.is_accepted(word), word
+
+
+def test_is_accepted_epsilon() -> None:
+    # ε-transitions are followed before the first symbol, between symbols and after the last one
+    automaton: NFA = NFA(
+        states={"s0", "s1", "s2", "s3"},
+        alphabet={"a", "b", ""},
+        initial_state="s0",
+        final_states={"s3"},
+        transitions={
+            "s0": {"": {"s1"}},
+            "s1": {"a": {"s2"}},
+            "s2": {"": {"s1", "s3"}, "b": {"s3"}},
+        },
+    )
+
+    for word in ["a", "aa", "aaa", "ab", "aab"]:
+        assert automaton.is_accepted(word), word
+
+    for word in ["", "b", "ba", "abb", "aba"]:
+        assert not automaton.is_accepted(word), word
+
+
+def test_trim() -> None:
+    automaton: NFA = NFA(
+        states={"s0", "s1", "s2", "dead", "unreachable"},
+        alphabet={"a", "b", ""},
+        initial_state="s0",
+        final_states={"s2", "unreachable"},
+        transitions={
+            "s0": {"a": {"s1", "dead"}, "": {"dead"}},
+            "s1": {"b": {"s2"}},
+            "dead": {"a": {"dead"}},
+            "unreachable": {"a": {"s0"}},
+        },
+    )
+    trimmed = automaton.trim()
+
+    assert trimmed.states == {"s0", "s1", "s2"}
+    assert trimmed.final_states == {"s2"}
+    assert trimmed.transitions == {"s0": {"a": {"s1"}}, "s1": {"b": {"s2"}}}
+    assert automaton.trim() is trimmed
+
+    # changing the result does not corrupt the cache
+    trimmed.add_state("new")
+    assert automaton.trim() is not trimmed
+    assert automaton.trim().states == {"s0", "s1", "s2"}
+
+
+def test_finditer() -> None:
+    # a | a+b
+    automaton: NFA = NFA(
+        states={"s", "p", "f"},
+        alphabet={"a", "b"},
+        initial_state="s",
+        final_states={"f"},
+        transitions={"s": {"a": {"p", "f"}}, "p": {"a": {"p"}, "b": {"f"}}},
+    )
+
+    assert list(automaton.finditer("aaab aa")) == [(0, 4), (5, 6), (6, 7)]
+    assert automaton.search("bbb") is None
+
+    # a* with empty matches
+    star: NFA = NFA({"s", "t"}, {"a", "b"}, "s", {"t"}, {"s": {"": {"t"}}, "t": {"a": {"t"}}})
+    assert list(star.finditer("baa")) == [(0, 0), (1, 3), (3, 3)]
+
+    for start, end in automaton.finditer("abaaabba"):
+        assert automaton.is_accepted("abaaabba"[start:end])
+
+    # leftmost-longest, not the earliest ending match: abcd | c
+    words = NFA.from_edges(
+        ["s", "1", "2", "3", "s"], list("abcdc"), ["1", "2", "3", "f", "f"], "s", {"f"}
+    )
+    assert list(words.finditer("abcd abc")) == [(0, 4), (7, 8)]
+
+
+@given(text(alphabet="ab", max_size=12))
+def test_finditer_leftmost_longest(text_to_search: str) -> None:
+    # a | a+b | bb
+    automaton: NFA = NFA(
+        states={"s", "p", "q", "f"},
+        alphabet={"a", "b"},
+        initial_state="s",
+        final_states={"f"},
+        transitions={
+            "s": {"a": {"p", "f"}, "b": {"q"}},
+            "p": {"a": {"p"}, "b": {"f"}},
+            "q": {"b": {"f"}},
+        },
+    )
+    expected, position = [], 0
+
+    while True:
+        spans = [
+            (start, end)
+            for start in range(position, len(text_to_search) + 1)
+            for end in range(start, len(text_to_search) + 1)
+            if automaton.is_accepted(text_to_search[start:end])
+        ]
+        if not spans:
+            break
+
+        start = min(spans)[0]
+        end = max(end for s, end in spans if s == start)
+        expected.append((start, end))
+        position = end if end > start else end + 1
+
+    assert list(automaton.finditer(text_to_search)) == expected
+
+
+class CountingText(str):
+    """Text counting the symbols read from it."""
+
+    reads = 0
+
+    def __getitem__(self, key):
+        CountingText.reads += 1
+        return super().__getitem__(key)
+
+
+def test_finditer_linear() -> None:
+    # a | a*b, every 'a' is a match, but a longer match ending by 'b' stays possible
+    automaton: NFA = NFA(
+        states={"s", "p", "f"},
+        alphabet={"a", "b", ""},
+        initial_state="s",
+        final_states={"f"},
+        transitions={"s": {"a": {"f"}, "": {"p"}}, "p": {"a": {"p"}, "b": {"f"}}},
+    )
+
+    for length in [1000, 8000]:
+        CountingText.reads = 0
+        matches = list(automaton.finditer(CountingText("a" * length)))
+
+        assert matches == [(i, i + 1) for i in range(length)]
+        # a quadratic search reads each suffix of the text again
+        assert CountingText.reads <= 4 * length
+
+
+def test_from_edges() -> None:
+    automaton = NFA.from_edges(
+        ["s0", "s0", "s0", "s1", "s1"],
+        ["a", "a", "", "b", "b"],
+        ["s0", "s1", "s1", "s2", "s2"],
+        initial_state="s0",
+        final_states={"s2"},
+    )
+
+    assert automaton.is_valid()
+    assert automaton.alphabet == {"a", "b", ""}
+    assert automaton.transitions == {
+        "s0": {"a": {"s0", "s1"}, "": {"s1"}},
+        "s1": {"b": {"s2"}},
+    }
+    assert automaton.is_accepted("aab") and not automaton.is_accepted("ba")
+
+    with pytest.raises(ValueError):
+        NFA.from_edges(["s0"], ["c"], ["s1"], alphabet={"a"})
+
+
+def test_freeze() -> None:
+    automaton: NFA = NFA(
+        states={"s0", "s1"},
+        alphabet={"a", ""},
+        initial_state="s0",
+        final_states={"s1"},
+        transitions={"s0": {"a": {"s0", "s1"}, "": {"s1"}}},
+    )
+    frozen = automaton.freeze()
+
+    assert isinstance(frozen, FrozenNFA)
+    assert frozen.is_accepted("") and frozen.is_accepted("aa")
+    assert isinstance(frozen.determinize(), FrozenDFA)
+    assert frozen.determinize() is frozen.determinize()
+    assert frozen.fingerprint() == automaton.fingerprint()
+
+    with pytest.raises(TypeError):
+        frozen.remove_transition("s0", "s1", "a")
+    with pytest.raises(AttributeError):
+        frozen.transitions["s0"]["a"].add("s2")
+
+    # the frozen automaton can be used as a dictionary key
+    assert {frozen: 1}[automaton.freeze()] == 1
+
+
+def test_accepts_many_share_prefixes() -> None:
+    # words ending with 'ab'
+    automaton: NFA = NFA(
+        states={"s", "a", "ab"},
+        alphabet={"a", "b"},
+        initial_state="s",
+        final_states={"ab"},
+        transitions={"s": {"a": {"s", "a"}, "b": {"s"}}, "a": {"b": {"ab"}}},
+    )
+    words = ["", "ab", "aab", "aaba", "ba", "bab", "abx", "ab", "babab", "a"]
+    expected = [automaton.is_accepted(word) for word in words]
+
+    assert automaton.accepts_many(words, share_prefixes=True) == expected
+    assert expected == [False, True, True, False, False, True, False, True, True, False]
+
+
+def test_accepts_many_vectorized() -> None:
+    pytest.importorskip("numpy")
+    # the third symbol from the end is 'a', ε-transitions skip the middle state
+    automaton: NFA = NFA(
+        states={"s0", "s1", "s2", "s3"},
+        alphabet={"a", "b", ""},
+        initial_state="s0",
+        final_states={"s3"},
+        transitions={
+            "s0": {"a": {"s0", "s1"}, "b": {"s0"}},
+            "s1": {"a": {"s2"}, "b": {"s2"}, "": {"s2"}},
+            "s2": {"a": {"s3"}, "b": {"s3"}},
+        },
+    )
+    words = ["", "a", "ab", "abb", "aab", "bbabb", "bab", "abx", "ba" * 20, "c"]
+    expected = [automaton.is_accepted(word) for word in words]
+
+    assert automaton.accepts_many(words, vectorized=True) == expected
+    assert automaton.accepts_many(words, vectorized=False) == expected
+    assert automaton.accepts_many([], vectorized=True) == []
+
+
+def test_combinators() -> None:
+    # words over {a, b} with an even number of a's, 'ab' as a single word
+    even: NFA = NFA(
+        states={"s0", "s1"},
+        alphabet={"a", "b"},
+        initial_state="s0",
+        final_states={"s0"},
+        transitions={"s0": {"a": {"s1"}, "b": {"s0"}}, "s1": {"a": {"s0"}, "b": {"s1"}}},
+    )
+    ab: NFA = NFA(
+        states={"s0", "s1", "s2"},
+        alphabet={"a", "b"},
+        initial_state="s0",
+        final_states={"s2"},
+        transitions={"s0": {"a": {"s1"}}, "s1": {"b": {"s2"}}},
+    )
+    words = ["", "a", "b", "ab", "ba", "aa", "abab", "aab", "abaa", "bab", "abba", "aabab"]
+
+    def is_even(word: str) -> bool:
+        return word.count("a") % 2 == 0
+
+    def is_ab_star(word: str) -> bool:
+        return word == "ab" * (len(word) // 2)
+
+    def is_concatenation(word: str) -> bool:
+        return any(is_even(word[:i]) and word[i:] == "ab" for i in range(len(word) + 1))
+
+    union = even.union(ab, ab)
+    concatenation = even.concatenation(ab)
+    star = ab.star()
+    reverse = ab.reverse()
+
+    for automaton in (union, concatenation, star, reverse):
+        assert automaton.is_valid()
+
+    for word in words:
+        assert union.is_accepted(word) == (is_even(word) or word == "ab"), word
+        assert concatenation.is_accepted(word) == is_concatenation(word), word
+        assert star.is_accepted(word) == is_ab_star(word), word
+        assert reverse.is_accepted(word) == (word == "ba"), word
+
+    # states are namespaced by the operand index, the operands do not change
+    assert union.states == {"init", "0:s0", "0:s1", "1:s0", "1:s1", "1:s2", "2:s0", "2:s1", "2:s2"}
+    assert ab.transitions == {"s0": {"a": {"s1"}}, "s1": {"b": {"s2"}}}
+    assert ab.freeze().star().is_accepted("abab")
+
+
+def test_determinize_budget() -> None:
+    # the 12th symbol from the end is 'a', the subset construction creates 2^12 subsets
+    automaton: NFA = NFA(
+        states={f"s{i}" for i in range(13)},
+        alphabet={"a", "b"},
+        initial_state="s0",
+        final_states={"s12"},
+        transitions={
+            "s0": {"a": {"s0", "s1"}, "b": {"s0"}},
+            **{f"s{i}": {"a": {f"s{i + 1}"}, "b": {f"s{i + 1}"}} for i in range(1, 12)},
+        },
+    )
+
+    with pytest.raises(BudgetExceededError) as error:
+        automaton.determinize(budget=Budget(max_states=100))
+
+    assert error.value.operation == "determinization"
+    assert error.value.resource == "states"
+    assert 100 < error.value.states <= 102
+
+    with pytest.raises(BudgetExceededError) as error:
+        automaton.determinize(budget=Budget(max_memory=10**5))
+
+    assert error.value.resource == "memory" and error.value.memory > 10**5
+
+    with pytest.raises(BudgetExceededError) as error:
+        automaton.determinize(budget=Budget(timeout=-1))
+
+    assert error.value.resource == "time"
+
+    dfa = automaton.determinize(budget=Budget(max_states=2**12))
+    assert len(dfa.states) == 2**12
+    # the result is cached, the budget of the construction does not matter any more
+    assert automaton.determinize(budget=Budget(max_states=1)) is dfa
+    assert automaton.get_memory_usage()["cache"] >= dfa.get_memory_usage()["total"]
+
+    frozen = automaton.freeze()
+    frozen_dfa = frozen.determinize(budget=Budget(max_states=2**12))
+    assert frozen.determinize(budget=Budget(max_states=1)) is frozen_dfa
@@ -0,0 +1,121 @@
+from sys import path
+
+import pytest
+
+path.append("../src/ib110hw")
+
+from automaton.dfa import DFA
+from automaton.nfa import NFA
+from automaton.profiling import profile, RunProfile
+
+
+def test_profile_dfa() -> None:
+    automaton: DFA = DFA(
+        states={"s0", "s1", "s2", "unused"},
+        alphabet={"a", "b"},
+        initial_state="s0",
+        final_states={"s1"},
+        transitions={
+            "s0": {"a": "s1", "b": "s2"},
+            "s1": {"a": "s1", "b": "s2"},
+            "s2": {"a": "s2", "b": "s2"},
+            "unused": {"a": "s0", "b": "s0"},
+        },
+    )
+
+    with profile(automaton) as stats:
+        assert automaton.is_accepted("aa")
+        assert automaton.accepts_many(["ab", "a", "", "ax"]) == [False, True, False, False]
+
+    assert "is_accepted" not in vars(automaton)
+    assert stats.runs == 5 and stats.accepted == 2
+    # 'ax' gets stuck at the position 1
+    assert stats.rejection_positions == {1: 1}
+    assert stats.symbols_processed == 6
+    assert stats.state_visits == {"s0": 5, "s1": 5, "s2": 1}
+    assert stats.get_hot_transitions(1) == [(("s0", "a"), 4)]
+    assert stats.get_dead_states(automaton) == {"unused"}
+    assert ("s2", "a") in stats.get_dead_transitions(automaton)
+
+
+def test_profile_nfa() -> None:
+    automaton: NFA = NFA(
+        states={"s0", "s1", "s2"},
+        alphabet={"a", "b", ""},
+        initial_state="s0",
+        final_states={"s2"},
+        transitions={
+            "s0": {"a": {"s0", "s1"}, "": {"s1"}},
+            "s1": {"b": {"s2"}},
+        },
+    )
+    words = ["b", "ab", "aab", "ba", "c", ""]
+    expected = automaton.accepts_many(words)
+    stats = RunProfile()
+
+    with profile(automaton, stats):
+        assert automaton.accepts_many(words) == expected
+
+    # options of the regular method are accepted, unknown ones are not
+    with profile(automaton) as other_stats:
+        assert automaton.accepts_many(words, share_prefixes=True, vectorized=False) == expected
+
+        with pytest.raises(TypeError):
+            automaton.accepts_many(words, unknown=True)
+
+    assert other_stats.runs == len(words)
+
+    with profile(automaton, stats):
+        automaton.is_accepted("ab")
+
+    assert stats.runs == len(words) + 1
+    assert stats.accepted == sum(expected) + 1
+    # 'ba' gets stuck at 1, 'c' at 0
+    assert stats.rejection_positions == {0: 1, 1: 1}
+    assert stats.transition_uses[("s1", "b")] == 5
+
+
+def test_profile_nested() -> None:
+    automaton: DFA = DFA(
+        states={"s0", "s1"},
+        alphabet={"a"},
+        initial_state="s0",
+        final_states={"s1"},
+        transitions={"s0": {"a": "s1"}, "s1": {"a": "s0"}},
+    )
+
+    with profile(automaton) as outer:
+        automaton.is_accepted("a")
+
+        with profile(automaton) as inner:
+            automaton.accepts_many(["a", "aa"])
+
+        automaton.is_accepted("aaa")
+
+    assert outer.runs == 2 and inner.runs == 2
+    assert "is_accepted" not in vars(automaton) and "accepts_many" not in vars(automaton)
+    assert automaton.accepts_many(["a", "aa"]) == [True, False]
+
+
+def test_profile_frozen() -> None:
+    automaton = DFA(
+        states={"s0", "s1"},
+        alphabet={"a"},
+        initial_state="s0",
+        final_states={"s1"},
+        transitions={"s0": {"a": "s1"}, "s1": {"a": "s0"}},
+    ).freeze()
+
+    with profile(automaton) as stats:
+        assert automaton.accepts_many(["a", "aa"]) == [True, False]
+
+    assert stats.runs == 2 and stats.state_visits == {"s0": 3, "s1": 2}
+    assert "accepts_many" not in vars(automaton)
+
+
+def test_profile_invalid() -> None:
+    automaton: NFA = NFA(states={"s0"}, alphabet={"a"}, initial_state="s1")
+
+    with profile(automaton):
+        with pytest.raises(AssertionError, match="NFA needs to be valid."):
+            automaton.accepts_many(["a"])
@@ -0,0 +1,128 @@
+from sys import path
+from threading import Thread
+
+import pytest
+
+path.append("../src")
+
+from ib110hw.automaton.dfa import DFA
+from ib110hw.automaton.nfa import NFA
+from ib110hw.server import Client, MachineRegistry, create_server
+from ib110hw.turing.utils import import_dtm
+
+# words over {a, b} containing 'aa'
+CONTAINS_AA: DFA = DFA(
+    states={"s0", "s1", "s2"},
+    alphabet={"a", "b"},
+    initial_state="s0",
+    final_states={"s2"},
+    transitions={
+        "s0": {"a": "s1", "b": "s0"},
+        "s1": {"a": "s2", "b": "s0"},
+        "s2": {"a": "s2", "b": "s2"},
+    },
+)
+CONTAINS_AA_NFA: NFA = NFA(
+    states={"n0", "n1", "n2"},
+    alphabet={"a", "b"},
+    initial_state="n0",
+    final_states={"n2"},
+    transitions={
+        "n0": {"a": {"n0", "n1"}, "b": {"n0"}},
+        "n1": {"a": {"n2"}},
+        "n2": {"a": {"n2"}, "b": {"n2"}},
+    },
+)
+WORDS = ["", "a", "aa", "bab", "baab", "abab", "bbaa", "c"]
+
+
+@pytest.fixture
+def address(tmp_path):
+    server = create_server(str(tmp_path / "server.sock"))
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server.server_address
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_automata(address) -> None:
+    expected = [CONTAINS_AA.is_accepted(word) for word in WORDS]
+
+    with Client(address) as client:
+        key = client.load(CONTAINS_AA)
+
+        assert client.accepts(key, WORDS) == expected
+        # equivalent automata share the loaded machine
+        assert client.load(CONTAINS_AA_NFA) == key
+
+    with Client(address) as client:
+        # the connection is kept after a request which is not a JSON object
+        with pytest.raises(ValueError):
+            client.request([1])
+
+        assert client.accepts(key, WORDS) == expected
+
+
+def test_turing_machines(address) -> None:
+    machine = import_dtm("inputs/dtm_input")
+    words = ["", "a", "ab", "aba", "abba", "abab"]
+    expected = []
+
+    for word in words:
+        machine.clear_tape()
+        machine.write_to_tape(word)
+        expected.append((machine.simulate(to_console=False), machine.read_tape()))
+
+    with Client(address) as client:
+        key = client.load_file("inputs/dtm_input", "dtm")
+
+        assert client.load_file("inputs/dtm_input", "dtm") == key
+        assert client.load_file("inputs/dtm_input", "dtm", max_steps=10) != key
+        assert client.simulate(key, words) == expected
+        assert client.accepts(key, words) == [accepted for accepted, _ in expected]
+
+
+def test_errors() -> None:
+    registry = MachineRegistry()
+
+    assert not registry.handle({"op": "accepts", "id": "missing", "inputs": []})["ok"]
+    assert not registry.handle({"op": "load", "kind": "dfa", "definition": {}})["ok"]
+    assert not registry.handle(
+        {"op": "load", "kind": "dtm", "path": "inputs/dtm_input_invalid_init"}
+    )["ok"]
+    assert not registry.handle({"op": "unknown"})["ok"]
+    # valid JSON which is not an object
+    assert not registry.handle([1])["ok"]
+    assert not registry.handle("accepts")["ok"]
+
+
+def test_invalid_inputs(address) -> None:
+    registry = MachineRegistry()
+    definition = {
+        "states": ["s0"],
+        "alphabet": ["a"],
+        "initial_state": "s0",
+        "final_states": ["s0"],
+        "transitions": {"s0": {"a": "s0"}},
+    }
+    key = registry.handle({"op": "load", "kind": "dfa", "definition": definition})["id"]
+
+    error = "TypeError: The inputs have to be a list of strings."
+
+    for inputs in [[1], [None], "aa", None, {"a": 1}]:
+        reply = registry.handle({"op": "accepts", "id": key, "inputs": inputs})
+        assert reply == {"ok": False, "error": error}
+
+    # the server answers and keeps serving the connection
+    with Client(address) as client:
+        key = client.load(CONTAINS_AA)
+
+        with pytest.raises(ValueError, match="list of strings"):
+            client.request({"op": "accepts", "id": key, "inputs": [1]})
+        with pytest.raises(ValueError, match="list of strings"):
+            client.request({"op": "accepts", "id": key, "inputs": "xx"})
+
+        assert client.accepts(key, ["aa", "b"]) == [True, False]
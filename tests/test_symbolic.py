@@ -0,0 +1,90 @@
+from sys import path
+from hypothesis import given
+from hypothesis.strategies import text, characters
+import pytest
+
+path.append("../src/ib110hw")
+
+from automaton.dfa import DFA
+from automaton.symbolic import CharClass, SymbolicDFA
+
+LETTER = CharClass.range("a", "z") | CharClass.range("A", "Z")
+DIGIT = CharClass.range("0", "9")
+
+# identifiers: a letter followed by letters, digits or underscores
+IDENTIFIER: SymbolicDFA = SymbolicDFA(
+    initial_state="start",
+    final_states={"ident"},
+    transitions={
+        "start": {LETTER: "ident"},
+        "ident": {LETTER | DIGIT | CharClass.of("_"): "ident"},
+    },
+)
+
+
+def test_char_class() -> None:
+    assert "q" in LETTER and "Q" in LETTER and "5" not in LETTER
+    assert len(LETTER) == 52
+    assert LETTER & CharClass.range("X", "b") == CharClass.of("XYZab")
+    assert "€" in ~LETTER and "a" not in ~LETTER
+    assert repr(DIGIT | CharClass.of("_")) == "[0-9_]"
+
+
+@given(text(characters(max_codepoint=0x2FF), max_size=10))
+def test_is_accepted(word: str) -> None:
+    expected = word.isascii() and word[:1].isalpha() and word.replace("_", "a").isalnum()
+    assert IDENTIFIER.is_accepted(word) == expected
+
+
+def test_symbol_classes() -> None:
+    classes = IDENTIFIER.get_symbol_classes()
+
+    # letters, digits with '_', everything else
+    assert len(classes) == 3
+    assert LETTER in classes and DIGIT | CharClass.of("_") in classes
+    assert sum(len(c) for c in classes) == 0x110000
+
+
+def test_to_dfa_and_back() -> None:
+    dfa = IDENTIFIER.to_dfa("ab1_")
+
+    assert dfa.is_accepted("a1_b") and not dfa.is_accepted("1a")
+    assert dfa.get_symbol_classes() == [{"1", "_"}, {"a", "b"}]
+
+    symbolic = SymbolicDFA.from_dfa(dfa)
+    assert symbolic.is_valid()
+    assert len(symbolic.transitions["ident"]) == 1
+    assert symbolic.is_accepted("ab_") and not symbolic.is_accepted("ac")
+
+
+def test_mutation() -> None:
+    automaton = SymbolicDFA(initial_state="s0", final_states={"s1"}, states={"s0", "s1"})
+
+    assert automaton.add_transition("s0", "s1", DIGIT)
+    assert not automaton.add_transition("s0", "s0", CharClass.range("5", "z"))
+    assert automaton.is_accepted("7") and not automaton.is_accepted("x")
+
+    assert automaton.add_transition("s0", "s0", "x")
+    assert automaton.is_accepted("xx7")
+    assert automaton.remove_transition("s0", "x")
+    assert not automaton.is_accepted("x7")
+
+
+def test_compiled_tables_cached() -> None:
+    automaton = SymbolicDFA(
+        initial_state="s0",
+        final_states={"s1"},
+        transitions={"s0": {DIGIT: "s1"}, "s1": {DIGIT: "s1"}},
+    )
+    assert automaton.is_accepted("12")
+    compiled = automaton._compile()
+
+    # the runs share the tables until the automaton changes
+    assert automaton.is_accepted("3") and automaton._compile() is compiled
+    assert automaton.add_transition("s1", "s0", "x")
+    assert automaton._compile() is not compiled
+    assert automaton.is_accepted("1x2") and not automaton.is_accepted("1x")
+    # the cached validity is dropped as well
+    assert automaton.remove_state("s0")
+    with pytest.raises(AssertionError):
+        automaton.is_accepted("1")
@@ -0,0 +1,110 @@
+from hypothesis import given
+from hypothesis.strategies import integers, lists, one_of, sampled_from, text, tuples
+from sys import path
+from typing import Optional
+
+path.append("../src/ib110hw")
+from turing.tape import ArrayTape, Direction, Tape
+from turing.dtm import DTM
+
+OPERATIONS = lists(
+    one_of(
+        tuples(sampled_from(["move"]), sampled_from(list(Direction))),
+        tuples(sampled_from(["write_symbol"]), sampled_from(["a", "b", "", ">", "X"])),
+        tuples(sampled_from(["write"]), text(alphabet="ab", max_size=5)),
+        tuples(sampled_from(["clear"])),
+    ),
+    max_size=60,
+)
+
+
+def get_even_length_machine(tape: Optional[Tape] = None) -> DTM:
+    """Accepts words of even length, every symbol is replaced by 'X', then it goes back."""
+    machine = DTM(
+        states={"init", "even", "odd", "back", "accept", "reject"},
+        input_alphabet={"a", "b"},
+        transitions={
+            "init": {">": ("even", ">", Direction.RIGHT)},
+            "even": {
+                "a": ("odd", "X", Direction.RIGHT),
+                "b": ("odd", "X", Direction.RIGHT),
+                "": ("back", "", Direction.LEFT),
+            },
+            "odd": {
+                "a": ("even", "X", Direction.RIGHT),
+                "b": ("even", "X", Direction.RIGHT),
+                "": ("reject", "", Direction.STAY),
+            },
+            "back": {
+                "X": ("back", "X", Direction.LEFT),
+                ">": ("accept", ">", Direction.STAY),
+            },
+        },
+        tape=tape,
+    )
+    machine.max_steps = 1000
+
+    return machine
+
+
+@given(text(alphabet="ab>", max_size=10), OPERATIONS, integers(0, 12))
+def test_array_tape(input_str: str, operations, window: int) -> None:
+    tape, array_tape = Tape(), ArrayTape()
+    tape.window = array_tape.window = window
+    tape.write(input_str)
+    array_tape.write(input_str)
+
+    for name, *args in operations:
+        getattr(tape, name)(*args)
+        getattr(array_tape, name)(*args)
+
+        assert array_tape.current.value == tape.current.value
+        assert array_tape.read() == tape.read()
+        assert repr(array_tape) == repr(tape)
+
+
+def test_array_tape_many_symbols() -> None:
+    tape = ArrayTape()
+    symbols = [chr(code) for code in range(0x100, 0x300)]
+    tape.write("".join(symbols))
+
+    assert tape.read() == "".join(symbols)
+
+    for _ in range(1000):
+        tape.move_left()
+
+    tape.write_symbol("a")
+    assert tape.current.value == "a"
+    assert tape.read() == "".join(symbols)
+
+
+def test_simulate_array_tape() -> None:
+    machine = get_even_length_machine(ArrayTape())
+
+    machine.write_to_tape("abba")
+    assert machine.simulate(to_console=False)
+    assert machine.read_tape() == ">XXXX"
+
+    machine.clear_tape()
+    machine.write_to_tape("abb")
+    assert not machine.simulate(to_console=False)
+
+
+def test_repr_window() -> None:
+    tape, array_tape = Tape(), ArrayTape()
+    tape.window = array_tape.window = 2
+
+    for t in (tape, array_tape):
+        t.write("abcdefg")
+        t.move_right()
+        t.move_right()
+        t.move_right()
+
+    assert repr(tape) == repr(array_tape) == "... | b | c | d | e | f | ...\n              ^\n"
+
+    for t in (tape, array_tape):
+        t.write_symbol("X")
+        t.move_left()
+        t.move_left()
+
+    assert repr(tape) == repr(array_tape) == "| a | b | c | X | ...\n      ^\n"
@@ -0,0 +1,117 @@
+from sys import path
+
+import pytest
+
+path.append("../src/ib110hw")
+
+from automaton.dfa import DFA
+from automaton.nfa import NFA
+from automaton.tokenizer import Token, Tokenizer
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+DIGITS = "0123456789"
+
+KEYWORD: NFA = NFA(
+    states={"s", "i", "if"},
+    alphabet={"i", "f"},
+    initial_state="s",
+    final_states={"if"},
+    transitions={"s": {"i": {"i"}}, "i": {"f": {"if"}}},
+)
+IDENTIFIER: DFA = DFA(
+    states={"s", "id"},
+    alphabet=set(LETTERS + DIGITS),
+    initial_state="s",
+    final_states={"id"},
+    transitions={
+        "s": {letter: "id" for letter in LETTERS},
+        "id": {symbol: "id" for symbol in LETTERS + DIGITS},
+    },
+)
+NUMBER: DFA = DFA(
+    states={"s", "n"},
+    alphabet=set(DIGITS),
+    initial_state="s",
+    final_states={"n"},
+    transitions={"s": {d: "n" for d in DIGITS}, "n": {d: "n" for d in DIGITS}},
+)
+SPACE: NFA = NFA(
+    states={"s", "sp"},
+    alphabet={" "},
+    initial_state="s",
+    final_states={"sp"},
+    transitions={"s": {" ": {"sp"}}, "sp": {" ": {"sp"}}},
+)
+
+
+def test_tokenize() -> None:
+    tokenizer = Tokenizer(
+        [("if", KEYWORD), ("identifier", IDENTIFIER), ("number", NUMBER), ("space", SPACE)]
+    )
+
+    # the longest match wins, the first rule wins among matches of the same length
+    assert [(t.name, t.value) for t in tokenizer.tokenize("if iff 12  x1")] == [
+        ("if", "if"),
+        ("space", " "),
+        ("identifier", "iff"),
+        ("space", " "),
+        ("number", "12"),
+        ("space", "  "),
+        ("identifier", "x1"),
+    ]
+    assert list(tokenizer.tokenize("")) == []
+
+    # tokens may span multiple chunks, offsets are counted in the whole input
+    assert list(tokenizer.tokenize_stream(["i", "f x", "y", "z 4", "2"])) == [
+        Token("if", "if", 0, 2),
+        Token("space", " ", 2, 3),
+        Token("identifier", "xyz", 3, 6),
+        Token("space", " ", 6, 7),
+        Token("number", "42", 7, 9),
+    ]
+
+    with pytest.raises(ValueError, match="position 3"):
+        list(tokenizer.tokenize("ab ?"))
+
+
+def test_tokenize_backtracking() -> None:
+    # a | a+b, the longest match has to read the whole input before backtracking
+    automaton: NFA = NFA(
+        states={"s", "p", "f"},
+        alphabet={"a", "b"},
+        initial_state="s",
+        final_states={"f"},
+        transitions={"s": {"a": {"p", "f"}}, "p": {"a": {"p"}, "b": {"f"}}},
+    )
+    tokenizer = Tokenizer([("token", automaton)])
+
+    assert [t.value for t in tokenizer.tokenize("aaab" + "a" * 5)] == ["aaab"] + ["a"] * 5
+    assert len(list(tokenizer.tokenize("a" * 10000))) == 10000
+
+
+def test_tokenize_stream_is_lazy() -> None:
+    # a total DFA, its sink must not keep the tokenizer reading
+    digit = DFA(
+        states={"s", "n", "sink"},
+        alphabet={"1", "+"},
+        initial_state="s",
+        final_states={"n"},
+        transitions={
+            "s": {"1": "n", "+": "sink"},
+            "n": {"1": "sink", "+": "sink"},
+            "sink": {"1": "sink", "+": "sink"},
+        },
+    )
+    plus = DFA({"s", "p"}, {"+"}, "s", {"p"}, {"s": {"+": "p"}})
+    read = []
+
+    def chunks():
+        for index in range(20000):
+            read.append(index)
+            yield "1+"
+
+    tokens = Tokenizer([("digit", digit), ("plus", plus)]).tokenize_stream(chunks())
+
+    assert next(tokens) == Token("digit", "1", 0, 1)
+    assert next(tokens) == Token("plus", "+", 1, 2)
+    assert len(read) <= 2